@@ -0,0 +1,108 @@
+"""
+Measures the decode time per item of every field type: `Item::from_monday_dictionary` (with the decode plan
+built from the board schema) against the generic column by column decoding it replaced.
+
+    python -m benchmarks.bench_fields --items 5000
+"""
+
+import argparse
+import time
+
+from contextlib import suppress
+from typing import Any, Callable, Dict, List
+
+from monday_item_parser.item import Item, ItemMeta
+from monday_item_parser.json_codec import get_json_codec
+
+from .helpers import SyntheticBoardTransport, declare_item_class, synthetic_items
+
+
+def generic_from_monday_dictionary(cls, data: Dict[str, Any]) -> Item:
+    """
+    The baseline: looks up the field of every column in the bidict inverse, checks
+    `__use_text_instead_of_value__` on the field and sets the attributes through `Item::__setattr__`
+    """
+
+    obj = cls()
+    obj._item_id = int(data["id"])
+    obj._item_name = data["name"]
+    obj._unsaved_item_name = None
+    obj._group_id = data["group"]["id"]
+    obj._group_title = data["group"]["title"]
+
+    loads = get_json_codec().loads
+
+    for column_data in data["column_values"]:
+        monday_id = column_data["id"]
+
+        if monday_id not in obj._monday_field_names.inverse:
+            continue
+
+        attribute_name = obj._monday_field_names.inverse[monday_id]
+
+        column_value = None
+        using_text = False
+
+        with suppress(AttributeError):
+            if getattr(obj, attribute_name).__use_text_instead_of_value__:
+                using_text = True
+                column_value = column_data.get("text") or None
+
+        if not using_text:
+            column_value = loads(column_data["value"]) if column_data.get("value") else None
+
+        field = getattr(obj, attribute_name)
+        field.from_monday_dict(column_value)
+
+        obj._backup_values[attribute_name] = field.copy_value(field.value)
+        field._dirty = False
+
+    return obj
+
+
+def time_per_item(decode: Callable[[Dict[str, Any]], Item], items: List[Dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in items:
+            decode(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(items)
+
+
+def bench_fields(items_count: int, repeat: int = 3) -> List[Dict[str, Any]]:
+    items = synthetic_items(items_count)
+    transport = SyntheticBoardTransport(items)
+    synthetic_item_class = declare_item_class(transport)
+
+    results = []
+    for field_name in synthetic_item_class._field_names:
+        field_class = type(getattr(synthetic_item_class, field_name))
+
+        # An item class with only this field, decoding the full synthetic items
+        item_class = ItemMeta(f"{field_class.__name__}Item", (Item,), {field_name: field_class}, transport=transport, board_id=1)
+
+        generic = time_per_item(lambda data: generic_from_monday_dictionary(item_class, data), items, repeat)
+        planned = time_per_item(item_class.from_monday_dictionary, items, repeat)
+        results.append({"field": field_class.__name__, "generic": generic, "planned": planned})
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'field':<20} {'generic (us/item)':>18} {'planned (us/item)':>18} {'speedup':>8}")
+    for result in bench_fields(args.items, args.repeat):
+        print(
+            f"{result['field']:<20} {result['generic'] * 1e6:>18.2f} {result['planned'] * 1e6:>18.2f} "
+            f"{result['generic'] / result['planned']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
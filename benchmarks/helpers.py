@@ -0,0 +1,200 @@
+"""
+Synthetic monday boards for the benchmarks, served by an in-memory transport so no API key is needed.
+"""
+
+import json
+import random
+import re
+
+from typing import Any, Dict, List
+
+from monday_item_parser.transport import Transport
+
+
+STATUS_SETTINGS = json.dumps({"labels": {"0": "Working on it", "1": "Done", "2": "Stuck", "3": "Waiting"}})
+
+COLUMNS = [
+    {"id": "status", "title": "Status Example", "type": "color", "settings_str": STATUS_SETTINGS},
+    {"id": "status_label", "title": "Status Label Example", "type": "color", "settings_str": STATUS_SETTINGS},
+    {"id": "date4", "title": "Date Example", "type": "date"},
+    {"id": "checkbox", "title": "Checkbox Example", "type": "boolean"},
+    {"id": "email", "title": "Email Example", "type": "email"},
+    {"id": "link", "title": "Link Example", "type": "link"},
+    {"id": "numbers", "title": "Numbers Example", "type": "numeric"},
+    {"id": "people", "title": "People Example", "type": "multiple-person"},
+    {"id": "tags", "title": "Tags Example", "type": "tag"},
+    {"id": "text", "title": "Text Example", "type": "text"},
+    {"id": "timeline", "title": "Timeline Example", "type": "timerange"},
+    {"id": "mirror", "title": "Mirror Example", "type": "lookup"},
+    {"id": "long_text", "title": "Long Text Example", "type": "long-text"},
+    {"id": "dropdown", "title": "Dropdown Example", "type": "dropdown"},
+    {"id": "dropdown_label", "title": "Dropdown Label Example", "type": "dropdown"},
+    {"id": "location", "title": "Location Example", "type": "location"},
+    {"id": "country", "title": "Country Example", "type": "country"},
+    {"id": "phone", "title": "Phone Example", "type": "phone"},
+]
+
+
+def synthetic_item(item_id: int, rng: random.Random) -> Dict[str, Any]:
+    day = "2023-{:02d}-{:02d}".format(rng.randint(1, 12), rng.randint(1, 28))
+    number = rng.randint(0, 10000)
+    label = rng.choice(["Done", "Working on it", "Stuck"])
+    country = rng.choice(["IL", "US", "GB", "FR"])
+
+    values = {
+        "status": ({"index": rng.randint(0, 3)}, label),
+        "status_label": ({"index": 1}, label),
+        "date4": ({"date": day, "time": "10:30:00"}, day),
+        "checkbox": ({"checked": True} if number % 2 else None, ""),
+        "email": ({"email": f"user{item_id}@example.com", "text": f"user{item_id}@example.com"}, ""),
+        "link": ({"url": "https://example.com", "text": "Example"}, ""),
+        "numbers": (str(number), str(number)),
+        "people": ({"personsAndTeams": [{"id": rng.randint(1, 50), "kind": "person"}]}, ""),
+        "tags": ({"tag_ids": [rng.randint(1, 20), rng.randint(21, 40)]}, ""),
+        "text": (f"Text {item_id}", f"Text {item_id}"),
+        "timeline": ({"from": day, "to": "2024-01-01"}, ""),
+        "mirror": (None, f"Mirror {number}"),
+        "long_text": ({"text": f"Long text {item_id}"}, f"Long text {item_id}"),
+        "dropdown": ({"ids": [rng.randint(1, 5)]}, ""),
+        "dropdown_label": (None, "First, Second"),
+        "location": (
+            {"address": "Central Park, New York", "lat": "40.78", "lng": "-73.96", "placeId": "abc"},
+            "Central Park, New York",
+        ),
+        "country": ({"countryCode": country, "countryName": country}, country),
+        "phone": ({"phone": f"0{number:09d}", "countryShortName": country}, f"0{number:09d}"),
+    }
+
+    return {
+        "id": str(item_id),
+        "name": f"Item {item_id}",
+        "group": {"id": "topics", "title": "Topics"},
+        "column_values": [
+            {"id": column_id, "value": json.dumps(value) if value is not None else None, "text": text}
+            for column_id, (value, text) in values.items()
+        ],
+    }
+
+
+def synthetic_items(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [synthetic_item(item_id, rng) for item_id in range(1, count + 1)]
+
+
+_VALUE_COLUMNS_PATTERN = re.compile(r"(?<!text_column_values: )column_values \(ids: (\[.*?\])\)")
+_TEXT_COLUMNS_PATTERN = re.compile(r"text_column_values: column_values \(ids: (\[.*?\])\)")
+
+
+def project_items(items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    """
+    Keep only the columns requested by a projected query (see `projected_item_fields`), the way monday does
+    """
+
+    value_ids = _VALUE_COLUMNS_PATTERN.search(query)
+    text_ids = _TEXT_COLUMNS_PATTERN.search(query)
+    if not value_ids and not text_ids:
+        return items
+
+    value_ids = set(json.loads(value_ids.group(1))) if value_ids else set()
+    text_ids = set(json.loads(text_ids.group(1))) if text_ids else set()
+
+    return [
+        {
+            "id": item["id"],
+            "name": item["name"],
+            "group": item["group"],
+            "column_values": [
+                {"id": column["id"], "value": column["value"]}
+                for column in item["column_values"]
+                if column["id"] in value_ids
+            ],
+            "text_column_values": [
+                {"id": column["id"], "text": column["text"]}
+                for column in item["column_values"]
+                if column["id"] in text_ids
+            ],
+        }
+        for item in items
+    ]
+
+
+class SyntheticBoardTransport(Transport):
+    """
+    Answers the queries sent by `Item` from a synthetic board held in memory
+    """
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        if "columns {" in query and "column_values" not in query:
+            return {"data": {"boards": [{"columns": COLUMNS}]}}
+
+        item_ids = re.search(r"items \(ids: \[(.*?)\]", query)
+        if item_ids:
+            item_ids = {item_id.strip() for item_id in item_ids.group(1).split(",")}
+            items = [item for item in self.items if item["id"] in item_ids]
+            return {"data": {"items": [{"board": {"id": "1"}, **item} for item in project_items(items, query)]}}
+
+        limit = re.search(r"limit: (\d+)", query)
+        limit = int(limit.group(1)) if limit else len(self.items)
+        cursor = re.search(r'cursor: "(\d+)"', query)
+        start = int(cursor.group(1)) if cursor else 0
+        end = start + limit
+        page = {
+            "cursor": str(end) if end < len(self.items) else None,
+            "items": project_items(self.items[start:end], query),
+        }
+
+        if "next_items_page" in query:
+            return {"data": {"next_items_page": page}}
+        elif "items_page" in query:
+            return {"data": {"boards": [{"items_page": page}]}}
+
+        return {"data": {"boards": [{"items": project_items(self.items, query)}]}}
+
+
+def declare_item_class(transport: Transport):
+    from monday_item_parser import (
+        Item,
+        CheckboxField,
+        CountryField,
+        DateField,
+        DropdownField,
+        DropdownLabelField,
+        EmailField,
+        LinkField,
+        LocationField,
+        LongTextField,
+        MirrorField,
+        NumberField,
+        PeopleField,
+        PhoneField,
+        StatusField,
+        StatusLabelField,
+        TagsField,
+        TextField,
+        TimelineField,
+    )
+
+    class SyntheticItem(Item, transport=transport, board_id=1):
+        status_example = StatusField
+        status_label_example = StatusLabelField
+        date_example = DateField
+        checkbox_example = CheckboxField
+        email_example = EmailField
+        link_example = LinkField
+        numbers_example = NumberField
+        people_example = PeopleField
+        tags_example = TagsField
+        text_example = TextField
+        timeline_example = TimelineField
+        mirror_example = MirrorField
+        long_text_example = LongTextField
+        dropdown_example = DropdownField
+        dropdown_label_example = DropdownLabelField
+        location_example = LocationField
+        country_example = CountryField
+        phone_example = PhoneField
+
+    return SyntheticItem
@@ -0,0 +1,218 @@
+"""
+Measures the hot paths of `Item` on synthetic boards with every field type: items per second and the peak memory
+(traced with tracemalloc, in a separate run) of every benchmark, for every board size.
+
+    python -m benchmarks.suite --items 1000 10000 100000 --output results.json
+
+    # Compare to the results of another version (exits with 1 on a regression)
+    python -m benchmarks.suite --compare results.json
+
+    # Label the results (the library version by default)
+    python -m benchmarks.suite --label my-branch --output results.json
+
+Benchmarks:
+    decode          `Item::from_monday_dictionary`
+    decode_columns  `Item::decode_columns`
+    init            `Item::__init__` (a new item with a field value)
+    encode          `Item::_create_column_values` (`to_monday_dict` of every field)
+    diff            `Item::_changed_fields` (after changing every other item)
+    str             `Item::__str__`
+"""
+
+import argparse
+import importlib.metadata
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Optional
+
+from monday_item_parser.json_codec import JsonCodec, get_json_codec, set_json_codec
+
+from .helpers import SyntheticBoardTransport, declare_item_class, synthetic_items
+
+
+# A benchmark prepares its input from the item class and the raw items, and returns the run to measure
+# (the run may be repeated, so it must not change its input)
+Benchmark = Callable[[Any, List[Dict[str, Any]]], Callable[[], Any]]
+
+
+def _decoded(item_class, items: List[Dict[str, Any]]) -> list:
+    return [item_class.from_monday_dictionary(data) for data in items]
+
+
+def bench_decode(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    return lambda: [item_class.from_monday_dictionary(data) for data in items]
+
+
+def bench_decode_columns(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    return lambda: item_class.decode_columns([items])
+
+
+def bench_init(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    return lambda: [item_class(numbers_example=index) for index in range(len(items))]
+
+
+def bench_encode(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    # Copies of the fetched items, which are new items to create
+    new_items = [item._duplicate() for item in _decoded(item_class, items)]
+    return lambda: [item._create_column_values() for item in new_items]
+
+
+def bench_diff(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    decoded = _decoded(item_class, items)
+    for item in decoded[::2]:
+        item.numbers_example = (item.numbers_example.value or 0) + 1
+
+    return lambda: [list(item._changed_fields) for item in decoded]
+
+
+def bench_str(item_class, items: List[Dict[str, Any]]) -> Callable[[], Any]:
+    decoded = _decoded(item_class, items)
+    return lambda: [str(item) for item in decoded]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "decode": bench_decode,
+    "decode_columns": bench_decode_columns,
+    "init": bench_init,
+    "encode": bench_encode,
+    "diff": bench_diff,
+    "str": bench_str,
+}
+
+
+def measure(benchmark: Benchmark, item_class, items: List[Dict[str, Any]], repeat: int) -> Dict[str, float]:
+    """
+    :return: The items per second of the best run, and the peak memory (in bytes) allocated by a run
+    """
+
+    # The runs don't change their input, so it's prepared once
+    run = benchmark(item_class, items)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    # Traced apart from the timed runs, tracemalloc slows the allocations down
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"items_per_second": len(items) / best, "peak_memory": peak}
+
+
+def library_version() -> str:
+    """
+    :return: The installed version of the library, or the version in the pyproject.toml of the checkout
+    """
+
+    try:
+        return importlib.metadata.version("monday-item-parser")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    try:
+        with open(os.path.join(os.path.dirname(__file__), os.pardir, "pyproject.toml")) as file:
+            version = re.search(r'^version = "(.*)"', file.read(), re.MULTILINE)
+    except OSError:
+        version = None
+
+    return version.group(1) if version else "unknown"
+
+
+def run_suite(sizes: List[int], names: List[str], repeat: int = 3, label: Optional[str] = None) -> Dict[str, Any]:
+    results = []
+
+    for size in sizes:
+        items = synthetic_items(size)
+        item_class = declare_item_class(SyntheticBoardTransport(items))
+
+        for name in names:
+            results.append({"benchmark": name, "items": size, **measure(BENCHMARKS[name], item_class, items, repeat)})
+
+    return {
+        "version": label or library_version(),
+        "python": platform.python_version(),
+        "json_codec": type(get_json_codec()).__name__,
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print the change of every result from the baseline
+
+    :return: The regressions, results that are slower than the baseline by more than the threshold (a fraction)
+    """
+
+    baseline_results = {(result["benchmark"], result["items"]): result for result in baseline["results"]}
+    regressions = []
+
+    print(f"\ncompared to {baseline.get('version')} (python {baseline.get('python')}, {baseline.get('json_codec')}):")
+    for result in results["results"]:
+        key = (result["benchmark"], result["items"])
+        if key not in baseline_results:
+            continue
+
+        speed = result["items_per_second"] / baseline_results[key]["items_per_second"] - 1
+        memory = result["peak_memory"] / max(baseline_results[key]["peak_memory"], 1) - 1
+        regressed = speed < -threshold
+
+        print(f"{key[0]:<16} {key[1]:>8} {speed:>+9.1%} items/s {memory:>+9.1%} memory{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(f"{key[0]} ({key[1]} items)")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000], help="The board sizes to measure")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help="The timed runs of every benchmark (the best one counts)")
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare the results to the results saved in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="The slowdown that counts as a regression")
+    parser.add_argument("--label", help="The version saved with the results (the library version by default)")
+    parser.add_argument("--stdlib-json", action="store_true", help="Decode with the standard library json module")
+    args = parser.parse_args(argv)
+
+    if args.stdlib_json:
+        set_json_codec(JsonCodec())
+
+    results = run_suite(args.items, args.benchmarks, args.repeat, args.label)
+
+    print(f"{'benchmark':<16} {'items':>8} {'items/s':>14} {'peak memory (MB)':>17}")
+    for result in results["results"]:
+        print(
+            f"{result['benchmark']:<16} {result['items']:>8} {result['items_per_second']:>14,.0f} "
+            f"{result['peak_memory'] / 2 ** 20:>17.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+        if regressions:
+            print(f"\nregressions: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
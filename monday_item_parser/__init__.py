@@ -1,4 +1,14 @@
 from .item import Item
+from .async_client import AsyncMondayClient
+from .async_item import AsyncItem
+from .complexity import ComplexityScheduler
+from .schema_cache import BoardSchemaCache
+from .session import Session
+from .json_codec import JsonCodec, set_json_codec
+from .item_cache import ItemCache, KeyValueItemCache, LRUItemCache
+from .local_mirror import LocalMirror
+from .collection import ItemCollection
+from .transport import HTTPTransport, MondayClientTransport, RecordingTransport, ReplayTransport, Transport
 from .exceptions import *
 from .fields import __all__ as _fields_all
 from .fields import *
@@ -6,5 +16,5 @@ from .fields import *
 
 field_updated_hook = Item.field_updated_hook
 
-__all__ = ["Item", "MondayClientError", "field_updated_hook", *_fields_all]
+__all__ = ["Item", "AsyncItem", "AsyncMondayClient", "BoardSchemaCache", "ComplexityScheduler", "HTTPTransport", "ItemCache", "ItemCollection", "JsonCodec", "KeyValueItemCache", "LocalMirror", "LRUItemCache", "MondayClientTransport", "RecordingTransport", "ReplayTransport", "Session", "Transport", "MondayClientError", "field_updated_hook", "set_json_codec", *_fields_all]
 __version__ = "0.1.0"
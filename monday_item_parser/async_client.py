@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, Dict, Optional
+
+from .exceptions import MondayClientError
+from .json_codec import get_json_codec
+from .transport import MONDAY_API_URL
+
+
+class AsyncMondayClient:
+    """
+    An asyncio client for monday's GraphQL API (used by `AsyncItem`), built on top of aiohttp.
+    A single client shares one connection pool, so many requests can be in flight on the same event loop.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        endpoint: str = MONDAY_API_URL,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60,
+        max_connections: int = 100,
+    ):
+        """
+        :param token:           The monday API token
+        :param endpoint:        The GraphQL endpoint (can be replaced with a local endpoint for testing)
+        :param headers:         Extra headers to send with every request (for example `API-Version`)
+        :param timeout:         The total timeout of a single request in seconds
+        :param max_connections: The maximum amount of concurrent connections in the pool
+        """
+
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._headers = {"Authorization": token, "Content-Type": "application/json", **(headers or {})}
+        self._session = None
+        self._session_loop = None
+
+    async def execute(self, query: str) -> Dict[str, Any]:
+        response = await self._get_session().post(self.endpoint, data=get_json_codec().dumps({"query": query}).encode())
+
+        async with response:
+            if response.status >= 400:
+                raise MondayClientError("Got error from monday client", [f"HTTP {response.status}: {await response.text()}"])
+
+            return get_json_codec().loads(await response.read())
+
+    def execute_sync(self, query: str) -> Dict[str, Any]:
+        """
+        Blocking version of `execute`, used where no event loop is available (like loading the board
+        columns when an `AsyncItem` class is declared)
+        """
+
+        import requests
+
+        response = requests.post(
+            self.endpoint,
+            data=get_json_codec().dumps({"query": query}).encode(),
+            headers=self._headers,
+            timeout=self.timeout,
+        )
+        if response.status_code >= 400:
+            raise MondayClientError("Got error from monday client", [f"HTTP {response.status_code}: {response.text}"])
+
+        return get_json_codec().loads(response.content)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._session_loop = None
+
+    async def __aenter__(self) -> AsyncMondayClient:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self):
+        try:
+            import aiohttp
+        except ImportError as exc:
+            raise ImportError("AsyncMondayClient requires aiohttp, install it with `pip install aiohttp`") from exc
+
+        # aiohttp sessions are bound to the event loop they were created in
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+            self._session_loop = loop
+
+        return self._session
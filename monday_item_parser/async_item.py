@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from .async_client import AsyncMondayClient
+from .collection import ItemCollection
+from .complexity import ComplexityScheduler
+from .helpers import raise_monday_errors
+from .exceptions import MondayClientError
+from .item import DEFAULT_MUTATIONS_BATCH_SIZE, Item, ItemMeta, Mutation
+from .sync import SyncResult
+from .transport import Transport
+from .queries import (
+    MAX_ITEMS_BY_IDS,
+    MAX_ITEMS_PAGE_SIZE,
+    aliased_mutation,
+    board_columns_query,
+    board_groups_query,
+    change_multiple_column_values_mutation,
+    create_item_mutation,
+    delete_item_mutation,
+    items_page_by_column_values_query,
+    items_page_query,
+    items_query,
+    next_items_page_query,
+    validate_page_size,
+)
+
+
+class AsyncItemMeta(ItemMeta):
+    def __new__(
+        mcs,
+        name,
+        bases,
+        attributes,
+        scheduler: Optional[ComplexityScheduler] = None,
+        transport: Optional[Transport] = None,
+        lazy_schema: bool = False,
+        **kwargs,
+    ):
+        # The scheduler blocks the thread while it waits for the budget, which would block the event loop
+        if scheduler is not None:
+            raise TypeError(f"`scheduler` isn't supported by the AsyncItem derived class `{name}`")
+
+        # The requests are sent by the `AsyncMondayClient`, a (blocking) transport would be ignored
+        if transport is not None:
+            raise TypeError(f"`transport` isn't supported by the AsyncItem derived class `{name}`")
+
+        # The board columns are loaded with a blocking request, which mustn't happen on first use inside the event loop
+        if lazy_schema:
+            raise TypeError(f"`lazy_schema` isn't supported by the AsyncItem derived class `{name}`")
+
+        return super().__new__(mcs, name, bases, attributes, **kwargs)
+
+    def _fetch_board_columns(cls) -> List[Dict[str, str]]:
+        # Classes are declared outside of the event loop, so the board columns are loaded synchronously
+        board_data = cls._monday_client.execute_sync(board_columns_query(cls._board_id))
+
+        # Check if the request succeed
+        raise_monday_errors(board_data)
+
+        return board_data["data"]["boards"][0]["columns"]
+
+
+class AsyncItem(Item, metaclass=AsyncItemMeta, abstract=True):
+    """
+    The asyncio counterpart of `Item`, declared the same way but with an `AsyncMondayClient`:
+
+        class MyItem(AsyncItem, monday_client=AsyncMondayClient(token), board_id=board_id):
+            status_example = StatusField
+
+    All of the requests are coroutines, and the board iterators are async generators.
+    """
+
+    _monday_client: AsyncMondayClient
+
+    async def duplicate_item(self) -> AsyncItem:
+        item = self._duplicate()
+        await item.create_item(self._group_id)
+        return item
+
+    async def create_item(self, group_id: str):
+        column_values = self._create_column_values()
+
+        response = await self._execute_query(
+            create_item_mutation(self._board_id, group_id, self._unsaved_item_name, column_values)
+        )
+
+        self._item_created(response["data"]["create_item"]["id"], group_id)
+
+    async def update_item(self):
+        column_values = self._update_column_values()
+
+        if column_values is None:
+            # No need to update anything if there are no changes
+            return
+
+        await self._execute_query(change_multiple_column_values_mutation(self._board_id, self.item_id, column_values))
+
+        self._item_updated()
+
+    async def delete_item(self):
+        self._validate_item_exists()
+
+        await self._execute_query(delete_item_mutation(self.item_id))
+
+        self._item_deleted()
+
+    @classmethod
+    async def create_items(
+        cls, items: Iterable[AsyncItem], group_id: str, batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[AsyncItem, MondayClientError]]:
+        """
+        See `Item::create_items`
+        """
+
+        return await cls._execute_mutations([item._create_mutation(group_id) for item in items], batch_size)
+
+    @classmethod
+    async def update_items(
+        cls, items: Iterable[AsyncItem], batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[AsyncItem, MondayClientError]]:
+        """
+        See `Item::update_items`
+        """
+
+        mutations = (item._update_mutation() for item in items)
+        return await cls._execute_mutations([mutation for mutation in mutations if mutation is not None], batch_size)
+
+    @classmethod
+    async def delete_items(
+        cls, items: Iterable[AsyncItem], batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[AsyncItem, MondayClientError]]:
+        """
+        See `Item::delete_items`
+        """
+
+        return await cls._execute_mutations([item._delete_mutation() for item in items], batch_size)
+
+    @classmethod
+    async def _execute_mutations(
+        cls, mutations: List[Mutation], batch_size: int
+    ) -> List[Tuple[AsyncItem, MondayClientError]]:
+        failures = []
+
+        for batch in cls._mutation_batches(mutations, batch_size):
+            response = await cls._execute_query(
+                aliased_mutation({alias: field for alias, (_, field, _) in batch.items()}), raise_errors=False
+            )
+            failures.extend(cls._mutation_results(batch, response))
+
+        return failures
+
+    @classmethod
+    async def get(cls, item_id: int) -> Optional[AsyncItem]:
+        cls._ensure_board_schema()
+
+        data = cls._item_cache.get(cls._item_cache_key(item_id)) if cls._item_cache is not None else None
+
+        if data is None:
+            response = await cls._execute_query(items_query([item_id], cls._item_fields))
+            data = cls._cacheable_item_data(response["data"]["items"], item_id)
+            if data is None:
+                return None
+
+        return cls.from_monday_dictionary(data)
+
+    @classmethod
+    async def fetch_items_by_ids(
+        cls,
+        item_ids: Iterable[int],
+        chunk_size: int = MAX_ITEMS_BY_IDS,
+        max_workers: int = 1,
+        missing_ids: Optional[Set[int]] = None,
+    ) -> AsyncIterator[AsyncItem]:
+        """
+        See `Item::fetch_items_by_ids`, up to `max_workers` chunks are requested concurrently
+        """
+
+        if not 0 < chunk_size <= MAX_ITEMS_BY_IDS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_ITEMS_BY_IDS}, got {chunk_size}")
+
+        cls._ensure_board_schema()
+
+        item_ids = list(dict.fromkeys(int(item_id) for item_id in item_ids))
+        found = {}
+
+        if cls._item_cache is not None:
+            for item_id in item_ids:
+                data = cls._item_cache.get(cls._item_cache_key(item_id))
+                if data is not None:
+                    found[item_id] = data
+
+        uncached_ids = [item_id for item_id in item_ids if item_id not in found]
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def fetch_chunk(chunk: List[int]) -> Dict[int, Dict[str, Any]]:
+            async with semaphore:
+                response = await cls._execute_query(items_query(chunk, cls._item_fields))
+
+            return cls._cacheable_items_data(response["data"]["items"])
+
+        for chunk_data in await asyncio.gather(
+            *(fetch_chunk(uncached_ids[i : i + chunk_size]) for i in range(0, len(uncached_ids), chunk_size))
+        ):
+            found.update(chunk_data)
+
+        for item_id in item_ids:
+            data = found.get(item_id)
+
+            if data is not None:
+                yield cls.from_monday_dictionary(data)
+            elif missing_ids is not None:
+                missing_ids.add(item_id)
+
+    @classmethod
+    async def fetch_items_from_board(cls, page_size: int = MAX_ITEMS_PAGE_SIZE) -> AsyncIterator[AsyncItem]:
+        cls._ensure_board_schema()
+
+        async for item in cls._items_from_pages(cls._fetch_item_pages(page_size)):
+            yield item
+
+    @classmethod
+    async def fetch_items_by_column_value(cls, *, page_size: int = MAX_ITEMS_PAGE_SIZE, **kwargs) -> AsyncIterator[AsyncItem]:
+        if len(kwargs) > 1:
+            async for item in cls.fetch_items_by_filter(page_size=page_size, **kwargs):
+                yield item
+            return
+
+        validate_page_size(page_size)
+
+        monday_id, value = cls._search_column_value(**kwargs)
+        data = await cls._execute_query(items_page_by_column_values_query(
+            cls._board_id, monday_id, value, page_size, cls._item_fields
+        ))
+
+        async for item in cls._items_from_pages(
+            cls._follow_items_pages(data["data"]["items_page_by_column_values"], page_size)
+        ):
+            yield item
+
+    @classmethod
+    async def fetch_items_by_filter(
+        cls, *, operator: str = "and", page_size: int = MAX_ITEMS_PAGE_SIZE, **lookups
+    ) -> AsyncIterator[AsyncItem]:
+        cls._ensure_board_schema()
+
+        pages = cls._fetch_item_pages(page_size, query_params=cls._filter_query_params(operator, **lookups))
+        async for item in cls._items_from_pages(pages):
+            yield item
+
+    @classmethod
+    async def fetch_columns(cls, page_size: int = MAX_ITEMS_PAGE_SIZE, as_numpy: bool = False) -> Dict[str, Any]:
+        """
+        See `Item::fetch_columns`, the raw pages are decoded once all of them have been fetched
+        """
+
+        cls._ensure_board_schema()
+
+        pages = [page async for page in cls._fetch_item_pages(page_size)]
+        return cls.decode_columns(pages, as_numpy)
+
+    @classmethod
+    async def fetch_collection(
+        cls, hash_indexes: Iterable[str] = (), sorted_indexes: Iterable[str] = (), page_size: int = MAX_ITEMS_PAGE_SIZE
+    ) -> ItemCollection:
+        """
+        See `Item::fetch_collection`
+        """
+
+        items = [item async for item in cls.fetch_items_from_board(page_size)]
+        return ItemCollection(items, hash_indexes, sorted_indexes)
+
+    @classmethod
+    def sync_items(cls, state_path: str, page_size: int = MAX_ITEMS_PAGE_SIZE) -> SyncResult:
+        raise TypeError(f"'{cls.__name__}' can't sync items, incremental syncs are supported only by `Item` classes")
+
+    @classmethod
+    def sync_local(cls, page_size: int = MAX_ITEMS_PAGE_SIZE) -> Tuple[int, int, int]:
+        raise TypeError(f"'{cls.__name__}' can't sync a local mirror, local mirrors are synced only by `Item` classes")
+
+    @classmethod
+    async def fetch_group_ids(cls) -> AsyncIterator[str]:
+        async for group_id, _ in cls.fetch_groups():
+            yield group_id
+
+    @classmethod
+    async def fetch_groups(cls) -> AsyncIterator[Tuple[str, str]]:
+        groups_data = await cls._execute_query(board_groups_query(cls._board_id))
+
+        for group in groups_data["data"]["boards"][0]["groups"]:
+            yield group["id"], group["title"]
+
+    @classmethod
+    async def _items_from_pages(cls, pages: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[AsyncItem]:
+        async for page in pages:
+            for item in page:
+                yield cls.from_monday_dictionary(item)
+
+    @classmethod
+    async def _fetch_item_pages(
+        cls, page_size: int, item_fields: Optional[str] = None, query_params: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        See `Item::_fetch_item_pages`
+        """
+
+        validate_page_size(page_size)
+
+        item_fields = item_fields or cls._item_fields
+        data = await cls._execute_query(items_page_query(cls._board_id, page_size, item_fields, query_params))
+
+        async for page in cls._follow_items_pages(data["data"]["boards"][0]["items_page"], page_size, item_fields):
+            yield page
+
+    @classmethod
+    async def _follow_items_pages(
+        cls, items_page: Dict[str, Any], page_size: int, item_fields: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        item_fields = item_fields or cls._item_fields
+
+        while True:
+            yield items_page["items"]
+
+            # monday returns an empty cursor after the last page
+            if not items_page.get("cursor"):
+                break
+
+            data = await cls._execute_query(next_items_page_query(items_page["cursor"], page_size, item_fields))
+            items_page = data["data"]["next_items_page"]
+
+    @classmethod
+    async def _execute_query(cls, query: str, raise_errors: bool = True) -> Dict[str, Any]:
+        data = await cls._monday_client.execute(query)
+
+        # Check if the request succeed
+        if raise_errors:
+            raise_monday_errors(data)
+
+        return data
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .fields import Field
+from .lookups import lookup_field, parse_lookup
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+class ItemCollection:
+    """
+    A container of fetched items that can be queried by field values, with optional indexes:
+
+        items = ItemCollection(
+            ExampleItem.fetch_items_from_board(),
+            hash_indexes=["status_example", "people_example"],
+            sorted_indexes=["numbers_example", "date_example"],
+        )
+
+        items.filter(status_example="Done", numbers_example__gte=5)
+        items.filter(people_example=Person(1234))  # Fields with many values match any of them
+
+    Hash indexes answer `eq`, `ne` and `in` lookups, sorted indexes answer range lookups
+    (`gt`, `gte`, `lt`, `lte` and `between`) as well. Lookups on fields without an index scan the items.
+    Statuses are compared by their label index, labels in the lookups are replaced by their index (see `lookup_field`).
+
+    The indexes are updated when the fields are set through the items (`item.numbers_example = 5`),
+    changes that don't go through the item (like `item.tags_example.value.append(1)`) need `reindex`.
+    """
+
+    def __init__(self, items: Iterable[Item] = (), hash_indexes: Iterable[str] = (), sorted_indexes: Iterable[str] = ()):
+        self._items: Dict[int, Item] = {}
+        self._order: Dict[int, int] = {}
+        self._next_order = 0
+
+        # field name -> field key -> ids of the items
+        self._hash_indexes: Dict[str, Dict[Any, Set[int]]] = {}
+        # field name -> id of the item -> the keys it's indexed by (to remove it when it's changed)
+        self._hash_keys: Dict[str, Dict[int, Tuple[Any, ...]]] = {}
+        # field name -> sorted list of (key, id of the item)
+        self._sorted_indexes: Dict[str, List[Tuple[Any, int]]] = {}
+        self._sorted_keys: Dict[str, Dict[int, Any]] = {}
+
+        for field_name in hash_indexes:
+            self.create_hash_index(field_name)
+
+        for field_name in sorted_indexes:
+            self.create_sorted_index(field_name)
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(list(self._items.values()))
+
+    def __contains__(self, item: Item) -> bool:
+        return id(item) in self._items
+
+    def add(self, item: Item):
+        if id(item) in self._items:
+            return
+
+        self._items[id(item)] = item
+        self._order[id(item)] = self._next_order
+        self._next_order += 1
+
+        self._index(item)
+        item._add_observer(self._item_changed)
+
+    def extend(self, items: Iterable[Item]):
+        for item in items:
+            self.add(item)
+
+    def remove(self, item: Item):
+        if id(item) not in self._items:
+            raise KeyError("The item is not in the collection")
+
+        item._remove_observer(self._item_changed)
+        self._unindex(item)
+        del self._items[id(item)]
+        del self._order[id(item)]
+
+    def reindex(self, item: Item):
+        """
+        Update the indexes of an item that has been changed without setting its fields through the item
+        """
+
+        self._unindex(item)
+        self._index(item)
+
+    def create_hash_index(self, field_name: str):
+        self._hash_indexes[field_name] = {}
+        self._hash_keys[field_name] = {}
+
+        for item in self._items.values():
+            self._index_hash(field_name, item)
+
+    def create_sorted_index(self, field_name: str):
+        self._sorted_indexes[field_name] = []
+        self._sorted_keys[field_name] = {}
+
+        for item in self._items.values():
+            self._index_sorted(field_name, item)
+
+    def filter(self, **lookups) -> List[Item]:
+        """
+        :param lookups: Field values to filter by, with an optional operator (see `lookups.parse_lookup`)
+        :return:        The matching items, in the order they were added
+        """
+
+        matches: Optional[Set[int]] = None
+
+        for lookup, value in lookups.items():
+            field_name, operator = parse_lookup(lookup)
+            ids = self._lookup(field_name, operator, value)
+            matches = ids if matches is None else matches & ids
+
+            if not matches:
+                return []
+
+        if matches is None:
+            return list(self._items.values())
+
+        return [self._items[item_id] for item_id in sorted(matches, key=self._order.__getitem__)]
+
+    def _lookup(self, field_name: str, operator: str, value: Any) -> Set[int]:
+        if operator == "in":
+            ids = set()
+            for v in value:
+                ids |= self._lookup(field_name, "eq", v)
+            return ids
+
+        if operator == "ne":
+            return set(self._items) - self._lookup(field_name, "eq", value)
+
+        if operator == "between":
+            low, high = value
+            return self._lookup(field_name, "gte", low) & self._lookup(field_name, "lte", high)
+
+        item_class = type(next(iter(self._items.values()))) if self._items else None
+        if item_class is None:
+            return set()
+
+        field = lookup_field(item_class, field_name, value)
+
+        if operator == "eq":
+            keys = _hash_keys(field)
+
+            if field_name in self._hash_indexes:
+                index = self._hash_indexes[field_name]
+                ids = None
+                for key in keys:
+                    ids = set(index.get(key, ())) if ids is None else ids & index.get(key, set())
+                return ids or set()
+
+            if field_name in self._sorted_indexes and len(keys) == 1 and keys[0] is not None:
+                return self._range(field_name, keys[0], True, keys[0], True)
+
+            return {
+                item_id
+                for item_id, item in self._items.items()
+                if set(keys).issubset(_hash_keys(getattr(item, field_name)))
+            }
+
+        key = _sort_key(field)
+        if key is None:
+            return set()
+
+        if field_name in self._sorted_indexes:
+            if operator in ("gt", "gte"):
+                return self._range(field_name, key, operator == "gte", None, False)
+            return self._range(field_name, None, False, key, operator == "lte")
+
+        compare = {
+            "gt": lambda k: k > key,
+            "gte": lambda k: k >= key,
+            "lt": lambda k: k < key,
+            "lte": lambda k: k <= key,
+        }[operator]
+
+        ids = set()
+        for item_id, item in self._items.items():
+            item_key = _sort_key(getattr(item, field_name))
+            if item_key is not None and compare(item_key):
+                ids.add(item_id)
+
+        return ids
+
+    def _range(self, field_name: str, low: Any, include_low: bool, high: Any, include_high: bool) -> Set[int]:
+        entries = self._sorted_indexes[field_name]
+
+        start = 0
+        if low is not None:
+            start = bisect_left(entries, (low,)) if include_low else bisect_right(entries, (low, float("inf")))
+
+        end = len(entries)
+        if high is not None:
+            end = bisect_right(entries, (high, float("inf"))) if include_high else bisect_left(entries, (high,))
+
+        return {item_id for _, item_id in entries[start:end]}
+
+    def _item_changed(self, item: Item, field_name: str):
+        if field_name in self._hash_indexes:
+            self._unindex_hash(field_name, item)
+            self._index_hash(field_name, item)
+
+        if field_name in self._sorted_indexes:
+            self._unindex_sorted(field_name, item)
+            self._index_sorted(field_name, item)
+
+    def _index(self, item: Item):
+        for field_name in self._hash_indexes:
+            self._index_hash(field_name, item)
+
+        for field_name in self._sorted_indexes:
+            self._index_sorted(field_name, item)
+
+    def _unindex(self, item: Item):
+        for field_name in self._hash_indexes:
+            self._unindex_hash(field_name, item)
+
+        for field_name in self._sorted_indexes:
+            self._unindex_sorted(field_name, item)
+
+    def _index_hash(self, field_name: str, item: Item):
+        keys = _hash_keys(getattr(item, field_name))
+        self._hash_keys[field_name][id(item)] = keys
+
+        index = self._hash_indexes[field_name]
+        for key in keys:
+            index.setdefault(key, set()).add(id(item))
+
+    def _unindex_hash(self, field_name: str, item: Item):
+        index = self._hash_indexes[field_name]
+
+        for key in self._hash_keys[field_name].pop(id(item), ()):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(id(item))
+                if not ids:
+                    del index[key]
+
+    def _index_sorted(self, field_name: str, item: Item):
+        key = _sort_key(getattr(item, field_name))
+
+        # Empty values aren't ordered, they are found by scanning
+        if key is None:
+            return
+
+        self._sorted_keys[field_name][id(item)] = key
+        insort(self._sorted_indexes[field_name], (key, id(item)))
+
+    def _unindex_sorted(self, field_name: str, item: Item):
+        key = self._sorted_keys[field_name].pop(id(item), None)
+        if key is None:
+            return
+
+        entries = self._sorted_indexes[field_name]
+        del entries[bisect_left(entries, (key, id(item)))]
+
+
+def _normalize(value: Any) -> Any:
+    # Dates and datetimes are never equal, so dates are compared as midnight datetimes
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+
+    try:
+        hash(value)
+    except TypeError:
+        # Mutable values (like `Phone` or `Link`) are indexed by their representation
+        return str(value)
+
+    return value
+
+
+def _hash_keys(field: Field) -> Tuple[Any, ...]:
+    """
+    :return: The keys a field is indexed by: its value, or every value for fields with many values (like people or tags)
+    """
+
+    value = field.value
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_normalize(v) for v in value)
+
+    return (_normalize(value),)
+
+
+def _sort_key(field: Field) -> Any:
+    value = field.value
+
+    if value is None:
+        return None
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        raise TypeError(f"Fields with many values can't be compared by range ({field.__class__.__qualname__})")
+
+    return _normalize(value)
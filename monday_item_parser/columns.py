@@ -0,0 +1,157 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .fields import CheckboxField, DateField, Field, NumberField
+from .fields.field import _IMMUTABLE_TYPES
+from .json_codec import get_json_codec
+
+
+# The item attributes that are decoded along with the fields
+ITEM_COLUMNS = ("item_id", "item_name", "group_id", "group_title")
+
+# The raw value of a column that is missing from an item
+_MISSING = object()
+
+
+def decode_columns(item_class, pages: Iterable[List[Dict[str, Any]]], as_numpy: bool = False) -> Dict[str, Any]:
+    """
+    Decode raw monday items (as returned by the items queries) into columns: a list of values for every
+    item attribute and every field of the item class, without creating `Item` objects.
+
+    Every value is parsed by the `from_monday_dict` of the field, so the values are the same as the
+    `.value` of the fields of the matching items. The values are gathered by column, the JSON values of
+    a column are decoded together and every distinct value of a column is parsed once.
+
+    :param item_class:  The `Item` class that describes the board
+    :param pages:       Iterable of lists of raw monday items
+    :param as_numpy:    Return numpy arrays for the fields with a fixed type: `float64` for numbers
+                        (with `nan` for empty values), `bool` for checkboxes and `datetime64` for dates
+                        (with `NaT` for empty values). The other columns stay lists.
+    :return:            Dictionary of the column (attribute) name to its values
+    """
+
+    item_class._ensure_board_schema()
+
+    # The raw values (JSON or text) are gathered by column first, and then every column is decoded at once
+    plan: Dict[str, Tuple[Callable[[Any], None], str]] = {}
+    field_names = []
+    raw_columns: List[List[Any]] = []
+
+    for monday_id, (field_name, using_text) in item_class._decode_plan.items():
+        raw_column = []
+        plan[monday_id] = (raw_column.append, "text" if using_text else "value")
+        field_names.append(field_name)
+        raw_columns.append(raw_column)
+
+    columns: Dict[str, List[Any]] = {name: [] for name in ITEM_COLUMNS}
+
+    item_ids = columns["item_id"]
+    item_names = columns["item_name"]
+    group_ids = columns["group_id"]
+    group_titles = columns["group_title"]
+
+    for page in pages:
+        for data in page:
+            item_ids.append(int(data["id"]))
+            item_names.append(data["name"])
+            group_ids.append(data["group"]["id"])
+            group_titles.append(data["group"]["title"])
+
+            gathered = 0
+            for column_values in (data.get("column_values", ()), data.get("text_column_values", ())):
+                for column_data in column_values:
+                    column = plan.get(column_data["id"])
+                    if column is not None:
+                        append, key = column
+                        append(column_data.get(key))
+                        gathered += 1
+
+            if gathered != len(raw_columns):
+                # Some columns are missing from the item, they get the default values of their fields
+                for raw_column in raw_columns:
+                    if len(raw_column) < len(item_ids):
+                        raw_column.append(_MISSING)
+
+    loads = get_json_codec().loads
+
+    for field_name, raw_column in zip(field_names, raw_columns):
+        columns[field_name] = _decode_column(getattr(item_class, field_name), raw_column, loads)
+
+    if as_numpy:
+        _to_numpy_arrays(item_class, columns, field_names)
+
+    return columns
+
+
+def _decode_column(class_field: Field, raw_column: List[Any], loads) -> List[Any]:
+    """
+    Decode the raw values of a column with a clone of the field of the item class (so the class field isn't changed).
+    Every distinct raw value is parsed once, and the JSON values of the column are decoded in a single call.
+    """
+
+    field = class_field.clone()
+    copy_value = field.copy_value
+    default = copy_value(field.value)
+    default_is_mutable = _is_mutable(default)
+
+    distinct = [raw_value for raw_value in dict.fromkeys(raw_column) if raw_value is not _MISSING]
+    if getattr(field, "__use_text_instead_of_value__", False):
+        column_values = [raw_value or None for raw_value in distinct]
+    else:
+        column_values = _loads_values(loads, distinct)
+
+    parsed = {_MISSING: default}
+    for raw_value, column_value in zip(distinct, column_values):
+        # Every value is parsed from the default, since some fields keep their value on empty cells
+        # (like people and dropdowns) and some fields update their value in place (like links)
+        field._value = copy_value(default) if default_is_mutable else default
+        field.from_monday_dict(column_value)
+        parsed[raw_value] = field._value
+
+    values = list(map(parsed.__getitem__, raw_column))
+
+    # The rows with the same raw value got the same value, the mutable values of the repeating rows are copied
+    # so the rows don't share them
+    if len(values) > len(distinct) and any(_is_mutable(value) for value in parsed.values()):
+        seen = set()
+        for index, value in enumerate(values):
+            if id(value) in seen:
+                values[index] = copy_value(value)
+            else:
+                seen.add(id(value))
+
+    return values
+
+
+def _loads_values(loads: Callable[[str], Any], raw_values: List[Optional[str]]) -> List[Any]:
+    """
+    Decode JSON values with a single call (as the items of a JSON array), empty values are decoded as None
+    """
+
+    decoded = iter(loads("[" + ",".join([raw_value for raw_value in raw_values if raw_value]) + "]"))
+    return [next(decoded) if raw_value else None for raw_value in raw_values]
+
+
+def _is_mutable(value: Any) -> bool:
+    return not (value is None or isinstance(value, _IMMUTABLE_TYPES))
+
+
+def _to_numpy_arrays(item_class, columns: Dict[str, Any], field_names: List[str]):
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Decoding columns as numpy arrays requires numpy, install it with `pip install numpy`") from exc
+
+    columns["item_id"] = numpy.array(columns["item_id"], dtype=numpy.int64)
+
+    for field_name in field_names:
+        field = getattr(item_class, field_name)
+        values = columns[field_name]
+
+        if isinstance(field, NumberField):
+            columns[field_name] = numpy.array(
+                [numpy.nan if value is None else value for value in values], dtype=numpy.float64
+            )
+        elif isinstance(field, CheckboxField):
+            columns[field_name] = numpy.array([bool(value) for value in values], dtype=bool)
+        elif isinstance(field, DateField):
+            columns[field_name] = numpy.array(values, dtype="datetime64[s]")
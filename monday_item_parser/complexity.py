@@ -0,0 +1,161 @@
+import re
+import threading
+import time
+
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from .queries import with_complexity
+
+
+# The page sizes (`limit` and `first`) are kept, the cost of a query grows with them
+_LITERALS_PATTERN = re.compile(r'(\b(?:limit|first)\s*:\s*\d+)|"(?:[^"\\]|\\.)*"|\b\d+\b')
+_BUDGET_EXHAUSTED_PATTERN = re.compile(r"Complexity budget exhausted.*?(\d+) seconds")
+
+
+class _Budget:
+    def __init__(self):
+        # The budget left after the last response (None when unknown, like after a reset)
+        self.remaining: Optional[int] = None
+        # The monotonic time in which monday resets the budget
+        self.reset_at: float = 0
+        # The estimated cost of the requests that were sent and haven't returned yet
+        self.reserved: int = 0
+
+
+class ComplexityScheduler:
+    """
+    Keeps a running complexity budget for every monday API token, by requesting the `complexity` field
+    with every query (Read more at https://developer.monday.com/api-reference/docs/rate-limits).
+
+    Before a request is sent, its cost is estimated from the previous requests of the same shape,
+    and if the remaining budget can't cover it the request waits until monday resets the budget.
+    Requests that fit in the remaining budget aren't held behind requests that are waiting, and a
+    request that still fails with "Complexity budget exhausted" is retried after the reset (the error has
+    to be returned in the response, like the transports of the library do, and not raised).
+
+    A single scheduler can be shared by many item classes and threads:
+
+        scheduler = ComplexityScheduler()
+
+        class MyItem(Item, monday_client=client, board_id=board_id, scheduler=scheduler):
+            ...
+    """
+
+    def __init__(self, max_retries: int = 5, safety_margin: int = 0):
+        """
+        :param max_retries:     The amount of times a request is retried after failing on an exhausted budget
+        :param safety_margin:   Budget points that are always left unused (for other consumers of the same token)
+        """
+
+        self.max_retries = max_retries
+        self.safety_margin = safety_margin
+        self._condition = threading.Condition()
+        self._budgets: Dict[Hashable, _Budget] = {}
+        self._costs: Dict[str, int] = {}
+
+    def execute(self, token: Hashable, send: Callable[[str], Dict[str, Any]], query: str) -> Dict[str, Any]:
+        """
+        Send the query (with the `complexity` field) once the budget of the token allows it.
+
+        :param token:   The key of the budget to use (requests with the same API token share the same budget)
+        :param send:    Sends the query and returns the response
+        :param query:   The GraphQL query to send
+        :return:        The response of the query
+        """
+
+        shape = self._shape(query)
+        query = with_complexity(query)
+
+        for _ in range(self.max_retries + 1):
+            cost = self._reserve(token, shape)
+
+            try:
+                response = send(query)
+            finally:
+                with self._condition:
+                    self._budget(token).reserved -= cost
+                    self._condition.notify_all()
+
+            wait = self._budget_exhausted_wait(response)
+            if wait is None:
+                self._update(token, shape, response)
+                return response
+
+            # The budget was exhausted anyway (for example by another process using the same token)
+            with self._condition:
+                budget = self._budget(token)
+                budget.remaining = 0
+                budget.reset_at = time.monotonic() + wait
+
+        return response
+
+    def remaining(self, token: Hashable) -> Optional[int]:
+        """
+        :return: The last known remaining budget of the token (None if unknown)
+        """
+
+        with self._condition:
+            budget = self._budget(token)
+            return budget.remaining if budget.reset_at > time.monotonic() else None
+
+    def _reserve(self, token: Hashable, shape: str) -> int:
+        """
+        Wait until the estimated cost of the query fits in the budget, and reserve it
+        """
+
+        with self._condition:
+            # Unknown queries are assumed to be cheap until their real cost is reported
+            cost = self._costs.get(shape, 1)
+
+            while True:
+                budget = self._budget(token)
+                now = time.monotonic()
+
+                if budget.reset_at <= now:
+                    # The budget has been reset since the last response
+                    budget.remaining = None
+
+                if budget.remaining is None or budget.remaining - budget.reserved - self.safety_margin >= cost:
+                    budget.reserved += cost
+                    return cost
+
+                self._condition.wait(timeout=budget.reset_at - now)
+
+    def _update(self, token: Hashable, shape: str, response: Dict[str, Any]):
+        complexity = ((response or {}).get("data") or {}).get("complexity")
+        if not complexity:
+            return
+
+        with self._condition:
+            budget = self._budget(token)
+            budget.remaining = complexity["after"]
+            budget.reset_at = time.monotonic() + complexity["reset_in_x_seconds"]
+            self._costs[shape] = complexity["query"]
+            self._condition.notify_all()
+
+    def _budget(self, token: Hashable) -> _Budget:
+        if token not in self._budgets:
+            self._budgets[token] = _Budget()
+
+        return self._budgets[token]
+
+    @staticmethod
+    def _shape(query: str) -> str:
+        """
+        Queries that differ only by their arguments (ids, cursors, values) are expected to cost the same,
+        unless they request a different amount of items
+        """
+
+        return _LITERALS_PATTERN.sub(lambda match: match.group(1) or "", query)
+
+    @staticmethod
+    def _budget_exhausted_wait(response: Dict[str, Any]) -> Optional[int]:
+        errors: List[Any] = response.get("errors", ()) if isinstance(response, dict) else ()
+
+        for error in errors:
+            message = error.get("message", "") if isinstance(error, dict) else str(error)
+            match = _BUDGET_EXHAUSTED_PATTERN.search(message)
+            if match:
+                return int(match.group(1))
+
+        return None
@@ -24,6 +24,8 @@ class CountryField(Field):
 
     @Field.value.setter
     def value(self, country_code: str):
+        self._dirty = True
+
         if not country_code:
             self._value = None
             return
@@ -1,8 +1,8 @@
-from collections import OrderedDict
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 from .field import Field
+from .helpers import format_date, format_time, parse_date
 
 
 class DateField(Field):
@@ -15,8 +15,8 @@ class DateField(Field):
     def to_monday_dict(self):
         data = (
             {
-                "date": self.value.strftime("%Y-%m-%d"),
-                "time": self.value.strftime("%H:%M:%S"),
+                "date": format_date(self.value),
+                "time": format_time(self.value),
             }
             if self.value
             else {}
@@ -32,29 +32,22 @@ class DateField(Field):
             self.value = None
             return
 
-        variables = OrderedDict()
-        time_format = OrderedDict()
-
-        # Create the needed formatting only for the items that we have in the dictionary
-        for key, time_fmt in {"date": "%Y-%m-%d", "time": "%H:%M:%S"}.items():
-            if key not in data:
-                continue
+        if "date" not in data:
+            # Only the time is set
+            self.value = datetime.strptime(data["time"], "%H:%M:%S")
+            return
 
-            variables[key] = data[key]
-            time_format[key] = time_fmt
-
-        # Parse the date & time by the formatting
-        self.value = datetime.strptime(
-            " ".join("{{{}}}".format(key) for key in variables).format(**variables),
-            " ".join("{}".format(time_format[fmt]) for fmt in time_format),
-        )
+        self.value = parse_date(data["date"], data.get("time"))
 
     def search_representation(self) -> str:
-        return self.value.strftime("%Y-%m-%d")
+        return format_date(self.value)
+
+    def filter_representation(self) -> List[str]:
+        # Dates are compared by the day, "EXACT" marks an explicit date (instead of "TODAY", "ONE_WEEK_AGO", etc.)
+        return ["EXACT", format_date(self.value)]
 
     def __str__(self):
-        format = "%Y-%m-%d"
-        if self._include_time:
-            format += " %H:%M:%S"
+        if not self.value:
+            return str(None)
 
-        return self.value.strftime(format) if self.value else str(None)
+        return "{} {}".format(format_date(self.value), format_time(self.value)) if self._include_time else format_date(self.value)
@@ -12,7 +12,7 @@ class DropdownField(Field):
 
     def to_monday_dict(self):
         if self._by == "ids":
-            return {"ids": self._ids}
+            return {"ids": self.value}
 
         return {"labels": self.value} if self.value else None
 
@@ -21,6 +21,13 @@ class DropdownField(Field):
             self._by = "ids"
             self.value = [int(x) for x in data["ids"]]
 
+    def filter_representation(self) -> List[int]:
+        # monday filters dropdowns by the ids of their labels, a lookup can be a single id as well
+        return [self.value] if isinstance(self.value, int) else list(self.value or ())
+
+    def copy_value(self, value: List[str]) -> List[str]:
+        return list(value) if value is not None else None
+
 
 class DropdownLabelField(Field):
     __monday_field_type__ = "dropdown"
@@ -34,3 +41,6 @@ class DropdownLabelField(Field):
 
     def from_monday_dict(self, data: str):
         self.value = data.split(', ') if data else []
+
+    def copy_value(self, value: List[str]) -> List[str]:
+        return list(value) if value is not None else None
@@ -1,6 +1,26 @@
 import abc
+import copy
 
-from typing import Any, Dict
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+
+# Values of these types can be shared between fields without copying them
+_IMMUTABLE_TYPES = (str, int, float, bool, date, datetime, tuple, frozenset)
+
+
+def shallow_copy(value: Any) -> Any:
+    """
+    A copy of an object that shares its attributes (like `copy.copy`, with much less overhead),
+    for the simple value objects of the fields
+    """
+
+    if value is None:
+        return None
+
+    copied = object.__new__(type(value))
+    copied.__dict__.update(value.__dict__)
+    return copied
 
 
 class Field(abc.ABC):
@@ -8,6 +28,9 @@ class Field(abc.ABC):
     # to Monday API when fetching data from monday boards
     __monday_field_type__ = None
 
+    # Set whenever the value is assigned, so items compare only the values that might have been changed
+    _dirty = False
+
     @abc.abstractmethod
     def to_monday_dict(self) -> Dict[str, Any]:
         """
@@ -38,6 +61,17 @@ class Field(abc.ABC):
             "items_by_column_value is not supported for {}".format(self.__class__.__qualname__)
         )
 
+    def filter_representation(self) -> List[Any]:
+        """
+        Returns the `compare_value` of a rule that filters the items by this value,
+        as it should be in the `query_params` of the items page query
+        (Read more at https://developer.monday.com/api-reference/reference/other-types#items-query-rule)
+
+        The search representation is used by default, fields that monday compares differently override this.
+        """
+
+        return [self.search_representation()]
+
     @property
     def value(self) -> Any:
         """
@@ -53,6 +87,38 @@ class Field(abc.ABC):
         """
 
         self._value = value
+        self._dirty = True
+
+    def copy_value(self, value: Any) -> Any:
+        """
+        Copy a value of this field, so changing the copy won't change the original.
+        Used to create the fields of new items and to snapshot the values for change detection.
+        """
+
+        if value is None or isinstance(value, _IMMUTABLE_TYPES):
+            return value
+
+        return copy.deepcopy(value)
+
+    def clone(self) -> "Field":
+        """
+        A cheap copy of the field (the attributes are shared and only the value is copied)
+        """
+
+        field = object.__new__(type(self))
+        field.__dict__.update(self.__dict__)
+        field._value = self.copy_value(self._value)
+        field._dirty = False
+        return field
+
+    @property
+    def might_have_changed(self) -> bool:
+        """
+        Whether the value might be different from the last snapshot: it has been assigned since,
+        or it is a mutable value (like a list) that can be changed in place without an assignment
+        """
+
+        return self._dirty or not (self._value is None or isinstance(self._value, _IMMUTABLE_TYPES))
 
     def __str__(self) -> str:
         return str(self.value)
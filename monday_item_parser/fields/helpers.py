@@ -1,30 +1,106 @@
-from typing import Dict
+import os
+import re
+import threading
 
+from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
-_COUNTRIES = {}
+from .. import json_codec
 
 
-def get_available_countries() -> Dict[str, str]:
+# The amount of distinct date strings that are kept parsed (boards tend to have many items on the same dates)
+DATES_CACHE_SIZE = 4096
+
+_ISO_DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME_PATTERN = re.compile(r"[0-9]{2}:[0-9]{2}:[0-9]{2}")
+
+
+_COUNTRIES_PATH = os.path.join(os.path.dirname(__file__), "countries.json")
+_COUNTRIES: Optional[Mapping[str, str]] = None
+_COUNTRIES_LOCK = threading.Lock()
+
+
+def get_available_countries() -> Mapping[str, str]:
     """
-    This function loads the list of countries from http://country.io to support
+    Returns a read-only mapping of country codes (ISO 3166-1 alpha-2) to country names, to support
     monday's fields that need country codes (like Country and Phone fields).
+
+    The table is bundled with the package and loaded once, on first use.
+    """
+
+    global _COUNTRIES
+    if _COUNTRIES is None:
+        with _COUNTRIES_LOCK:
+            if _COUNTRIES is None:
+                with open(_COUNTRIES_PATH, "rb") as file:
+                    _COUNTRIES = MappingProxyType(json_codec.loads(file.read()))
+
+    return _COUNTRIES
+
+
+def refresh_available_countries(loader: Callable[[], Mapping[str, str]]):
+    """
+    Replace the bundled countries table with the one returned by the loader, for example:
+
+        refresh_available_countries(fetch_countries_from_country_io)
+
+    :param loader: A callable that returns a mapping of country codes to country names
     """
 
     global _COUNTRIES
-    if not _COUNTRIES:
-        import json
-        import requests
-
-        response = requests.get("http://country.io/names.json")
-        if response.status_code != 200:
-            raise Exception(
-                "Failed to fetch countries, status_code={}, response={}".format(
-                    response.status_code, response.text
-                )
-            )
-
-        _COUNTRIES = json.loads(response.text)
-
-    # Make sure we return a copy instead of the global variable
-    # so it won't be changed
-    return dict(_COUNTRIES)
+    countries = MappingProxyType(dict(loader()))
+
+    with _COUNTRIES_LOCK:
+        _COUNTRIES = countries
+
+
+def fetch_countries_from_country_io() -> Mapping[str, str]:
+    """
+    Loads the list of countries from http://country.io (the source of the bundled table)
+    """
+
+    import requests
+
+    response = requests.get("http://country.io/names.json")
+    if response.status_code != 200:
+        raise Exception(
+            "Failed to fetch countries, status_code={}, response={}".format(response.status_code, response.text)
+        )
+
+    return json_codec.loads(response.content)
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def parse_date(date_string: str, time_string: Optional[str] = None) -> datetime:
+    """
+    Parse monday's date ("YYYY-MM-DD") and optional time ("HH:MM:SS") strings.
+    Every distinct string is parsed once (datetimes are immutable so they can be shared).
+    """
+
+    # `fromisoformat` accepts more formats on newer Python versions, so it's only used for the exact formats
+    if _ISO_DATE_PATTERN.fullmatch(date_string) and (not time_string or _ISO_TIME_PATTERN.fullmatch(time_string)):
+        return datetime.fromisoformat(f"{date_string}T{time_string}" if time_string else date_string)
+
+    # Formats that strptime accepts but aren't ISO (like "2023-1-5")
+    if time_string:
+        return datetime.strptime(f"{date_string} {time_string}", "%Y-%m-%d %H:%M:%S")
+
+    return datetime.strptime(date_string, "%Y-%m-%d")
+
+
+def format_date(value: date) -> str:
+    """
+    :return: The "YYYY-MM-DD" representation of a date (or datetime)
+    """
+
+    return "%04d-%02d-%02d" % (value.year, value.month, value.day)
+
+
+def format_time(value: date) -> str:
+    """
+    :return: The "HH:MM:SS" representation of a datetime ("00:00:00" for dates)
+    """
+
+    return "%02d:%02d:%02d" % (getattr(value, "hour", 0), getattr(value, "minute", 0), getattr(value, "second", 0))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict
 
-from .field import Field
+from .field import Field, shallow_copy
 
 
 @dataclass
@@ -28,3 +28,6 @@ class LinkField(Field):
 
     def search_representation(self) -> str:
         return str(self.value.text)
+
+    def copy_value(self, value: Link) -> Link:
+        return shallow_copy(value)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json, LetterCase
 
-from .field import Field
+from .field import Field, shallow_copy
 from ..helpers import remove_none_from_dict
 
 
@@ -75,11 +75,19 @@ class LocationField(Field):
 
     def to_monday_dict(self) -> dict[str, str] | None:
         clear_data = remove_none_from_dict(self.value.to_monday_dict()) if self.value else None
-        print(clear_data)
         return clear_data or None
 
     def from_monday_dict(self, data: dict[str, str]):
         self.value = Location().from_monday_dict(data) 
 
+    def copy_value(self, value: Location | None) -> Location | None:
+        if value is None:
+            return None
+
+        location = shallow_copy(value)
+        location.city = shallow_copy(value.city)
+        location.country = shallow_copy(value.country)
+        return location
+
     def __str__(self):
         return str(self.value.address) if self.value and self.value.address else "None"
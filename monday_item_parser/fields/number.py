@@ -1,6 +1,4 @@
-import json
-
-from typing import Union
+from typing import List, Union
 
 from .field import Field
 
@@ -14,8 +12,20 @@ class NumberField(Field):
     def to_monday_dict(self):
         return str(self.value) if self.value is not None else None
 
-    def from_monday_dict(self, data: Union[int, float]):
-        self.value = json.loads(data) if data else None
+    def from_monday_dict(self, data: Union[str, int, float]):
+        # monday keeps numbers as strings (the column value is already decoded, no need to parse JSON again)
+        if not data:
+            self.value = None
+        elif isinstance(data, str):
+            try:
+                self.value = int(data)
+            except ValueError:
+                self.value = float(data)
+        else:
+            self.value = data
 
     def search_representation(self) -> str:
         return str(self.value)
+
+    def filter_representation(self) -> List[Union[int, float]]:
+        return [self.value]
@@ -19,6 +19,12 @@ class Person:
     def kind(self):
         return "person"
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, (Person, Team)) and (self.kind, self.id) == (other.kind, other.id)
+
+    def __hash__(self) -> int:
+        return hash((self.kind, self.id))
+
 
 class Team:
     def __init__(self, id: int):
@@ -36,6 +42,12 @@ class Team:
     def kind(self):
         return "team"
 
+    def __eq__(self, other) -> bool:
+        return isinstance(other, (Person, Team)) and (self.kind, self.id) == (other.kind, other.id)
+
+    def __hash__(self) -> int:
+        return hash((self.kind, self.id))
+
 
 class PeopleField(Field):
     __monday_field_type__ = "multiple-person"
@@ -64,6 +76,14 @@ class PeopleField(Field):
 
         self.value = value
 
+    def filter_representation(self) -> List[str]:
+        # A lookup can be a single person or team as well
+        value = [self.value] if isinstance(self.value, (Person, Team)) else self.value or ()
+        return [f"{x.kind}-{x.id}" for x in value]
+
+    def copy_value(self, value: List[Union[Person, Team]]) -> List[Union[Person, Team]]:
+        return [type(x)(x.id) for x in value] if value is not None else None
+
     def __str__(self):
         attrs = (
             ", ".join("{}: {}".format(x.kind, x.id) for x in self.value)
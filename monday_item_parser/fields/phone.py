@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict
 
-from .field import Field
+from .field import Field, shallow_copy
 from .helpers import get_available_countries
 
 
@@ -58,3 +58,6 @@ class PhoneField(Field):
 
     def search_representation(self) -> str:
         return str(self.value.phone)
+
+    def copy_value(self, value: Phone) -> Phone:
+        return shallow_copy(value)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 from .field import Field
 
@@ -21,8 +21,6 @@ class StatusField(Field):
         if not data:
             self.value = None
             return
-        
-        print(data)
 
         for key in StatusField.__type_to_field_name__.values():
             if key in data:
@@ -46,6 +44,14 @@ class StatusField(Field):
 
         return str(self.value)
 
+    def filter_representation(self) -> List[Union[str, int]]:
+        if self.value is None:
+            raise ValueError("Can not filter statuses by empty value")
+
+        # Unlike the search, monday filters statuses by the index of their label
+        # (the labels of the lookups are replaced by their index, see `lookups.lookup_field`)
+        return [self.value]
+
 
 class StatusLabelField(Field):
     __monday_field_type__ = "color"
@@ -14,3 +14,10 @@ class TagsField(Field):
 
     def from_monday_dict(self, data: Dict[str, Any]):
         self.value = data["tag_ids"] if data else None
+
+    def filter_representation(self) -> List[int]:
+        # A lookup can be a single tag id as well
+        return [self.value] if isinstance(self.value, int) else list(self.value or ())
+
+    def copy_value(self, value: List[int]) -> List[int]:
+        return list(value) if value is not None else None
@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict
 
-from .field import Field
+from .field import Field, shallow_copy
+from .helpers import format_date, parse_date
 
 
 @dataclass
@@ -11,10 +12,7 @@ class Timeline:
     end: datetime = None
 
     def __str__(self):
-        return "{} -> {}".format(
-            self.start.strftime("%Y-%m-%d"),
-            self.end.strftime("%Y-%m-%d"),
-        )
+        return "{} -> {}".format(format_date(self.start), format_date(self.end))
 
 
 class TimelineField(Field):
@@ -26,8 +24,8 @@ class TimelineField(Field):
     def to_monday_dict(self):
         return (
             {
-                "from": self.value.start.strftime("%Y-%m-%d"),
-                "to": self.value.end.strftime("%Y-%m-%d"),
+                "from": format_date(self.value.start),
+                "to": format_date(self.value.end),
             }
             if self.value and self.value.start and self.value.end
             else {}
@@ -39,12 +37,12 @@ class TimelineField(Field):
             return
 
         self.value = Timeline(
-            start=datetime.strptime(data["from"], "%Y-%m-%d"),
-            end=datetime.strptime(data["to"], "%Y-%m-%d"),
+            start=parse_date(data["from"]),
+            end=parse_date(data["to"]),
         )
 
+    def copy_value(self, value: Timeline) -> Timeline:
+        return shallow_copy(value)
+
     def search_representation(self) -> str:
-        return "{} - {}".format(
-            self.value.start.strftime("%Y-%m-%d"),
-            self.value.end.strftime("%Y-%m-%d"),
-        )
+        return "{} - {}".format(format_date(self.value.start), format_date(self.value.end))
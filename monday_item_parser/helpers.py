@@ -1,8 +1,14 @@
 import inspect
+import queue
+import threading
+
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
 
 from .exceptions import MondayClientError
 
 
+T = TypeVar("T")
+
 def as_type(obj):
     return obj if inspect.isclass(obj) else type(obj)
 
@@ -19,3 +25,67 @@ def raise_monday_errors(response):
         errors = [error["message"] if "message" in error else error for error in response["errors"]]
 
         raise MondayClientError("Got error from monday client", errors)
+
+
+def monday_errors_by_alias(response) -> Dict[Optional[str], List[str]]:
+    """
+    Group the errors of a (partially) failed response by the alias of the field that failed.
+    Errors that aren't related to a specific field are grouped under None.
+    """
+
+    errors = {}
+
+    for error in response.get("errors", ()) if isinstance(response, dict) else ():
+        path = error.get("path") if isinstance(error, dict) else None
+        alias = path[0] if path else None
+        errors.setdefault(alias, []).append(error["message"] if "message" in error else error)
+
+    return errors
+
+
+def prefetch_iterator(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """
+    Consume `iterable` on a worker thread, keeping up to `depth` values ready ahead of the caller.
+    Exceptions raised by the iterable are re-raised in the caller's thread.
+    """
+
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    done = object()
+
+    def put(value) -> bool:
+        # Wait for room in the buffer, but give up if the caller stopped iterating
+        while not stopped.is_set():
+            try:
+                buffer.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def worker():
+        try:
+            for value in iterable:
+                if not put((value, None)):
+                    return
+        except BaseException as exc:
+            put((done, exc))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=worker, name="monday-item-parser-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            value, exc = buffer.get()
+            if value is done:
+                if exc is not None:
+                    raise exc
+
+                return
+
+            yield value
+    finally:
+        stopped.set()
@@ -2,15 +2,101 @@ from __future__ import annotations
 
 import copy
 import inspect
-import json
+import threading
+import weakref
 
 from bidict import bidict
-from contextlib import suppress
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from monday import MondayClient
 
-from .helpers import as_type, as_obj, raise_monday_errors
-from .fields import Field
+from .collection import ItemCollection
+from .columns import decode_columns
+from .sync import SyncResult, sync_items
+from .exceptions import MondayClientError
+from .item_cache import ItemCache
+from .local_mirror import LocalMirror
+from .lookups import lookup_field, parse_lookup
+from .json_codec import get_json_codec
+from .helpers import as_type, as_obj, monday_errors_by_alias, prefetch_iterator, raise_monday_errors
+from .fields import Field, StatusField
+from .complexity import ComplexityScheduler
+from .schema_cache import BoardSchemaCache
+from .transport import MondayClientTransport, Transport
+from .queries import (
+    MAX_ITEMS_BY_IDS,
+    MAX_ITEMS_PAGE_SIZE,
+    aliased_mutation,
+    board_columns_query,
+    board_groups_query,
+    board_items_query,
+    change_multiple_column_values_field,
+    change_multiple_column_values_mutation,
+    create_item_field,
+    create_item_mutation,
+    delete_item_field,
+    delete_item_mutation,
+    items_by_column_values_query,
+    items_page_by_column_values_query,
+    items_page_query,
+    items_query,
+    next_items_page_query,
+    projected_item_fields,
+    query_params,
+    query_rule,
+    validate_page_size,
+)
+
+
+# The default amount of mutations sent in a single request by the bulk methods (like `Item::create_items`)
+DEFAULT_MUTATIONS_BATCH_SIZE = 50
+
+# A single mutation sent by the bulk methods: (item, mutation field, callback on success with the mutation result)
+Mutation = Tuple["Item", str, Callable[[Dict[str, Any]], None]]
+
+# The positional arguments of the `__init__` of every item class (inspecting the signature is slow)
+_positional_init_args_cache = weakref.WeakKeyDictionary()
+
+# The `query_params` rule operators of the lookup operators (see `lookups.parse_lookup`)
+_FILTER_RULE_OPERATORS = {
+    "eq": "any_of",
+    "in": "any_of",
+    "ne": "not_any_of",
+    "gt": "greater_than",
+    "gte": "greater_than_or_equals",
+    "lt": "lower_than",
+    "lte": "lower_than_or_equal",
+    "between": "between",
+}
+
+# Makes sure lazy board schemas are loaded only once, even if the first use is from multiple threads
+_board_schema_lock = threading.Lock()
+
+
+def _positional_init_args(item_class) -> List[str]:
+    """
+    :return: The names of the positional (required) arguments of the item class `__init__`
+    """
+
+    if item_class not in _positional_init_args_cache:
+        positional_args = []
+
+        # if the class is a subclass of Item (and not Item)
+        if item_class is not Item:
+            # Skip `self`
+            parameters = list(inspect.signature(item_class.__init__).parameters.items())[1:]
+
+            for name, param in parameters:
+                # Check if the param is positional (required)
+                if (
+                    param.default == inspect.Parameter.empty
+                    and param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+                ):
+                    positional_args.append(name)
+
+        _positional_init_args_cache[item_class] = positional_args
+
+    return _positional_init_args_cache[item_class]
 
 
 class ItemMeta(type):
@@ -20,11 +106,21 @@ class ItemMeta(type):
         "_field_names",
         "_board_id",
         "_monday_field_names",
+        "_item_fields",
+        "_decode_plan",
+        "_status_labels",
+        "_schema_cache",
+        "_scheduler",
+        "_item_cache",
+        "_local_mirror",
+        "_transport",
+        "_ignore_unused_fields",
         "_group_id",
         "_group_title",
         "_item_name",
         "_item_id",
         "_unsaved_item_name",
+        "_observers",
         # Properties from the Item class
         "fields",
         "board_id",
@@ -41,9 +137,17 @@ class ItemMeta(type):
         monday_client: Optional[MondayClient] = None,
         board_id: Optional[int] = None,
         ignore_unused_fields: Optional[bool] = False,
+        abstract: Optional[bool] = False,
+        schema_cache: Optional[BoardSchemaCache] = None,
+        lazy_schema: Optional[bool] = False,
+        scheduler: Optional[ComplexityScheduler] = None,
+        item_cache: Optional[ItemCache] = None,
+        local_mirror: Optional[LocalMirror] = None,
+        transport: Optional[Transport] = None,
     ):
-        # Check if metaclass is running for class Item itself, in which case, it won't have any fields
-        if not bases:
+        # Check if metaclass is running for class Item itself (or for another abstract base such as `AsyncItem`),
+        # in which case, it won't have any fields
+        if not bases or abstract:
             return super().__new__(mcs, name, bases, attributes)
 
         # Validate that all of the attribute names are valid
@@ -52,10 +156,10 @@ class ItemMeta(type):
                 raise AttributeError(f"Attribute name {field_name} is invalid for an Item derive!")
 
         # If metaclass isn't running for the class `Item` itself
-        # it must include `monday_client` and `board_id` as parameters
-        if not monday_client:
+        # it must include `monday_client` (or a `transport` to send the requests with) and `board_id` as parameters
+        if not monday_client and not transport:
             raise AttributeError(
-                f"`monday_client` must be provided as parameter for Item derived class `{name}`"
+                f"`monday_client` or `transport` must be provided as parameter for Item derived class `{name}`"
             )
 
         if not board_id:
@@ -63,12 +167,16 @@ class ItemMeta(type):
 
         attributes["_board_id"] = board_id
         attributes["_monday_client"] = monday_client
+        attributes["_transport"] = transport or MondayClientTransport(monday_client)
+        attributes["_schema_cache"] = schema_cache
+        attributes["_scheduler"] = scheduler
+        attributes["_item_cache"] = item_cache
+        attributes["_local_mirror"] = local_mirror
+        attributes["_ignore_unused_fields"] = ignore_unused_fields
         attributes["_frozen"] = False
 
         # Save all of the fields under the `_field_names` attribute
-        # and create a backup of them under the _backup_fields
         attributes["_field_names"] = []
-        attributes["_backup_fields"] = {}
 
         for field_name, field_obj in attributes.items():
             # Ignore attributes that arent fields
@@ -78,64 +186,169 @@ class ItemMeta(type):
             # Convert to object (this is for non-instansiated Fields)
             field_obj = as_obj(field_obj)
             attributes["_field_names"].append(field_name)
-            attributes["_backup_fields"][field_name] = copy.deepcopy(field_obj)
             attributes[field_name] = field_obj
 
+        # Add some metadata for the monday fields to the attributes
+        attributes["_item_name"] = None
+        attributes["_item_id"] = None
+        attributes["_group_id"] = None
+        attributes["_group_title"] = None
+        attributes["_unsaved_item_name"] = None
+        attributes["_updated_fields"] = []
+
+        # With `lazy_schema` the board columns are loaded (and validated) on the first use of the class instead
+        attributes["_monday_field_names"] = None
+        attributes["_item_fields"] = None
+        attributes["_decode_plan"] = None
+        attributes["_status_labels"] = None
+
+        cls = super().__new__(mcs, name, bases, attributes)
+
+        if not lazy_schema:
+            cls._load_board_schema()
+
+        return cls
+
+    def _ensure_board_schema(cls):
+        if cls._monday_field_names is None:
+            with _board_schema_lock:
+                if cls._monday_field_names is None:
+                    cls._load_board_schema()
+
+    def _load_board_schema(cls, refresh: bool = False):
+        """
+        Map the item fields to the monday board columns (and validate their types).
+        The columns are taken from the schema cache when there is one, and fetched from monday
+        on a cache miss, on an explicit `refresh`, or when the cached columns don't match the fields.
+        """
+
+        columns = None if refresh or not cls._schema_cache else cls._schema_cache.get(cls._board_id)
+
+        if columns is not None:
+            try:
+                cls._set_monday_field_names(cls._resolve_monday_field_names(columns), columns)
+                return
+            except AttributeError:
+                # The cached schema doesn't match the item fields (or lacks the status labels), it might be outdated
+                pass
+
+        columns = cls._fetch_board_columns()
+
+        if cls._schema_cache:
+            cls._schema_cache.set(cls._board_id, columns)
+
+        cls._set_monday_field_names(cls._resolve_monday_field_names(columns), columns)
+
+    def _set_monday_field_names(cls, monday_field_names: bidict, columns: List[Dict[str, str]]):
+        # Everything `from_monday_dictionary` needs to know about a column is known once the board schema is loaded:
+        # the column id is mapped to the name of its field, and whether the field is parsed from the text or the value
+        decode_plan = {}
+        value_column_ids, text_column_ids = [], []
+
+        for field_name, monday_id in monday_field_names.items():
+            using_text = bool(getattr(getattr(cls, field_name), "__use_text_instead_of_value__", False))
+            decode_plan[monday_id] = (field_name, using_text)
+
+            # Request only the columns of the item, and for each of them only the part its field is parsed from
+            if using_text:
+                text_column_ids.append(monday_id)
+            else:
+                value_column_ids.append(monday_id)
+
+        cls._decode_plan = decode_plan
+        cls._item_fields = projected_item_fields(value_column_ids, text_column_ids)
+        cls._status_labels = cls._resolve_status_labels(monday_field_names, columns)
+
+        # Set last, since it marks the schema as loaded for other threads
+        cls._monday_field_names = monday_field_names
+
+    def _resolve_monday_field_names(cls, columns: List[Dict[str, str]]) -> bidict:
         # Iterate over all of the fields in the monday board and save the field names
         # and id's in a bidict, the reason I use a bidict is so it will be easy
         # to get the monday field id from the column name and vice versa.
-        attributes["_monday_field_names"] = bidict()
-
-        board_data = monday_client.boards.fetch_boards_by_id([board_id])
+        monday_field_names = bidict()
 
-        # Check if the request succeed
-        raise_monday_errors(board_data)
-
-        for field_data in board_data["data"]["boards"][0]["columns"]:
+        for field_data in columns:
             # Replace the field name from the monday board to be lowercase
             # and replace spaces into underscores
             # (so "My Example Column" will become "my_example_column")
             field_name = field_data["title"].lower().replace(" ", "_")
 
             # If we didn't found this field in our attributes just don't add it
-            if field_name not in attributes:
+            if field_name not in cls._field_names:
                 continue
 
             # Validate that the field type is the same as the expected field type
             # declared in the item class
             actual_field_type = field_data["type"].lower()
-            expcted_field_type = attributes[field_name].__monday_field_type__
+            expcted_field_type = getattr(cls, field_name).__monday_field_type__
             if actual_field_type != expcted_field_type:
                 raise AttributeError(
-                    f"'{name}::{field_name}' should be of type '{expcted_field_type}' but got '{actual_field_type}'"
+                    f"'{cls.__name__}::{field_name}' should be of type '{expcted_field_type}' but got '{actual_field_type}'"
                 )
 
             # Save the field name & id
-            attributes["_monday_field_names"][field_name] = field_data["id"]
+            monday_field_names[field_name] = field_data["id"]
 
         # Iterate again over the item fields and check if there are
         # fields that aren't in use
-        if not ignore_unused_fields:
-            for field_name in attributes["_field_names"]:
-                if field_name not in attributes["_monday_field_names"]:
-                    raise AttributeError(f"'{name}::{field_name}' is declared but not used by the monday api")
+        if not cls._ignore_unused_fields:
+            for field_name in cls._field_names:
+                if field_name not in monday_field_names:
+                    raise AttributeError(f"'{cls.__name__}::{field_name}' is declared but not used by the monday api")
 
-        # Add some metadata for the monday fields to the attributes
-        attributes["_item_name"] = None
-        attributes["_item_id"] = None
-        attributes["_group_id"] = None
-        attributes["_group_title"] = None
-        attributes["_unsaved_item_name"] = None
-        attributes["_updated_fields"] = []
+        return monday_field_names
+
+    def _resolve_status_labels(
+        cls, monday_field_names: bidict, columns: List[Dict[str, str]]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        :return: The index of every label of the status fields (`StatusField` values are label indexes), by field name
+        """
+
+        status_labels = {}
+
+        for column in columns:
+            field_name = monday_field_names.inverse.get(column["id"])
+            if field_name is None or not isinstance(getattr(cls, field_name), StatusField):
+                continue
+
+            # Schemas cached before the settings were requested have no labels, they are fetched again
+            if "settings_str" not in column:
+                raise AttributeError(f"The column of '{cls.__name__}::{field_name}' has no settings (status labels)")
 
-        return super().__new__(mcs, name, bases, attributes)
+            settings = get_json_codec().loads(column["settings_str"] or "{}")
+            status_labels[field_name] = {label: int(index) for index, label in (settings.get("labels") or {}).items()}
+
+        return status_labels
+
+    def _status_label_index(cls, field_name: str, label: str) -> int:
+        """
+        :return: The index of a label of a status field, by the settings of its column
+        """
+
+        cls._ensure_board_schema()
+
+        labels = cls._status_labels.get(field_name) or {}
+        if label not in labels:
+            raise ValueError(
+                f"'{cls.__name__}::{field_name}' has no status label {label!r} "
+                f"(if it was added recently, call `refresh_board_schema`)"
+            )
+
+        return labels[label]
+
+    def _fetch_board_columns(cls) -> List[Dict[str, str]]:
+        board_data = cls._execute_query(board_columns_query(cls._board_id))
+        return board_data["data"]["boards"][0]["columns"]
 
 
 class Item(metaclass=ItemMeta):
     _field_names: List[str]
-    _backup_fields: Dict[str, Field]
+    _backup_values: Dict[str, Any]
     _board_id: int
     _monday_client: MondayClient
+    _transport: Transport
     _monday_field_names: bidict
     _item_name: str
     _item_id: int
@@ -143,11 +356,16 @@ class Item(metaclass=ItemMeta):
     _group_id: str
     _group_title: str
     _frozen: bool
+    # Called with (item, field name) when a field is set through the item (see `ItemCollection`)
+    _observers: Tuple[Callable[[Item, str], None], ...] = ()
 
     @property
-    def _changed_fields(self) -> Iterable[Field]:
+    def _changed_fields(self) -> Iterable[str]:
+        # Only the fields that have been assigned (or hold mutable values) are compared to the backup
         return (
-            name for name in self._field_names if getattr(self, name).value != self._backup_fields[name].value
+            name
+            for name, field in self
+            if field.might_have_changed and field.value != self._backup_values[name]
         )
 
     @property
@@ -160,17 +378,7 @@ class Item(metaclass=ItemMeta):
 
     def __init__(self, *args, **kwargs):
         # Create a list of all the positional (required) arguments
-        positional_args = []
-
-        # if self is a subclass of Item (and not Item)
-        if type(self) is not Item:
-            for name, param in inspect.signature(self.__init__).parameters.items():
-                # Check if the param is positional (required)
-                if (
-                    param.default == inspect.Parameter.empty
-                    and param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
-                ):
-                    positional_args.append(name)
+        positional_args = _positional_init_args(type(self))
 
         if len(args) != len(positional_args):
             raise ValueError(
@@ -178,9 +386,15 @@ class Item(metaclass=ItemMeta):
                 "Expected arguments: {} but {} given.".format(positional_args, len(args))
             )
 
-        # Deepcopy the fields so different instances of Item have unique fields
-        for name, field in self:
-            setattr(self, name, copy.deepcopy(field))
+        # The values of the fields when the item was created/fetched/saved, so we will know what have been changed
+        self._backup_values = {}
+
+        # Clone the fields so different instances of Item have unique fields
+        for name in self._field_names:
+            field = getattr(type(self), name)
+            super().__setattr__(name, field.clone())
+            self._backup_values[name] = field.copy_value(field.value)
+            self.invoke_field_update_hooks(field)
 
         for k, v in kwargs.items():
             if k not in self._field_names:
@@ -194,6 +408,8 @@ class Item(metaclass=ItemMeta):
         super().__init__()
 
     def __str__(self):
+        type(self)._ensure_board_schema()
+
         x = [
             f"\x1b[32m{self.__class__.__qualname__}\x1b[0m "
             f"(\x1b[32mId:\x1b[0m {self._item_id} | \x1b[32mName:\x1b[0m {self._item_name} | \x1b[32mGroup:\x1b[0m {self._group_title} <{self._group_id}>):"
@@ -237,16 +453,19 @@ class Item(metaclass=ItemMeta):
             field = getattr(self, key)
             field.value = value
             self.invoke_field_update_hooks(field)
+            self._notify_observers(key)
         elif key in self._field_names:
             # Overriding the field so we must save the hooks attribute and set them
             # after we update the field
             field = getattr(self, key)
             hooks = getattr(field, "_value_update_hooks", [])
+            value._dirty = True
             super().__setattr__(key, value)
             setattr(field, "_value_update_hooks", hooks)
 
             # Invoke the field hooks because the value has been changed
             self.invoke_field_update_hooks(field)
+            self._notify_observers(key)
         elif hasattr(self, key) or not self._frozen:
             super().__setattr__(key, value)
         else:
@@ -254,6 +473,14 @@ class Item(metaclass=ItemMeta):
                 f"Monday fields attributes can not be changed! ({self.__class__.__qualname__}:{key})"
             )
 
+    @classmethod
+    def refresh_board_schema(cls):
+        """
+        Fetch the board columns from monday again (updating the schema cache if there is one)
+        """
+
+        cls._load_board_schema(refresh=True)
+
     @property
     def item_id(self):
         return self._item_id
@@ -275,70 +502,235 @@ class Item(metaclass=ItemMeta):
         return self._group_title
 
     def duplicate_item(self) -> Item:
+        item = self._duplicate()
+        item.create_item(self._group_id)
+        return item
+
+    def _duplicate(self) -> Item:
         if not self._item_id:
             raise AttributeError(f"Can not duplicate item that wasn't fetched from the server")
 
-        item = copy.deepcopy(self)
+        # The observers (like collections holding this item) aren't copied with it
+        observers = self.__dict__.pop("_observers", None)
+        try:
+            item = copy.deepcopy(self)
+        finally:
+            if observers is not None:
+                self.__dict__["_observers"] = observers
+
         item._item_id = None
-        item.create_item(self._group_id)
         return item
 
     def create_item(self, group_id: str):
+        column_values = self._create_column_values()
+
+        # Create the item
+        response = self._execute_query(
+            create_item_mutation(self._board_id, group_id, self._unsaved_item_name, column_values)
+        )
+
+        self._item_created(response["data"]["create_item"]["id"], group_id)
+
+    def update_item(self):
+        column_values = self._update_column_values()
+
+        if column_values is None:
+            # No need to update anything if there are no changes
+            return
+
+        # Update the item in the monday board
+        self._execute_query(change_multiple_column_values_mutation(self._board_id, self.item_id, column_values))
+
+        self._item_updated()
+
+    def delete_item(self):
+        self._validate_item_exists()
+
+        self._execute_query(delete_item_mutation(self.item_id))
+
+        self._item_deleted()
+
+    @classmethod
+    def create_items(
+        cls, items: Iterable[Item], group_id: str, batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Create many items, sending up to `batch_size` mutations in a single request.
+
+        :return: The items that failed along with their errors (the rest of the items are created)
+        """
+
+        return cls._execute_mutations([item._create_mutation(group_id) for item in items], batch_size)
+
+    @classmethod
+    def update_items(
+        cls, items: Iterable[Item], batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Update many items (only the changed ones), sending up to `batch_size` mutations in a single request.
+
+        :return: The items that failed along with their errors (the rest of the items are updated)
+        """
+
+        mutations = (item._update_mutation() for item in items)
+        return cls._execute_mutations([mutation for mutation in mutations if mutation is not None], batch_size)
+
+    @classmethod
+    def delete_items(
+        cls, items: Iterable[Item], batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE
+    ) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Delete many items, sending up to `batch_size` mutations in a single request.
+
+        :return: The items that failed along with their errors (the rest of the items are deleted)
+        """
+
+        return cls._execute_mutations([item._delete_mutation() for item in items], batch_size)
+
+    def _create_mutation(self, group_id: str) -> Mutation:
+        column_values = self._create_column_values()
+
+        return (
+            self,
+            create_item_field(self._board_id, group_id, self._unsaved_item_name, column_values),
+            lambda data: self._item_created(data["id"], group_id),
+        )
+
+    def _update_mutation(self) -> Optional[Mutation]:
+        column_values = self._update_column_values()
+
+        if column_values is None:
+            # No need to update anything if there are no changes
+            return None
+
+        return (
+            self,
+            change_multiple_column_values_field(self._board_id, self.item_id, column_values),
+            lambda data: self._item_updated(),
+        )
+
+    def _delete_mutation(self) -> Mutation:
+        self._validate_item_exists()
+
+        return self, delete_item_field(self.item_id), lambda data: self._item_deleted()
+
+    @classmethod
+    def _execute_mutations(cls, mutations: List[Mutation], batch_size: int) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Send the mutations in batches, every mutation under its own alias, and map the results back to the items.
+        A failed mutation doesn't fail the rest of the batch.
+
+        :param mutations:   List of (item, mutation field, on success callback) tuples, the callback is
+                            called with the result of the mutation
+        :return:            List of (item, error) tuples for the failed mutations
+        """
+
+        failures = []
+
+        for batch in cls._mutation_batches(mutations, batch_size):
+            response = cls._execute_query(
+                aliased_mutation({alias: field for alias, (_, field, _) in batch.items()}), raise_errors=False
+            )
+            failures.extend(cls._mutation_results(batch, response))
+
+        return failures
+
+    @staticmethod
+    def _mutation_batches(mutations: List[Mutation], batch_size: int) -> Iterator[Dict[str, Mutation]]:
+        """
+        :return: Iterator of batches of up to `batch_size` mutations, every mutation under its own alias
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        for i in range(0, len(mutations), batch_size):
+            yield {f"item_{index}": mutation for index, mutation in enumerate(mutations[i : i + batch_size])}
+
+    @staticmethod
+    def _mutation_results(batch: Dict[str, Mutation], response: Dict[str, Any]) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Call the callbacks of the mutations that succeeded
+
+        :return: List of (item, error) tuples for the failed mutations
+        """
+
+        results = (response.get("data") if isinstance(response, dict) else None) or {}
+        errors = monday_errors_by_alias(response)
+        failures = []
+
+        for alias, (item, _, on_success) in batch.items():
+            if results.get(alias) is not None:
+                on_success(results[alias])
+            else:
+                item_errors = errors.get(alias) or errors.get(None) or ["No result returned for the item"]
+                failures.append((item, MondayClientError("Got error from monday client", item_errors)))
+
+        return failures
+
+    def _create_column_values(self) -> Dict[str, Any]:
+        """
+        :return: The column values to send when creating this item
+        """
+
         if self.item_id:
             raise AttributeError(f"The item already exists (id = {self._item_id})")
 
-        # Get all the fields data
-        column_values = {
-            self._monday_field_names[field_name]: field.to_monday_dict()
-            for field_name, field in self
-            if field.to_monday_dict() is not None
-        }
+        type(self)._ensure_board_schema()
 
-        # Create the item
-        response = self._monday_client.items.create_item(
-            self._board_id, group_id, self._unsaved_item_name, column_values, create_labels_if_missing=True
-        )
+        # Get all the fields data
+        column_values = {}
+        for field_name, field in self:
+            value = field.to_monday_dict()
+            if value is not None:
+                column_values[self._monday_field_names[field_name]] = value
 
-        # Check if the request succeed
-        raise_monday_errors(response)
+        return column_values
 
-        # Validate that the creation succeed
-        self._item_id = response["data"]["create_item"]["id"]
+    def _item_created(self, item_id, group_id: str):
+        # Validate that the creation succeed (monday returns the ids as strings)
+        self._item_id = int(item_id)
+        self._invalidate_cached_item()
 
         # Update the backup so it will hold those values now
-        for field_name, field in self:
-            self._backup_fields[field_name] = copy.deepcopy(field)
+        self._save_backup()
 
         # Set the needed attributes after the create request
         self._item_name = self._unsaved_item_name
         self._unsaved_item_name = None
         self._group_id = group_id
 
-    def update_item(self):
+    def _update_column_values(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: The column values to send when updating this item, or None if nothing has been changed
+        """
+
         if not self.item_id:
             raise AttributeError(
                 "Can not update an item that wasn't fetch from the server. Did you mean `create_item`?"
             )
 
-        if not self.has_been_changed:
-            # No need to update anything if there are no changes
-            return
+        changed_fields = list(self._changed_fields)
+
+        if not changed_fields and not self._unsaved_item_name:
+            return None
+
+        type(self)._ensure_board_schema()
 
         # Get all the changed fields data (we wan't to update only what we change, not everything)
-        column_values = {
-            self._monday_field_names[field_name]: getattr(self, field_name).to_monday_dict()
-            for field_name in self._changed_fields
-            if getattr(self, field_name).to_monday_dict() is not None
-        }
+        column_values = {}
+        for field_name in changed_fields:
+            value = getattr(self, field_name).to_monday_dict()
+            if value is not None:
+                column_values[self._monday_field_names[field_name]] = value
 
         if self._unsaved_item_name:
             column_values["name"] = self._unsaved_item_name
 
-        # Update the item in the monday board
-        data = self._monday_client.items.change_multiple_column_values(
-            self._board_id, self.item_id, column_values, create_labels_if_missing=True
-        )
-        raise_monday_errors(data)
+        return column_values
+
+    def _item_updated(self):
+        self._invalidate_cached_item()
 
         # Update the name of the item
         if self._unsaved_item_name:
@@ -346,105 +738,465 @@ class Item(metaclass=ItemMeta):
             self._unsaved_item_name = None
 
         # Update the backup items
-        for field_name, field in self:
-            self._backup_fields[field_name] = copy.deepcopy(field)
+        self._save_backup()
 
-    def delete_item(self):
+    def _save_backup(self):
+        """
+        Snapshot the values of the changed fields, so from now on they are compared to their saved values
+        """
+
+        for field_name in list(self._changed_fields):
+            field = getattr(self, field_name)
+            self._backup_values[field_name] = field.copy_value(field.value)
+
+        for _, field in self:
+            field._dirty = False
+
+    def _validate_item_exists(self):
         if not self.item_id:
             raise AttributeError(
                 "Can not update an item that wasn't fetch from the server. Did you mean `create_item`?"
             )
 
-        data = self._monday_client.items.delete_item_by_id(self.item_id)
-
-        # Check if the request succeed
-        raise_monday_errors(data)
-
+    def _item_deleted(self):
+        self._invalidate_cached_item()
         self._unsaved_item_name = None
         self._item_id = None
 
     @classmethod
     def from_monday_dictionary(cls, data: Dict[str, Any]):
-        obj = cls()
-        obj._item_id = int(data["id"])
-        obj._item_name = data["name"]
-        obj._unsaved_item_name = None
-        obj._group_id = data["group"]["id"]
-        obj._group_title = data["group"]["title"]
+        cls._ensure_board_schema()
 
-        for column_data in data["column_values"]:
-            monday_id = column_data["id"]
+        decode_plan = cls._decode_plan
+        loads = get_json_codec().loads
 
-            # Check if the monday id is in our item dictionary
-            if monday_id not in obj._monday_field_names.inverse:
-                continue
+        obj = cls()
 
-            attribute_name = obj._monday_field_names.inverse[monday_id]
+        # The fields and the metadata live in the instance dictionary, set them directly instead of through `__setattr__`
+        attributes = obj.__dict__
+        attributes["_item_id"] = int(data["id"])
+        attributes["_item_name"] = data["name"]
+        attributes["_unsaved_item_name"] = None
+        attributes["_group_id"] = data["group"]["id"]
+        attributes["_group_title"] = data["group"]["title"]
+        backup_values = obj._backup_values
+
+        # Projected queries return the text columns apart from the value columns (see `projected_item_fields`)
+        for column_values in (data.get("column_values", ()), data.get("text_column_values", ())):
+            for column_data in column_values:
+                column = decode_plan.get(column_data["id"])
 
-            column_value = None
-            using_text = False
+                # Skip the columns that aren't in our item
+                if column is None:
+                    continue
 
-            with suppress(AttributeError):
-                if getattr(obj, attribute_name).__use_text_instead_of_value__:
-                    using_text = True
-                    column_value = column_data["text"] if column_data["text"] else None
+                attribute_name, using_text = column
 
-            # Load the data from the monday dictionary
-            if not using_text:
-                column_value = json.loads(column_data["value"]) if column_data["value"] else None
+                # Load the data from the monday dictionary
+                if using_text:
+                    column_value = column_data.get("text") or None
+                else:
+                    column_value = column_data.get("value")
+                    column_value = loads(column_value) if column_value else None
 
-            getattr(obj, attribute_name).from_monday_dict(column_value)
+                field = attributes[attribute_name]
+                field.from_monday_dict(column_value)
 
-            # Create a backup so we will know what have been changed
-            obj._backup_fields[attribute_name] = copy.deepcopy(getattr(obj, attribute_name))
+                # Create a backup so we will know what have been changed
+                backup_values[attribute_name] = field.copy_value(field.value)
+                field._dirty = False
 
         return obj
 
     @classmethod
-    def fetch_items_from_board(cls) -> Iterator[Item]:
-        board_data = cls._monday_client.boards.fetch_items_by_board_id([cls._board_id])
+    def get(cls, item_id: int) -> Optional[Item]:
+        """
+        Fetch a single item by its id, through the item cache of the class (the `item_cache` parameter) if it has one
+
+        :param item_id: The id of the item
+        :return:        The item, or None if the board has no such item
+        """
+
+        cls._ensure_board_schema()
+
+        data = cls._item_cache.get(cls._item_cache_key(item_id)) if cls._item_cache is not None else None
+
+        if data is None:
+            data = cls._cacheable_item_data(
+                cls._execute_query(items_query([item_id], cls._item_fields))["data"]["items"], item_id
+            )
+            if data is None:
+                return None
+
+        return cls.from_monday_dictionary(data)
+
+    @classmethod
+    def fetch_items_by_ids(
+        cls,
+        item_ids: Iterable[int],
+        chunk_size: int = MAX_ITEMS_BY_IDS,
+        max_workers: int = 1,
+        missing_ids: Optional[Set[int]] = None,
+    ) -> Iterator[Item]:
+        """
+        Fetch items by their ids, `chunk_size` ids per request (cached items aren't requested, see `get`):
+
+            missing_ids = set()
+            items = list(ExampleItem.fetch_items_by_ids(item_ids, max_workers=4, missing_ids=missing_ids))
+
+        :param item_ids:    The ids of the items (repeated ids are fetched once)
+        :param chunk_size:  The amount of ids requested in every request (up to 100)
+        :param max_workers: The amount of requests sent concurrently (on a pool of threads)
+        :param missing_ids: A set to add the ids that weren't found to (deleted items, or items of other boards)
+        :return:            Iterator of the found items, in the order of the ids
+        """
 
-        raise_monday_errors(board_data)
+        if not 0 < chunk_size <= MAX_ITEMS_BY_IDS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_ITEMS_BY_IDS}, got {chunk_size}")
+
+        cls._ensure_board_schema()
+
+        item_ids = list(dict.fromkeys(int(item_id) for item_id in item_ids))
+        found = {}
+
+        if cls._item_cache is not None:
+            for item_id in item_ids:
+                data = cls._item_cache.get(cls._item_cache_key(item_id))
+                if data is not None:
+                    found[item_id] = data
+
+        uncached_ids = [item_id for item_id in item_ids if item_id not in found]
+        chunks = [uncached_ids[i : i + chunk_size] for i in range(0, len(uncached_ids), chunk_size)]
+
+        def fetch_chunk(chunk: List[int]) -> Dict[int, Dict[str, Any]]:
+            return cls._cacheable_items_data(cls._execute_query(items_query(chunk, cls._item_fields))["data"]["items"])
+
+        if max_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                for chunk_data in executor.map(fetch_chunk, chunks):
+                    found.update(chunk_data)
+        else:
+            for chunk in chunks:
+                found.update(fetch_chunk(chunk))
+
+        for item_id in item_ids:
+            data = found.get(item_id)
+
+            if data is not None:
+                yield cls.from_monday_dictionary(data)
+            elif missing_ids is not None:
+                missing_ids.add(item_id)
+
+    @classmethod
+    def _cacheable_item_data(cls, items: List[Dict[str, Any]], item_id: int) -> Optional[Dict[str, Any]]:
+        """
+        :return: The raw item of this board from the response of an items query (saved to the item cache), if any
+        """
+
+        return cls._cacheable_items_data(items).get(int(item_id))
+
+    @classmethod
+    def _cacheable_items_data(cls, items: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        :return: The raw items of this board from the response of an items query by their ids (saved to the item cache)
+        """
+
+        items_data = {}
+
+        for data in items:
+            if str(data["board"]["id"]) == str(cls._board_id):
+                item_id = int(data["id"])
+                items_data[item_id] = data
+
+                if cls._item_cache is not None:
+                    cls._item_cache.set(cls._item_cache_key(item_id), data)
+
+        return items_data
+
+    @classmethod
+    def _item_cache_key(cls, item_id: int) -> str:
+        # Every item class requests its own columns, so the cached items are kept per class
+        return f"{cls.__module__}.{cls.__qualname__}:{cls._board_id}:{item_id}"
+
+    def _invalidate_cached_item(self):
+        if self._item_cache is not None and self._item_id:
+            self._item_cache.delete(self._item_cache_key(self._item_id))
+
+    @classmethod
+    def fetch_items_from_board(cls, page_size: Optional[int] = None, prefetch: int = 0) -> Iterator[Item]:
+        """
+        :param page_size:   When given, stream the board using monday's cursor pagination, fetching
+                            `page_size` items per request (up to 500), so only one page is held in memory
+                            and the first items are yielded after a single round trip.
+        :param prefetch:    Amount of pages to fetch ahead on a background thread while the caller is
+                            processing the current page (implies pagination).
+        :return:            Iterator of the items in the board
+        """
+
+        cls._ensure_board_schema()
+
+        if page_size is not None or prefetch:
+            yield from cls._items_from_pages(cls._fetch_item_pages(page_size or MAX_ITEMS_PAGE_SIZE), prefetch)
+            return
+
+        board_data = cls._execute_query(board_items_query(cls._board_id, cls._item_fields))
 
         for item in board_data["data"]["boards"][0]["items"]:
             yield cls.from_monday_dictionary(item)
 
     @classmethod
-    def fetch_items_by_column_value(cls, **kwargs):
+    def fetch_items_by_column_value(cls, *, page_size: Optional[int] = None, prefetch: int = 0, **kwargs):
+        """
+        :param page_size:   When given, fetch the matching items page by page (see `fetch_items_from_board`)
+        :param prefetch:    Amount of pages to fetch ahead on a background thread (implies pagination)
+        :param kwargs:      The field name and value to search by (several fields are matched
+                            with `fetch_items_by_filter`, which always paginates)
+        :return:            Iterator of the matching items
+        """
+
+        if len(kwargs) > 1:
+            yield from cls.fetch_items_by_filter(page_size=page_size or MAX_ITEMS_PAGE_SIZE, prefetch=prefetch, **kwargs)
+            return
+
+        monday_id, data = cls._search_column_value(**kwargs)
+
+        if page_size is not None or prefetch:
+            pages = cls._fetch_item_pages_by_column_value(monday_id, data, page_size or MAX_ITEMS_PAGE_SIZE)
+            yield from cls._items_from_pages(pages, prefetch)
+            return
+
+        items_data = cls._execute_query(items_by_column_values_query(cls._board_id, monday_id, data, cls._item_fields))
+
+        for item in items_data["data"]["items_by_column_values"]:
+            yield cls.from_monday_dictionary(item)
+
+    @classmethod
+    def fetch_items_by_filter(
+        cls, *, operator: str = "and", page_size: int = MAX_ITEMS_PAGE_SIZE, prefetch: int = 0, **lookups
+    ) -> Iterator[Item]:
+        """
+        Fetch only the items that match the lookups, filtered by monday (with the `query_params` of the items page):
+
+            ExampleItem.fetch_items_by_filter(status_example="Done", numbers_example__gte=5)
+            ExampleItem.fetch_items_by_filter(operator="or", status_example="Stuck", date_example__lt=date.today())
+
+        :param operator:    "and" to fetch the items that match all of the lookups, "or" for any of them
+        :param page_size:   The amount of items requested in every page (see `fetch_items_from_board`)
+        :param prefetch:    Amount of pages to fetch ahead on a background thread
+        :param lookups:     Field values with an optional operator (see `lookups.parse_lookup`),
+                            None matches the empty columns. Status labels are sent as their index.
+        :return:            Iterator of the matching items
+        """
+
+        cls._ensure_board_schema()
+
+        pages = cls._fetch_item_pages(page_size, query_params=cls._filter_query_params(operator, **lookups))
+        yield from cls._items_from_pages(pages, prefetch)
+
+    @classmethod
+    def _filter_query_params(cls, operator: str = "and", **lookups) -> Optional[str]:
+        """
+        :return: The `query_params` with a rule for every lookup (compared by the `filter_representation` of the fields)
+        """
+
+        rules = []
+
+        for lookup, value in lookups.items():
+            field_name, lookup_operator = parse_lookup(lookup)
+
+            if field_name not in cls._monday_field_names:
+                raise AttributeError("Invalid field to filter by {}".format(field_name))
+
+            column_id = cls._monday_field_names[field_name]
+
+            if value is None and lookup_operator in ("eq", "ne"):
+                rules.append(query_rule(column_id, "is_empty" if lookup_operator == "eq" else "is_not_empty"))
+                continue
+
+            values = value if lookup_operator in ("in", "between") else [value]
+            compare_value = [
+                compared
+                for v in values
+                for compared in lookup_field(cls, field_name, v).filter_representation()
+            ]
+            rules.append(query_rule(column_id, _FILTER_RULE_OPERATORS[lookup_operator], compare_value))
+
+        return query_params(rules, operator) if rules else None
+
+    @classmethod
+    def fetch_collection(
+        cls, hash_indexes: Iterable[str] = (), sorted_indexes: Iterable[str] = (), **kwargs
+    ) -> ItemCollection:
+        """
+        Fetch the items of the board into a collection that can be queried locally (see `ItemCollection`):
+
+            items = ExampleItem.fetch_collection(hash_indexes=["status_example"], sorted_indexes=["numbers_example"])
+            items.filter(status_example="Done", numbers_example__gte=5)
+
+        :param hash_indexes:    Fields to index for equality and membership lookups
+        :param sorted_indexes:  Fields to index for range lookups
+        :param kwargs:          Passed to `fetch_items_from_board` (like `page_size` and `prefetch`)
+        """
+
+        return ItemCollection(cls.fetch_items_from_board(**kwargs), hash_indexes, sorted_indexes)
+
+    @classmethod
+    def decode_columns(cls, pages: Iterable[List[Dict[str, Any]]], as_numpy: bool = False) -> Dict[str, Any]:
+        """
+        Decode pages of raw monday items into a list of values per field (and per item attribute:
+        `item_id`, `item_name`, `group_id` and `group_title`) without creating items.
+        See `columns.decode_columns` for the numpy arrays that `as_numpy` returns.
+        """
+
+        return decode_columns(cls, pages, as_numpy)
+
+    @classmethod
+    def fetch_columns(
+        cls, page_size: int = MAX_ITEMS_PAGE_SIZE, prefetch: int = 0, as_numpy: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fetch the whole board page by page and decode it into columns (see `decode_columns`)
+        """
+
+        cls._ensure_board_schema()
+
+        pages = cls._fetch_item_pages(page_size)
+        if prefetch:
+            pages = prefetch_iterator(pages, prefetch)
+
+        return cls.decode_columns(pages, as_numpy)
+
+    @classmethod
+    def sync_items(cls, state_path: str, page_size: int = MAX_ITEMS_PAGE_SIZE) -> SyncResult:
+        """
+        Fetch only the items that have been created, updated or deleted since the last sync
+        (the sync state is kept in the `state_path` JSON file, see `sync.sync_items`)
+        """
+
+        return sync_items(cls, state_path, page_size)
+
+    @classmethod
+    def sync_local(cls, page_size: int = MAX_ITEMS_PAGE_SIZE) -> Tuple[int, int, int]:
+        """
+        Bring the local mirror of the class (the `local_mirror` parameter) up to date with the board
+
+        :return: The amount of created, updated and deleted items
+        """
+
+        return cls._get_local_mirror().sync(cls, page_size)
+
+    @classmethod
+    def query_local(cls, **lookups) -> List[Item]:
+        """
+        Query the items in the local mirror of the class (see `LocalMirror::query`), without sending requests:
+
+            ExampleItem.query_local(status_example="Done", numbers_example__gt=5)
+        """
+
+        return cls._get_local_mirror().query(cls, **lookups)
+
+    @classmethod
+    def _get_local_mirror(cls) -> LocalMirror:
+        if cls._local_mirror is None:
+            raise AttributeError(f"'{cls.__name__}' has no local mirror, pass `local_mirror` to the class declaration")
+
+        return cls._local_mirror
+
+    @classmethod
+    def _search_column_value(cls, **kwargs) -> Tuple[str, str]:
+        """
+        :return: The monday id of the column to search by and the search representation of the value
+        """
+
+        cls._ensure_board_schema()
+
         field_name, field_value = next(iter(kwargs.items()))
 
         if field_name not in cls._monday_field_names:
             raise AttributeError("Invalid field to search by {}".format(field_name))
 
-        monday_id = cls._monday_field_names[field_name]
-        field_copy = copy.deepcopy(getattr(cls, field_name))
+        field_copy = getattr(cls, field_name).clone()
         field_copy.value = field_value
-        data = field_copy.search_representation()
+        return cls._monday_field_names[field_name], field_copy.search_representation()
 
-        items_data = cls._monday_client.items.fetch_items_by_column_value(cls._board_id, monday_id, data)
+    @classmethod
+    def _items_from_pages(cls, pages: Iterable[List[Dict[str, Any]]], prefetch: int = 0) -> Iterator[Item]:
+        if prefetch:
+            pages = prefetch_iterator(pages, prefetch)
 
-        # Check if the request succeed
-        raise_monday_errors(items_data)
+        for page in pages:
+            for item in page:
+                yield cls.from_monday_dictionary(item)
 
-        for item in items_data["data"]["items_by_column_values"]:
-            yield cls.from_monday_dictionary(item)
+    @classmethod
+    def _fetch_item_pages(
+        cls, page_size: int, item_fields: Optional[str] = None, query_params: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        :param item_fields:     The item attributes to request (the fields of the class by default)
+        :param query_params:    Filter the items of the board (see `items_page_query`)
+        :return:                Iterator of the raw items pages of the board, one request per page
+        """
+
+        validate_page_size(page_size)
+
+        item_fields = item_fields or cls._item_fields
+        data = cls._execute_query(items_page_query(cls._board_id, page_size, item_fields, query_params))
+        yield from cls._follow_items_pages(data["data"]["boards"][0]["items_page"], page_size, item_fields)
 
     @classmethod
-    def fetch_group_ids(cls) -> Iterator[str]:
-        groups_data = cls._monday_client.groups.get_groups_by_board([cls._board_id])
+    def _fetch_item_pages_by_column_value(
+        cls, monday_id: str, value: str, page_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        validate_page_size(page_size)
+
+        data = cls._execute_query(items_page_by_column_values_query(cls._board_id, monday_id, value, page_size, cls._item_fields))
+        yield from cls._follow_items_pages(data["data"]["items_page_by_column_values"], page_size)
+
+    @classmethod
+    def _follow_items_pages(
+        cls, items_page: Dict[str, Any], page_size: int, item_fields: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the items of the given page and keep requesting the next pages by their cursor
+        """
+
+        item_fields = item_fields or cls._item_fields
+
+        while True:
+            yield items_page["items"]
+
+            # monday returns an empty cursor after the last page
+            if not items_page.get("cursor"):
+                break
+
+            data = cls._execute_query(next_items_page_query(items_page["cursor"], page_size, item_fields))
+            items_page = data["data"]["next_items_page"]
+
+    @classmethod
+    def _execute_query(cls, query: str, raise_errors: bool = True) -> Dict[str, Any]:
+        if cls._scheduler:
+            # Requests with the same API token share the same complexity budget
+            data = cls._scheduler.execute(cls._transport.budget_key, cls._transport.execute, query)
+        else:
+            data = cls._transport.execute(query)
 
         # Check if the request succeed
-        raise_monday_errors(groups_data)
+        if raise_errors:
+            raise_monday_errors(data)
+
+        return data
+
+    @classmethod
+    def fetch_group_ids(cls) -> Iterator[str]:
+        groups_data = cls._execute_query(board_groups_query(cls._board_id))
 
         for group in groups_data["data"]["boards"][0]["groups"]:
             yield group["id"]
 
     @classmethod
     def fetch_groups(cls) -> Iterator[dict]:
-        groups_data = cls._monday_client.groups.get_groups_by_board([cls._board_id])
-
-        # Check if the request succeed
-        raise_monday_errors(groups_data)
+        groups_data = cls._execute_query(board_groups_query(cls._board_id))
 
         for group in groups_data["data"]["boards"][0]["groups"]:
             yield group["id"], group["title"]
@@ -453,6 +1205,17 @@ class Item(metaclass=ItemMeta):
         for f in getattr(field, "_value_update_hooks", ()):
             f(self)
 
+    def _add_observer(self, observer: Callable[[Item, str], None]):
+        # The observers are kept in the instance dictionary, the item attributes are frozen
+        self.__dict__["_observers"] = (*self._observers, observer)
+
+    def _remove_observer(self, observer: Callable[[Item, str], None]):
+        self.__dict__["_observers"] = tuple(o for o in self._observers if o != observer)
+
+    def _notify_observers(self, field_name: str):
+        for observer in self._observers:
+            observer(self, field_name)
+
     @classmethod
     def field_updated_hook(cls, field):
         def register_field_hook(func: callable):
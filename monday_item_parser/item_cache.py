@@ -0,0 +1,155 @@
+import abc
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from . import json_codec
+
+
+class ItemCache(abc.ABC):
+    """
+    Keeps raw monday items (as returned by the items queries) for `Item::get`, by a key of the item class,
+    board and item id. Items are invalidated when they are created, updated or deleted through their class.
+
+    Implementations provide `read`, `write`, `delete` and `clear`, the hits and misses are counted here.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.read(key)
+
+        with self._stats_lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]):
+        self.write(key, data)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @abc.abstractmethod
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        :return: The cached raw item, or None if it isn't cached (or has expired)
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def write(self, key: str, data: Dict[str, Any]):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self):
+        raise NotImplementedError
+
+
+class LRUItemCache(ItemCache):
+    """
+    An in-process cache that keeps up to `max_size` items, each for `ttl` seconds
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 60):
+        """
+        :param max_size:    The maximum amount of items to keep, the least recently used items are dropped first
+        :param ttl:         The amount of seconds an item is valid for, or None for no expiration
+        """
+
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+
+            expires_at, data = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return data
+
+    def write(self, key: str, data: Dict[str, Any]):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._items[key] = (expires_at, data)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class KeyValueItemCache(ItemCache):
+    """
+    Keeps the items as JSON in a key-value store with the API of a redis client
+    (`get(key)`, `set(key, value, ex=seconds)` and `delete(key)`), for example:
+
+        KeyValueItemCache(redis.Redis(), ttl=60)
+    """
+
+    def __init__(self, store, ttl: Optional[int] = 60, prefix: str = "monday-item:"):
+        """
+        :param store:   The key-value store
+        :param ttl:     The amount of seconds an item is valid for, or None for no expiration
+        :param prefix:  Added to the keys, so the items can share the store with other data
+        """
+
+        super().__init__()
+        self.store = store
+        self.ttl = ttl
+        self.prefix = prefix
+        self._keys = set()
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.store.get(self.prefix + key)
+        return json_codec.loads(data) if data is not None else None
+
+    def write(self, key: str, data: Dict[str, Any]):
+        self.store.set(self.prefix + key, json_codec.dumps(data), ex=self.ttl)
+        self._keys.add(key)
+
+    def delete(self, key: str):
+        self.store.delete(self.prefix + key)
+        self._keys.discard(key)
+
+    def clear(self):
+        """
+        Remove the items written by this cache (the store is shared, so other keys are left alone)
+        """
+
+        for key in list(self._keys):
+            self.delete(key)
@@ -0,0 +1,71 @@
+import json
+
+from typing import Any, Union
+
+
+class JsonCodec:
+    """
+    Encodes and decodes the JSON of the monday API (requests, responses and column values).
+    The library uses orjson when it is installed and the standard library otherwise,
+    another codec can be used with `set_json_codec`.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> str:
+        """
+        :return: The compact JSON representation of the value
+        """
+
+        return json.dumps(value, separators=(",", ":"))
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self.loads = orjson.loads
+
+    def dumps(self, value: Any) -> str:
+        try:
+            return self._orjson.dumps(value).decode()
+        except TypeError:
+            # orjson is stricter than the standard library (for example with non string keys)
+            return super().dumps(value)
+
+
+def _default_codec() -> JsonCodec:
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
+
+
+_codec: JsonCodec = _default_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    return _codec
+
+
+def set_json_codec(codec: JsonCodec):
+    """
+    Replace the JSON codec used by the library (for example `set_json_codec(JsonCodec())` to use the standard library)
+    """
+
+    global _codec
+    _codec = codec
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return _codec.loads(data)
+
+
+def dumps(value: Any) -> str:
+    return _codec.dumps(value)
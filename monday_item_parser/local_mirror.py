@@ -0,0 +1,271 @@
+import sqlite3
+import threading
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from . import json_codec
+from .fields import DropdownField, DropdownLabelField, Field, PeopleField, Person, Team, TagsField
+from .lookups import lookup_field, parse_lookup
+from .queries import MAX_ITEMS_PAGE_SIZE
+from .sync import SyncState, fetch_changes
+
+
+_SQL_OPERATORS = {"eq": "=", "ne": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+# Fields with many values, kept as JSON arrays (see `_column_value`)
+_MULTIPLE_VALUES_FIELDS = (PeopleField, TagsField, DropdownField, DropdownLabelField)
+
+
+class LocalMirror:
+    """
+    Keeps the items of boards in a SQLite database, so they can be queried locally
+    without sending requests to monday:
+
+        mirror = LocalMirror("boards.db", indexes=["status_example", "numbers_example"])
+
+        class ExampleItem(Item, monday_client=client, board_id=board_id, local_mirror=mirror):
+            ...
+
+        ExampleItem.sync_local()
+        ExampleItem.query_local(status_example="Done", numbers_example__gt=5)
+
+    Every item class has its own table, with a column for every field (holding the value of the field,
+    dates as ISO strings) and the raw item it was decoded from.
+    The mirror is kept up to date incrementally by `sync` (see `sync.fetch_changes`).
+
+    Statuses are compared by their label index (labels are looked up in the board settings), and fields with
+    many values (people, tags and dropdowns) match the items that have all of the given values.
+    """
+
+    def __init__(self, path: str = ":memory:", indexes: Iterable[str] = ()):
+        """
+        :param path:    The SQLite database file
+        :param indexes: Names of fields to index, in every table that has them
+        """
+
+        self.path = path
+        self.indexes = set(indexes)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._tables = set()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS "_sync_state" ("table_name" TEXT PRIMARY KEY, "state" TEXT NOT NULL)'
+            )
+
+    def sync(self, item_class, page_size: int = MAX_ITEMS_PAGE_SIZE) -> Tuple[int, int, int]:
+        """
+        Bring the table of the item class up to date with the board
+
+        :return: The amount of created, updated and deleted items
+        """
+
+        with self._lock:
+            table = self._table(item_class)
+            state = self._load_state(item_class, table)
+
+            created, updated, deleted = fetch_changes(item_class, state, page_size)
+
+            with self._connection:
+                self._upsert(item_class, table, created + updated)
+                self._connection.executemany(
+                    f'DELETE FROM "{table}" WHERE "item_id" = ?', [(item_id,) for item_id in deleted]
+                )
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO "_sync_state" ("table_name", "state") VALUES (?, ?)',
+                    (table, state.to_json()),
+                )
+
+        return len(created), len(updated), len(deleted)
+
+    def query(self, item_class, **lookups) -> List[Any]:
+        """
+        :param lookups: Field values to filter by, with an optional operator (see `lookups.parse_lookup`):
+                        `status_example="Done"`, `numbers_example__gt=5`, `text_example__in=["a", "b"]`.
+                        The values are compared as the values of the fields.
+        :return:        The matching items
+        """
+
+        conditions = []
+        parameters = []
+
+        for lookup, value in lookups.items():
+            field_name, operator = parse_lookup(lookup)
+
+            if field_name not in item_class._field_names:
+                raise AttributeError("Invalid field to query by {}".format(field_name))
+
+            if isinstance(getattr(item_class, field_name), _MULTIPLE_VALUES_FIELDS):
+                condition, condition_parameters = self._multiple_values_condition(
+                    item_class, field_name, operator, value
+                )
+                conditions.append(condition)
+                parameters.extend(condition_parameters)
+                continue
+
+            if operator == "in":
+                values = [self._lookup_value(item_class, field_name, v) for v in value]
+                conditions.append(f'"{field_name}" IN ({", ".join("?" * len(values))})')
+                parameters.extend(values)
+                continue
+
+            if operator == "between":
+                low, high = value
+                conditions.append(f'"{field_name}" BETWEEN ? AND ?')
+                parameters.extend(self._lookup_value(item_class, field_name, v) for v in (low, high))
+                continue
+
+            value = self._lookup_value(item_class, field_name, value)
+            if value is None:
+                conditions.append(f'"{field_name}" IS {"NOT " if operator == "ne" else ""}NULL')
+            else:
+                conditions.append(f'"{field_name}" {_SQL_OPERATORS[operator]} ?')
+                parameters.append(value)
+
+        with self._lock:
+            table = self._table(item_class)
+            where = f' WHERE {" AND ".join(conditions)}' if conditions else ""
+            rows = self._connection.execute(f'SELECT "data" FROM "{table}"{where} ORDER BY "item_id"', parameters)
+            data = [row[0] for row in rows]
+
+        return [item_class.from_monday_dictionary(json_codec.loads(item_data)) for item_data in data]
+
+    def clear(self, item_class):
+        """
+        Remove the items of the item class (the next sync fetches the whole board)
+        """
+
+        with self._lock:
+            table = self._table(item_class)
+
+            with self._connection:
+                self._connection.execute(f'DELETE FROM "{table}"')
+                self._connection.execute('DELETE FROM "_sync_state" WHERE "table_name" = ?', (table,))
+
+    def close(self):
+        self._connection.close()
+
+    def _table(self, item_class) -> str:
+        """
+        Create the table of the item class if needed (a table that doesn't match the fields is created again)
+
+        :return: The name of the table
+        """
+
+        item_class._ensure_board_schema()
+        table = f"{item_class.__name__}_{item_class._board_id}"
+        if table in self._tables:
+            return table
+
+        columns = ["item_id", "item_name", "group_id", "group_title", "data", *item_class._field_names]
+        existing_columns = [row[1] for row in self._connection.execute(f'PRAGMA table_info("{table}")')]
+
+        with self._connection:
+            if existing_columns and existing_columns != columns:
+                self._connection.execute(f'DROP TABLE "{table}"')
+                self._connection.execute('DELETE FROM "_sync_state" WHERE "table_name" = ?', (table,))
+
+            field_columns = "".join(f', "{field_name}"' for field_name in item_class._field_names)
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" ('
+                f'"item_id" INTEGER PRIMARY KEY, "item_name" TEXT, "group_id" TEXT, "group_title" TEXT, "data" TEXT NOT NULL'
+                f"{field_columns})"
+            )
+
+            for field_name in self.indexes.intersection(item_class._field_names):
+                self._connection.execute(f'CREATE INDEX IF NOT EXISTS "{table}_{field_name}" ON "{table}" ("{field_name}")')
+
+        self._tables.add(table)
+        return table
+
+    def _load_state(self, item_class, table: str) -> SyncState:
+        row = self._connection.execute('SELECT "state" FROM "_sync_state" WHERE "table_name" = ?', (table,)).fetchone()
+        return SyncState.from_json(row[0], item_class._board_id) if row else SyncState(item_class._board_id)
+
+    def _upsert(self, item_class, table: str, items: List[Dict[str, Any]]):
+        placeholders = ", ".join("?" * (5 + len(item_class._field_names)))
+        rows = []
+
+        for data in items:
+            item = item_class.from_monday_dictionary(data)
+            rows.append(
+                (
+                    item.item_id,
+                    item.item_name,
+                    item.group_id,
+                    item.group_title,
+                    json_codec.dumps(data),
+                    *(_column_value(field) for _, field in item),
+                )
+            )
+
+        self._connection.executemany(f'INSERT OR REPLACE INTO "{table}" VALUES ({placeholders})', rows)
+
+    @staticmethod
+    def _lookup_value(item_class, field_name: str, value: Any) -> Any:
+        return _column_value(lookup_field(item_class, field_name, value))
+
+    @staticmethod
+    def _multiple_values_condition(item_class, field_name: str, operator: str, value: Any) -> Tuple[str, List[Any]]:
+        """
+        :return: The condition (and its parameters) of a lookup on a field with many values: `eq` matches the
+                 items that have all of the given values (a single value or a list), `in` any of the given lookups
+        """
+
+        if operator not in ("eq", "ne", "in"):
+            raise TypeError(f"Fields with many values can't be compared by range ({field_name}__{operator})")
+
+        conditions, parameters = [], []
+
+        for lookup_value in value if operator == "in" else [value]:
+            lookup_value = lookup_field(item_class, field_name, lookup_value).value
+            if not isinstance(lookup_value, (list, tuple, set, frozenset)):
+                lookup_value = [] if lookup_value is None else [lookup_value]
+
+            if not lookup_value:
+                conditions.append(f'"{field_name}" IS NULL')
+                continue
+
+            contains = f'EXISTS (SELECT 1 FROM json_each("{field_name}") WHERE "value" = ?)'
+            conditions.append("(%s)" % " AND ".join([contains] * len(lookup_value)))
+            parameters.extend(_element_value(v) for v in lookup_value)
+
+        condition = "(%s)" % " OR ".join(conditions) if conditions else "0"
+        return f"NOT {condition}" if operator == "ne" else condition, parameters
+
+
+def _column_value(field: Field) -> Any:
+    """
+    The value of the field as it's stored in its column
+    """
+
+    value = field.value
+
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+
+    # Dates are kept as ISO strings (so they are ordered), with the time so dates and datetimes compare equally
+    if isinstance(value, (date, datetime)):
+        return _element_value(value)
+
+    # Many values are kept as a JSON array (NULL when empty), queried with `json_each`
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return json_codec.dumps([_element_value(v) for v in value]) if value else None
+
+    try:
+        return field.search_representation()
+    except AttributeError:
+        return str(value)
+
+
+def _element_value(value: Any) -> Any:
+    if isinstance(value, (Person, Team)):
+        return f"{value.kind}-{value.id}"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).isoformat()
+
+    return value
@@ -0,0 +1,44 @@
+from typing import Any, Tuple
+
+from .fields import Field, StatusField
+
+
+# The operators that can be added to a field name in a lookup (like `numbers_example__gt=5`),
+# `in` takes a list of values and `between` a (low, high) pair (both included)
+LOOKUP_OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in", "between")
+
+
+def parse_lookup(lookup: str) -> Tuple[str, str]:
+    """
+    Split a lookup keyword into the field name and the operator ("eq" when no operator is given):
+
+        parse_lookup("numbers_example__gte")  # ("numbers_example", "gte")
+        parse_lookup("status_example")        # ("status_example", "eq")
+    """
+
+    field_name, separator, operator = lookup.rpartition("__")
+
+    if separator and operator in LOOKUP_OPERATORS:
+        return field_name, operator
+
+    return lookup, "eq"
+
+
+def lookup_field(item_class, field_name: str, value: Any) -> Field:
+    """
+    Set the value of a lookup on a copy of the field of the item class,
+    so it's compared the same way the values of the items are.
+
+    Fetched `StatusField` values are label indexes, so a label is replaced by its index (by the board settings).
+    """
+
+    if field_name not in item_class._field_names:
+        raise AttributeError("Invalid field to query by {}".format(field_name))
+
+    field = getattr(item_class, field_name).clone()
+
+    if isinstance(field, StatusField) and isinstance(value, str):
+        value = item_class._status_label_index(field_name, value)
+
+    field.value = value
+    return field
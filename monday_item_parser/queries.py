@@ -0,0 +1,378 @@
+import re
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import json_codec
+
+
+# The maximum amount of items monday returns in a single `items_page` request
+MAX_ITEMS_PAGE_SIZE = 500
+
+# The maximum amount of ids monday accepts in a single `items` request
+MAX_ITEMS_BY_IDS = 100
+
+# The item attributes requested for every item we want to parse with `Item::from_monday_dictionary`
+ITEM_FIELDS = """
+    id
+    name
+    group {
+        id
+        title
+    }
+    column_values {
+        id
+        text
+        value
+    }
+"""
+
+
+def projected_item_fields(value_column_ids: Iterable[str], text_column_ids: Iterable[str]) -> str:
+    """
+    The item attributes requested for an item class: only its own columns, and for every column
+    only the part it's parsed from (`value` or `text`).
+    The `text` columns are requested under the `text_column_values` alias.
+    """
+
+    value_column_ids = list(value_column_ids)
+    text_column_ids = list(text_column_ids)
+
+    item_fields = """
+    id
+    name
+    group {
+        id
+        title
+    }
+"""
+
+    if value_column_ids:
+        item_fields += """    column_values (ids: %s) {
+        id
+        value
+    }
+""" % json_codec.dumps(value_column_ids)
+
+    if text_column_ids:
+        item_fields += """    text_column_values: column_values (ids: %s) {
+        id
+        text
+    }
+""" % json_codec.dumps(text_column_ids)
+
+    return item_fields
+
+
+# Requested when only the ids of the items are needed (like listing a board to find deleted items)
+ITEM_ID_FIELDS = """
+    id
+"""
+
+
+def validate_page_size(page_size: int):
+    if not 0 < page_size <= MAX_ITEMS_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_ITEMS_PAGE_SIZE}, got {page_size}")
+
+
+def items_page_query(
+    board_id: int, limit: int, item_fields: str = ITEM_FIELDS, query_params: Optional[str] = None
+) -> str:
+    """
+    Query for the first page of items of a board (Read more at https://developer.monday.com/api-reference/reference/items-page)
+
+    :param query_params: The `query_params` argument to filter the items by (see `updated_since_query_params`)
+    """
+
+    return """query {
+        boards (ids: [%s]) {
+            items_page (limit: %s%s) {
+                cursor
+                items { %s }
+            }
+        }
+    }""" % (
+        board_id,
+        limit,
+        f", query_params: {query_params}" if query_params else "",
+        item_fields,
+    )
+
+
+def query_rule(
+    column_id: str, operator: str, compare_value: Optional[List[Any]] = None, compare_attribute: Optional[str] = None
+) -> str:
+    """
+    A rule of the `query_params` of the items page query
+    (Read more at https://developer.monday.com/api-reference/reference/other-types#items-query-rule)
+
+    :param operator:            The rule operator, like "any_of", "greater_than" or "between"
+    :param compare_value:       The values to compare the column to (empty operators, like "is_empty", have none)
+    :param compare_attribute:   The attribute of the column to compare (like "UPDATED_AT" of the last updated column)
+    """
+
+    rule = "column_id: %s" % json_codec.dumps(column_id)
+
+    if compare_attribute:
+        rule += ", compare_attribute: %s" % json_codec.dumps(compare_attribute)
+
+    if compare_value is not None:
+        rule += ", compare_value: %s" % json_codec.dumps(compare_value)
+
+    return "{%s, operator: %s}" % (rule, operator)
+
+
+def query_params(rules: Iterable[str], operator: str = "and") -> str:
+    """
+    The `query_params` argument of the items page query (see `items_page_query`)
+
+    :param rules:       Rules created by `query_rule`
+    :param operator:    How the rules are combined, "and" or "or"
+    """
+
+    if operator not in ("and", "or"):
+        raise ValueError(f"Invalid rules operator {operator!r}, expected 'and' or 'or'")
+
+    return "{rules: [%s], operator: %s}" % (", ".join(rules), operator)
+
+
+def updated_since_query_params(day: str) -> str:
+    """
+    The `query_params` for the items that were updated on the given day ("YYYY-MM-DD") or after it
+    """
+
+    return query_params(
+        [query_rule("__last_updated__", "greater_than_or_equals", ["EXACT", day], compare_attribute="UPDATED_AT")]
+    )
+
+
+def board_items_query(board_id: int, item_fields: str = ITEM_FIELDS) -> str:
+    """
+    Query for all of the items of a board in a single request
+    """
+
+    return """query {
+        boards (ids: [%s]) {
+            items { %s }
+        }
+    }""" % (
+        board_id,
+        item_fields,
+    )
+
+
+def items_query(item_ids: Iterable[int], item_fields: str = ITEM_FIELDS) -> str:
+    """
+    Query for items by their ids (the board of every item is returned as well, items can be from any board).
+    Up to `MAX_ITEMS_BY_IDS` ids can be requested at once.
+    """
+
+    item_ids = list(item_ids)
+
+    # Without a limit monday returns only the first 25 items
+    return """query {
+        items (ids: [%s], limit: %s) {
+            board {
+                id
+            }
+            %s
+        }
+    }""" % (
+        ", ".join(str(item_id) for item_id in item_ids),
+        len(item_ids),
+        item_fields,
+    )
+
+
+def items_by_column_values_query(
+    board_id: int, column_id: str, column_value: str, item_fields: str = ITEM_FIELDS
+) -> str:
+    """
+    Query for all of the items that matches the column value in a single request
+    (Read more at https://api.developer.monday.com/docs/items-by-column-values-queries)
+    """
+
+    return """query {
+        items_by_column_values (board_id: %s, column_id: %s, column_value: %s) { %s }
+    }""" % (
+        board_id,
+        json_codec.dumps(column_id),
+        json_codec.dumps(column_value),
+        item_fields,
+    )
+
+
+def items_page_by_column_values_query(
+    board_id: int, column_id: str, column_value: str, limit: int, item_fields: str = ITEM_FIELDS
+) -> str:
+    """
+    Query for the first page of items that matches the column value
+    (Read more at https://developer.monday.com/api-reference/reference/items-page-by-column-values)
+    """
+
+    return """query {
+        items_page_by_column_values (board_id: %s, limit: %s, columns: [{column_id: %s, column_values: [%s]}]) {
+            cursor
+            items { %s }
+        }
+    }""" % (
+        board_id,
+        limit,
+        json_codec.dumps(column_id),
+        json_codec.dumps(column_value),
+        item_fields,
+    )
+
+
+def next_items_page_query(cursor: str, limit: Optional[int] = None, item_fields: str = ITEM_FIELDS) -> str:
+    """
+    Query for the next page of items using the cursor returned by the previous page
+    """
+
+    return """query {
+        next_items_page (cursor: %s%s) {
+            cursor
+            items { %s }
+        }
+    }""" % (
+        json_codec.dumps(cursor),
+        f", limit: {limit}" if limit else "",
+        item_fields,
+    )
+
+
+def board_columns_query(board_id: int) -> str:
+    # The settings hold the labels of the status columns (see `ItemMeta::_status_label_index`)
+    return """query {
+        boards (ids: [%s]) {
+            columns {
+                id
+                title
+                type
+                settings_str
+            }
+        }
+    }""" % board_id
+
+
+def board_groups_query(board_id: int) -> str:
+    return """query {
+        boards (ids: [%s]) {
+            groups {
+                id
+                title
+            }
+        }
+    }""" % board_id
+
+
+def create_item_mutation(
+    board_id: int,
+    group_id: str,
+    item_name: Optional[str],
+    column_values: Dict[str, Any],
+    create_labels_if_missing: bool = True,
+) -> str:
+    return aliased_mutation(
+        {"create_item": create_item_field(board_id, group_id, item_name, column_values, create_labels_if_missing)}
+    )
+
+
+def change_multiple_column_values_mutation(
+    board_id: int,
+    item_id: int,
+    column_values: Dict[str, Any],
+    create_labels_if_missing: bool = True,
+) -> str:
+    return aliased_mutation(
+        {
+            "change_multiple_column_values": change_multiple_column_values_field(
+                board_id, item_id, column_values, create_labels_if_missing
+            )
+        }
+    )
+
+
+def delete_item_mutation(item_id: int) -> str:
+    return aliased_mutation({"delete_item": delete_item_field(item_id)})
+
+
+def aliased_mutation(fields: Dict[str, str]) -> str:
+    """
+    Pack many mutation fields into a single GraphQL document, each one under its own alias,
+    so the result of every mutation can be found by its alias in the response data
+    """
+
+    return "mutation {\n%s\n}" % "\n".join(f"    {alias}: {field}" for alias, field in fields.items())
+
+
+def create_item_field(
+    board_id: int,
+    group_id: str,
+    item_name: Optional[str],
+    column_values: Dict[str, Any],
+    create_labels_if_missing: bool = True,
+) -> str:
+    return """create_item (
+        board_id: %s,
+        group_id: %s,
+        item_name: %s,
+        column_values: %s,
+        create_labels_if_missing: %s
+    ) {
+        id
+    }""" % (
+        board_id,
+        json_codec.dumps(group_id),
+        json_codec.dumps(item_name),
+        json_stringify(column_values),
+        str(create_labels_if_missing).lower(),
+    )
+
+
+def change_multiple_column_values_field(
+    board_id: int,
+    item_id: int,
+    column_values: Dict[str, Any],
+    create_labels_if_missing: bool = True,
+) -> str:
+    return """change_multiple_column_values (
+        board_id: %s,
+        item_id: %s,
+        column_values: %s,
+        create_labels_if_missing: %s
+    ) {
+        id
+    }""" % (
+        board_id,
+        item_id,
+        json_stringify(column_values),
+        str(create_labels_if_missing).lower(),
+    )
+
+
+def delete_item_field(item_id: int) -> str:
+    return """delete_item (item_id: %s) {
+        id
+    }""" % item_id
+
+
+def json_stringify(value: Any) -> str:
+    """
+    monday expects JSON arguments (like `column_values`) as a JSON encoded string
+    """
+
+    return json_codec.dumps(json_codec.dumps(value))
+
+
+# Requested along with every query when the complexity budget is tracked (see `ComplexityScheduler`)
+COMPLEXITY_FIELD = "complexity { before after query reset_in_x_seconds }"
+
+_OPERATION_PATTERN = re.compile(r"^\s*(query|mutation)\s*\{")
+
+
+def with_complexity(query: str) -> str:
+    """
+    Add the `complexity` field to the query, so the response reports the query cost and the remaining budget
+    """
+
+    return _OPERATION_PATTERN.sub(lambda match: f"{match.group(0)}\n    {COMPLEXITY_FIELD}", query, count=1)
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+
+from typing import Dict, List, Optional
+
+from . import json_codec
+
+
+class BoardSchemaCache:
+    """
+    Keeps the columns (id, title, type and settings) of monday boards on disk, so declaring an `Item` class
+    doesn't have to request the board columns from monday every time the module is imported.
+
+    Every board is saved in its own JSON file (`board_<board_id>.json`) under `directory`.
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = 24 * 60 * 60):
+        """
+        :param directory:   The directory to save the boards schemas in (created if missing)
+        :param ttl:         The amount of seconds a saved schema is valid for, or None for no expiration
+        """
+
+        self.directory = directory
+        self.ttl = ttl
+
+    def get(self, board_id: int) -> Optional[List[Dict[str, str]]]:
+        """
+        :return: The cached columns of the board, or None if the board isn't cached or has expired
+        """
+
+        try:
+            with open(self._path(board_id), "rb") as file:
+                data = json_codec.loads(file.read())
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - data.get("fetched_at", 0) > self.ttl:
+            return None
+
+        return data.get("columns")
+
+    def set(self, board_id: int, columns: List[Dict[str, str]]):
+        os.makedirs(self.directory, exist_ok=True)
+
+        data = {
+            "board_id": board_id,
+            "fetched_at": time.time(),
+            "columns": [
+                {key: column[key] for key in ("id", "title", "type", "settings_str") if key in column}
+                for column in columns
+            ],
+        }
+
+        # Write to a temporary file and replace, so concurrent readers never see a partial file
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(json_codec.dumps(data))
+
+            os.replace(temporary_path, self._path(board_id))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def invalidate(self, board_id: Optional[int] = None):
+        """
+        Remove the cached schema of a board (or of all of the boards if `board_id` isn't given)
+        """
+
+        if board_id is not None:
+            paths = [self._path(board_id)]
+        elif os.path.isdir(self.directory):
+            paths = [
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.startswith("board_") and name.endswith(".json")
+            ]
+        else:
+            paths = []
+
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _path(self, board_id: int) -> str:
+        return os.path.join(self.directory, f"board_{board_id}.json")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterator, List, Tuple, Type
+
+from .async_item import AsyncItem
+from .exceptions import MondayClientError
+from .item import DEFAULT_MUTATIONS_BATCH_SIZE, Item, Mutation
+
+
+class Session:
+    """
+    A unit of work that keeps track of items, and sends all of their changes in batches on `flush`:
+
+        with Session() as session:
+            for item in session.fetch_items_from_board(MyItem):
+                item.status_example = "Done"
+
+            session.add(MyItem(status_example="Working on it"), group_id="topics")
+
+        # Leaving the block flushes the session (unless an exception was raised),
+        # and raises a `MondayClientError` if some of the items failed
+
+    Items loaded through the session (or registered with `track`) are updated if they have been changed,
+    items added with `add` are created and items passed to `delete` are deleted.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_MUTATIONS_BATCH_SIZE):
+        """
+        :param batch_size: The maximum amount of mutations sent in a single request
+        """
+
+        self.batch_size = batch_size
+
+        # Items aren't hashable, so they are kept by their identity
+        self._tracked: Dict[int, Item] = {}
+        self._new: Dict[int, Tuple[Item, str]] = {}
+        self._deleted: Dict[int, Item] = {}
+
+    def __enter__(self) -> Session:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            return
+
+        failures = self.flush()
+        if failures:
+            # The messages of every failure, the items and their errors are passed along for the caller to handle
+            errors = [
+                f"{type(item).__name__} ({item.item_id or 'new'}): {message}"
+                for item, error in failures
+                for message in error.args[1]
+            ]
+            raise MondayClientError("Got error from monday client", errors, failures)
+
+    def track(self, item: Item) -> Item:
+        """
+        Register an existing item, so it will be updated on `flush` if it has been changed
+        """
+
+        self._validate_item_type(item)
+
+        if not item.item_id:
+            raise AttributeError("Can not track an item that wasn't fetch from the server. Did you mean `add`?")
+
+        self._tracked[id(item)] = item
+        return item
+
+    def add(self, item: Item, group_id: str) -> Item:
+        """
+        Register a new item, so it will be created in the given group on `flush`
+        """
+
+        self._validate_item_type(item)
+
+        if item.item_id:
+            raise AttributeError(f"The item already exists (id = {item.item_id})")
+
+        self._new[id(item)] = (item, group_id)
+        return item
+
+    def delete(self, item: Item):
+        """
+        Mark an item to be deleted on `flush` (a new item that wasn't created yet is just discarded)
+        """
+
+        if self._new.pop(id(item), None) is not None:
+            return
+
+        self._validate_item_type(item)
+
+        if not item.item_id:
+            raise AttributeError("Can not delete an item that wasn't fetch from the server")
+
+        self._tracked.pop(id(item), None)
+        self._deleted[id(item)] = item
+
+    def expunge(self, item: Item):
+        """
+        Stop tracking the item (its pending changes won't be sent)
+        """
+
+        for items in (self._tracked, self._new, self._deleted):
+            items.pop(id(item), None)
+
+    def clear(self):
+        self._tracked.clear()
+        self._new.clear()
+        self._deleted.clear()
+
+    def fetch_items_from_board(self, item_class: Type[Item], **kwargs) -> Iterator[Item]:
+        """
+        Same as `Item::fetch_items_from_board` but the items are tracked by the session
+        """
+
+        for item in item_class.fetch_items_from_board(**kwargs):
+            yield self.track(item)
+
+    def fetch_items_by_column_value(self, item_class: Type[Item], **kwargs) -> Iterator[Item]:
+        """
+        Same as `Item::fetch_items_by_column_value` but the items are tracked by the session
+        """
+
+        for item in item_class.fetch_items_by_column_value(**kwargs):
+            yield self.track(item)
+
+    @staticmethod
+    def _validate_item_type(item: Item):
+        # The mutations of async items are coroutines, they can't be sent by `flush`
+        if isinstance(item, AsyncItem):
+            raise TypeError(f"Async items can't be used in a session ({type(item).__name__})")
+
+    @property
+    def dirty(self) -> List[Item]:
+        return [item for item in self._tracked.values() if item.item_id and item.has_been_changed]
+
+    def flush(self) -> List[Tuple[Item, MondayClientError]]:
+        """
+        Create the new items, update the changed items and delete the deleted items, packing all of
+        the mutations of items that share a monday client into as few requests as possible.
+
+        :return: The items that failed along with their errors. Failed items stay pending for the next flush.
+        """
+
+        mutations = [item._create_mutation(group_id) for item, group_id in self._new.values()]
+        mutations.extend(mutation for mutation in (item._update_mutation() for item in self.dirty) if mutation)
+        mutations.extend(item._delete_mutation() for item in self._deleted.values())
+
+        # Mutations can be sent together only if they are sent with the same API token
+        mutations_by_client: Dict[Hashable, List[Mutation]] = {}
+        for mutation in mutations:
+            mutations_by_client.setdefault(mutation[0]._transport.budget_key, []).append(mutation)
+
+        failures = []
+        for client_mutations in mutations_by_client.values():
+            item_class = type(client_mutations[0][0])
+            failures.extend(item_class._execute_mutations(client_mutations, self.batch_size))
+
+        # Created items are tracked from now on, and deleted items are forgotten
+        for key, (item, _) in list(self._new.items()):
+            if item.item_id:
+                del self._new[key]
+                self._tracked[key] = item
+
+        for key, item in list(self._deleted.items()):
+            if not item.item_id:
+                del self._deleted[key]
+
+        return failures
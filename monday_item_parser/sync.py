@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+import tempfile
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from . import json_codec
+from .queries import ITEM_ID_FIELDS, MAX_ITEMS_PAGE_SIZE, updated_since_query_params
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+@dataclass
+class SyncState:
+    """
+    What an incremental sync of a board has seen so far, saved between the syncs
+    """
+
+    board_id: int
+    # The latest `updated_at` of the synced items (ISO 8601)
+    watermark: Optional[str] = None
+    # The items updated exactly at the watermark, so they aren't reported again
+    watermark_item_ids: Set[int] = field(default_factory=set)
+    # All of the items of the board, so deleted items can be found
+    item_ids: Set[int] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, path: str, board_id: int) -> SyncState:
+        """
+        :return: The state saved in the path, or an empty state (a full sync) if there is none for the board
+        """
+
+        try:
+            with open(path, "rb") as file:
+                return cls.from_json(file.read(), board_id)
+        except OSError:
+            return cls(board_id)
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes], board_id: int) -> SyncState:
+        """
+        :return: The state encoded by `to_json`, or an empty state if it's invalid or belongs to another board
+        """
+
+        try:
+            data = json_codec.loads(data)
+        except ValueError:
+            return cls(board_id)
+
+        if not isinstance(data, dict) or str(data.get("board_id")) != str(board_id):
+            return cls(board_id)
+
+        return cls(
+            board_id=board_id,
+            watermark=data.get("watermark"),
+            watermark_item_ids=set(data.get("watermark_item_ids", ())),
+            item_ids=set(data.get("item_ids", ())),
+        )
+
+    def to_json(self) -> str:
+        return json_codec.dumps(
+            {
+                "board_id": self.board_id,
+                "watermark": self.watermark,
+                "watermark_item_ids": sorted(self.watermark_item_ids),
+                "item_ids": sorted(self.item_ids),
+            }
+        )
+
+    def save(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file and replace, so a failed sync never leaves a partial state
+        fd, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(self.to_json())
+
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+
+@dataclass
+class SyncResult:
+    created: List[Item] = field(default_factory=list)
+    updated: List[Item] = field(default_factory=list)
+    # Only the ids are known for the deleted items
+    deleted: Set[int] = field(default_factory=set)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+
+def sync_items(item_class, state_path: str, page_size: int = MAX_ITEMS_PAGE_SIZE) -> SyncResult:
+    """
+    Fetch the items of the board that have changed since the last sync saved in `state_path`
+    (the first sync reports all of the items as created).
+
+    Only the items updated since the watermark are fetched with their columns, the deleted items
+    are found by listing the ids of the board (which is much cheaper than listing the items).
+
+    :param item_class:  The `Item` class of the board
+    :param state_path:  The JSON file to keep the sync state in between syncs
+    :param page_size:   The amount of items requested in every page
+    :return:            The created, updated and deleted items
+    """
+
+    state = SyncState.load(state_path, item_class._board_id)
+    created, updated, deleted = fetch_changes(item_class, state, page_size)
+    state.save(state_path)
+
+    return SyncResult(
+        created=[item_class.from_monday_dictionary(data) for data in created],
+        updated=[item_class.from_monday_dictionary(data) for data in updated],
+        deleted=deleted,
+    )
+
+
+def fetch_changes(
+    item_class, state: SyncState, page_size: int = MAX_ITEMS_PAGE_SIZE
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Set[int]]:
+    """
+    Fetch the raw items that have been created and updated since the given state, and the ids of the deleted items.
+    The state is advanced to include the changes (saving it is up to the caller).
+    """
+
+    item_class._ensure_board_schema()
+
+    # The ids are listed before the changes are fetched, so an item created in between is reported as created
+    item_ids = {
+        int(data["id"]) for page in item_class._fetch_item_pages(page_size, ITEM_ID_FIELDS) for data in page
+    }
+
+    last_synced = _parse_updated_at(state.watermark) if state.watermark else None
+
+    # monday filters by the day (in the account timezone), a day earlier covers every timezone
+    query_params = None
+    if last_synced:
+        query_params = updated_since_query_params((last_synced - timedelta(days=1)).date().isoformat())
+
+    created, updated = [], []
+    deleted = state.item_ids - item_ids
+    watermark = last_synced
+    watermark_item_ids = set(state.watermark_item_ids)
+
+    for page in item_class._fetch_item_pages(page_size, item_class._item_fields + "    updated_at\n", query_params):
+        for data in page:
+            item_id = int(data["id"])
+            updated_at = _parse_updated_at(data["updated_at"])
+
+            # Skip the items that were already synced
+            if last_synced and (
+                updated_at < last_synced or (updated_at == last_synced and item_id in state.watermark_item_ids)
+            ):
+                continue
+
+            if item_id in state.item_ids:
+                updated.append(data)
+            else:
+                created.append(data)
+
+            # The item might have been created after the ids were listed
+            item_ids.add(item_id)
+
+            if watermark is None or updated_at > watermark:
+                watermark = updated_at
+                watermark_item_ids = {item_id}
+            elif updated_at == watermark:
+                watermark_item_ids.add(item_id)
+
+    state.watermark = watermark.isoformat() if watermark else None
+    state.watermark_item_ids = watermark_item_ids
+    state.item_ids = item_ids
+
+    return created, updated, deleted
+
+
+def _parse_updated_at(updated_at: str) -> datetime:
+    # monday returns UTC timestamps like "2024-01-01T10:00:00Z"
+    return datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import abc
+import os
+import tempfile
+import threading
+import time
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from monday import MondayClient
+from monday.exceptions import MondayQueryError
+from monday.graphqlclient.client import GraphQLClient
+
+from . import json_codec
+from .exceptions import MondayClientError
+from .json_codec import get_json_codec
+
+
+MONDAY_API_URL = "https://api.monday.com/v2"
+
+
+class Transport(abc.ABC):
+    """
+    Sends the GraphQL queries of an item class to monday (the `transport` parameter of the item class declaration).
+    Implementations provide `execute`, errors returned by monday are left in the response for the caller to raise.
+    """
+
+    @abc.abstractmethod
+    def execute(self, query: str) -> Dict[str, Any]:
+        """
+        :return: The decoded response of the query
+        """
+
+        raise NotImplementedError
+
+    @property
+    def budget_key(self) -> Hashable:
+        """
+        Requests with the same key share a complexity budget (see `ComplexityScheduler`), this should identify the API token
+        """
+
+        return id(self)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _ResponseErrorsGraphQLClient(GraphQLClient):
+    """
+    A `GraphQLClient` that leaves the errors in the response instead of raising the first one,
+    so the data of the mutations that succeeded isn't lost
+    """
+
+    @classmethod
+    def from_client(cls, client: GraphQLClient) -> _ResponseErrorsGraphQLClient:
+        # Keep the endpoint, token, headers and timeout of the client (and its connection pool)
+        response_errors_client = cls.__new__(cls)
+        response_errors_client.__dict__.update(client.__dict__)
+        return response_errors_client
+
+    def _throw_on_error(self, response_data):
+        pass
+
+
+class MondayClientTransport(Transport):
+    """
+    Sends the queries with a `MondayClient`, the transport of item classes declared with a `monday_client`
+    """
+
+    def __init__(self, monday_client: MondayClient):
+        self.monday_client = monday_client
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        client = _ResponseErrorsGraphQLClient.from_client(self.monday_client.custom.client)
+
+        try:
+            return client.execute(query)
+        except MondayQueryError as error:
+            # The errors are raised by the item classes (as `MondayClientError`)
+            return {"errors": error.original_errors or [{"message": str(error)}]}
+
+    @property
+    def budget_key(self) -> Hashable:
+        return getattr(self.monday_client.custom, "_token", None) or id(self.monday_client)
+
+
+class HTTPTransport(Transport):
+    """
+    Sends the queries over a pool of keep-alive connections (a `requests.Session`), with compressed responses:
+
+        transport = HTTPTransport("MONDAY_API_KEY_HERE", pool_size=20, timeout=(5, 60))
+
+        class MyItem(Item, transport=transport, board_id=board_id):
+            ...
+
+    The requests and responses are encoded with the JSON codec of the library (see `set_json_codec`).
+    A transport can be shared by many item classes and threads.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        endpoint: str = MONDAY_API_URL,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = 10,
+        timeout: Union[float, Tuple[float, float]] = (10, 60),
+        max_retries: int = 0,
+    ):
+        """
+        :param token:       The monday API token
+        :param endpoint:    The GraphQL endpoint (can be replaced with a local endpoint for testing)
+        :param headers:     Extra headers to send with every request (for example `API-Version`)
+        :param pool_size:   The maximum amount of connections kept open, and of concurrent requests
+        :param timeout:     The timeout of a request in seconds, or a (connect, read) pair of timeouts
+        :param max_retries: The amount of times a request is retried after failing to connect
+        """
+
+        self.token = token
+        self.endpoint = endpoint
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._headers = {
+            "Authorization": token,
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            **(headers or {}),
+        }
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        response = self._get_session().post(
+            self.endpoint, data=get_json_codec().dumps({"query": query}).encode(), timeout=self.timeout
+        )
+
+        if response.status_code >= 400:
+            raise MondayClientError("Got error from monday client", [f"HTTP {response.status_code}: {response.text}"])
+
+        # `content` is decompressed by requests according to the `Content-Encoding` of the response
+        return get_json_codec().loads(response.content)
+
+    @property
+    def budget_key(self) -> Hashable:
+        return self.token
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=self.max_retries)
+
+                self._session = requests.Session()
+                self._session.headers.update(self._headers)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+
+            return self._session
+
+
+class RecordingTransport(Transport):
+    """
+    Sends the queries with another transport and records the queries and their responses to a fixture file,
+    to be served later by a `ReplayTransport`:
+
+        with RecordingTransport(HTTPTransport(token), "fixtures/board.json") as transport:
+            class MyItem(Item, transport=transport, board_id=board_id):
+                ...
+
+            items = list(MyItem.fetch_items_from_board())
+
+    The fixture is written when the transport is closed (or by `save`).
+    """
+
+    def __init__(self, transport: Transport, path: str):
+        self.transport = transport
+        self.path = path
+        self.interactions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        response = self.transport.execute(query)
+
+        with self._lock:
+            self.interactions.append({"query": query, "response": response})
+
+        return response
+
+    @property
+    def budget_key(self) -> Hashable:
+        return self.transport.budget_key
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            data = json_codec.dumps({"interactions": self.interactions})
+
+        # Write to a temporary file and replace, so a failed recording never leaves a partial fixture
+        fd, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(data)
+
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def close(self):
+        self.save()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Serves the responses recorded by a `RecordingTransport`, without sending any request:
+
+        transport = ReplayTransport("fixtures/board.json", latency=0.2)
+
+    A query is answered with the responses recorded for it (compared without whitespace), in the order they
+    were recorded, so fetching an item before and after updating it returns both versions.
+    The last response of a query is repeated once its responses run out.
+    """
+
+    def __init__(self, path: str, latency: float = 0):
+        """
+        :param path:    The fixture file written by `RecordingTransport`
+        :param latency: Seconds to wait before every response, to imitate the round trip to monday
+        """
+
+        self.path = path
+        self.latency = latency
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        with open(path, "rb") as file:
+            data = json_codec.loads(file.read())
+
+        for interaction in data["interactions"]:
+            self._responses.setdefault(self._key(interaction["query"]), []).append(interaction["response"])
+
+    def execute(self, query: str) -> Dict[str, Any]:
+        key = self._key(query)
+
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise MondayClientError("Got error from monday client", [f"No recorded response for the query: {key}"])
+
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        # A copy, so changes to a response don't leak into the next time it's served
+        return json_codec.loads(json_codec.dumps(responses[min(index, len(responses) - 1)]))
+
+    def rewind(self):
+        """
+        Serve the recorded responses from the first one again
+        """
+
+        with self._lock:
+            self._served.clear()
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return " ".join(query.split())
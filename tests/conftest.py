@@ -0,0 +1,27 @@
+import functools
+
+import pytest
+
+from . import helpers
+
+
+@pytest.fixture
+def board():
+    """
+    A fake board with three items
+    """
+
+    board = helpers.FakeMondayBoard()
+    for i in range(3):
+        board.add_item(numbers=str(i), text="text")
+
+    return board
+
+
+@pytest.fixture
+def declare_item(board):
+    """
+    Declares the `ItemExample` class of the board fixture, with the given class keyword arguments
+    """
+
+    return functools.partial(helpers.declare_item, board)
@@ -1,13 +1,20 @@
+import contextlib
+import json
 import os
+import re
+import threading
 import time
 
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional
 from monday import MondayClient
-from monday_item_parser import MondayClientError
+from monday_item_parser import *
 
 client = MondayClient(os.environ.get("MONDAY_API_KEY"))
 
-testing_board_id = int(os.environ.get("MONDAY_TESTING_BOARD_ID"))
+# The offline tests don't need a testing board
+testing_board_id = int(os.environ.get("MONDAY_TESTING_BOARD_ID", 0))
 
 
 def is_budget_exhausted_in_exception(exc: MondayClientError) -> Optional[int]:
@@ -28,3 +35,311 @@ def retry_in_case_of_budget_exhausted(func):
         if time_to_wait is not None:
             time.sleep(time_to_wait)
             return retry_in_case_of_budget_exhausted(func)
+
+
+STATUS_LABELS = {"0": "Working on it", "1": "Done", "2": "Stuck"}
+
+COLUMNS = [
+    {"id": "status", "title": "Status Example", "type": "color", "settings_str": json.dumps({"labels": STATUS_LABELS})},
+    {"id": "numbers", "title": "Numbers Example", "type": "numeric", "settings_str": "{}"},
+    {"id": "text", "title": "Text Example", "type": "text", "settings_str": "{}"},
+    {"id": "people", "title": "People Example", "type": "multiple-person", "settings_str": "{}"},
+    {"id": "tags", "title": "Tags Example", "type": "tag", "settings_str": "{}"},
+    {"id": "dropdown", "title": "Dropdown Example", "type": "dropdown", "settings_str": "{}"},
+    {"id": "date", "title": "Date Example", "type": "date", "settings_str": "{}"},
+]
+
+_MUTATION_PATTERN = re.compile(r"(\w+): (create_item|change_multiple_column_values|delete_item) \((.*?)\) \{", re.DOTALL)
+_COLUMN_VALUES_PATTERN = re.compile(r'columns: \[\{column_id: ("[^"]*"), column_values: \[("(?:[^"\\]|\\.)*")\]\}\]')
+_RULE_PATTERN = re.compile(
+    r'\{column_id: ("[^"]*")(?:, compare_attribute: "[^"]*")?(?:, compare_value: (\[.*?\]))?, operator: (\w+)\}'
+)
+
+
+class FakeMondayBoard(Transport):
+    """
+    A minimal in-memory monday board that answers the queries of the item classes
+    (as a `Transport`, or over HTTP with `serve_board`)
+    """
+
+    def __init__(self, board_id: int = 1, columns=COLUMNS):
+        self.board_id = board_id
+        self.columns = list(columns)
+        self.queries = []
+        self.items = {}
+        self.next_id = 1
+        self.cursors = {}
+        # The time set as the `updated_at` of the created and updated items
+        self.now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        # Mutations of these items fail (the rest of the mutations in the request succeed)
+        self.failing_item_ids = set()
+        # The (headers, client address) of the HTTP requests (see `serve_board`)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def add_item(self, name: str = "Item", group_id: str = "topics", **column_values) -> int:
+        """
+        :param column_values: The values of the columns by their ids, as monday returns them (before JSON encoding)
+        """
+
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = {
+            "name": name,
+            "group": {"id": group_id, "title": group_id.title()},
+            "column_values": {column_id: json.dumps(value) for column_id, value in column_values.items()},
+            "updated_at": self._timestamp(),
+        }
+        return item_id
+
+    def update_item(self, item_id: int, **column_values):
+        self.items[item_id]["column_values"].update(
+            {column_id: json.dumps(value) for column_id, value in column_values.items()}
+        )
+        self.items[item_id]["updated_at"] = self._timestamp()
+
+    def tick(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+    def column_value(self, item_id: int, column_id: str):
+        value = self.items[item_id]["column_values"].get(column_id)
+        return json.loads(value) if value else None
+
+    def execute(self, query: str):
+        with self._lock:
+            self.queries.append(query)
+            return self.handle(query)
+
+    def handle(self, query: str):
+        if query.lstrip().startswith("mutation"):
+            return self._mutations(query)
+
+        limit = re.search(r"limit: (\d+)", query)
+        limit = int(limit.group(1)) if limit else None
+
+        if "next_items_page" in query:
+            cursor = json.loads(re.search(r'cursor: ("[^"]*")', query).group(1))
+            return {"data": {"next_items_page": self._items_page(query, self.cursors.pop(cursor), limit)}}
+        elif "items_page_by_column_values" in query:
+            # monday matches the text of the column
+            column_id, column_value = map(json.loads, _COLUMN_VALUES_PATTERN.search(query).groups())
+            item_ids = [
+                item_id for item_id, item in self.items.items() if self._column_data(item, column_id)["text"] == column_value
+            ]
+            return {"data": {"items_page_by_column_values": self._items_page(query, item_ids, limit)}}
+        elif "items_page" in query:
+            item_ids = [item_id for item_id in self.items if self._matches(item_id, query)]
+            return {"data": {"boards": [{"items_page": self._items_page(query, item_ids, limit)}]}}
+        elif "items (ids" in query:
+            item_ids = json.loads(re.search(r"ids: (\[.*?\])", query).group(1))
+            items = [self._item_data(item_id, query) for item_id in item_ids if item_id in self.items]
+            return {"data": {"items": [{"board": {"id": str(self.board_id)}, **item} for item in items]}}
+        elif "columns {" in query:
+            return {"data": {"boards": [{"columns": self.columns}]}}
+        elif "groups {" in query:
+            return {"data": {"boards": [{"groups": [{"id": "topics", "title": "Topics"}]}]}}
+        elif "items {" in query:
+            return {"data": {"boards": [{"items": [self._item_data(item_id, query) for item_id in self.items]}]}}
+
+        return {"errors": [{"message": "Unknown query"}]}
+
+    def _mutations(self, query: str):
+        data, errors = {}, []
+
+        for alias, mutation, arguments in _MUTATION_PATTERN.findall(query):
+            item_id = re.search(r"item_id: (\d+)", arguments)
+            item_id = int(item_id.group(1)) if item_id else None
+
+            if item_id is not None and (item_id in self.failing_item_ids or item_id not in self.items):
+                data[alias] = None
+                errors.append({"message": f"Item {item_id} not found", "path": [alias]})
+                continue
+
+            column_values = re.search(r'column_values: ("(?:[^"\\]|\\.)*")', arguments)
+            column_values = json.loads(json.loads(column_values.group(1))) if column_values else {}
+
+            if mutation == "create_item":
+                name = json.loads(re.search(r"item_name: (null|\"(?:[^\"\\]|\\.)*\")", arguments).group(1))
+                group_id = json.loads(re.search(r'group_id: ("[^"]*")', arguments).group(1))
+                item_id = self.add_item(name or "New Item", group_id, **column_values)
+            elif mutation == "change_multiple_column_values":
+                if "name" in column_values:
+                    self.items[item_id]["name"] = column_values.pop("name")
+                self.update_item(item_id, **column_values)
+            else:
+                del self.items[item_id]
+
+            data[alias] = {"id": str(item_id)}
+
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    def _items_page(self, query: str, item_ids, limit: Optional[int]):
+        page, rest = item_ids[:limit], item_ids[limit:]
+
+        cursor = None
+        if rest:
+            cursor = f"cursor-{len(self.cursors)}-{rest[0]}"
+            self.cursors[cursor] = rest
+
+        return {"cursor": cursor, "items": [self._item_data(item_id, query) for item_id in page]}
+
+    def _item_data(self, item_id: int, query: str):
+        item = self.items[item_id]
+        data = {"id": str(item_id), "name": item["name"], "group": dict(item["group"])}
+
+        if "updated_at" in query:
+            data["updated_at"] = item["updated_at"]
+
+        # Projected queries request the value and the text columns apart (see `projected_item_fields`)
+        for alias, column_ids in re.findall(r"(?:(\w+): )?column_values \(ids: (\[.*?\])\)", query):
+            key = alias or "column_values"
+            data[key] = [self._column_data(item, column_id) for column_id in json.loads(column_ids)]
+
+        if "column_values {" in query:
+            data["column_values"] = [self._column_data(item, column["id"]) for column in self.columns]
+
+        return data
+
+    def _column_data(self, item, column_id: str):
+        value = item["column_values"].get(column_id)
+        text = None
+
+        if value is not None:
+            decoded = json.loads(value)
+            if column_id == "status":
+                text = STATUS_LABELS.get(str(decoded.get("index")))
+            elif isinstance(decoded, str):
+                text = decoded
+
+        return {"id": column_id, "value": value, "text": text}
+
+    def _matches(self, item_id: int, query: str) -> bool:
+        rules = _RULE_PATTERN.findall(query)
+        if not rules:
+            return True
+
+        matches = (self._matches_rule(item_id, *rule) for rule in rules)
+        return any(matches) if re.search(r"\], operator: or\}", query) else all(matches)
+
+    def _matches_rule(self, item_id: int, column_id: str, compare_value: str, operator: str) -> bool:
+        item = self.items[item_id]
+        column_id = json.loads(column_id)
+        compare_value = json.loads(compare_value) if compare_value else None
+
+        if column_id == "__last_updated__":
+            return item["updated_at"][:10] >= compare_value[1]
+
+        values = _compared_values(column_id, self.column_value(item_id, column_id))
+
+        if operator == "is_empty":
+            return not values
+        elif operator == "is_not_empty":
+            return bool(values)
+        elif operator == "any_of":
+            return any(value in compare_value for value in values)
+        elif operator == "not_any_of":
+            return not any(value in compare_value for value in values)
+        elif operator == "between":
+            return any(compare_value[0] <= value <= compare_value[1] for value in values)
+
+        compare = {
+            "greater_than": lambda value: value > compare_value[0],
+            "greater_than_or_equals": lambda value: value >= compare_value[0],
+            "lower_than": lambda value: value < compare_value[0],
+            "lower_than_or_equal": lambda value: value <= compare_value[0],
+        }[operator]
+        return any(compare(value) for value in values)
+
+    def _timestamp(self) -> str:
+        return self.now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _compared_values(column_id: str, value) -> list:
+    """
+    The values of a column as the rules of `query_params` compare them
+    """
+
+    if value is None:
+        return []
+    elif column_id == "status":
+        return [value["index"]]
+    elif column_id == "numbers":
+        return [float(value)]
+    elif column_id == "people":
+        return [f"{x['kind']}-{x['id']}" for x in value["personsAndTeams"]]
+    elif column_id == "tags":
+        return value["tag_ids"]
+    elif column_id == "date":
+        return [value["date"]]
+
+    return [value]
+
+
+@contextlib.contextmanager
+def serve_board(board: FakeMondayBoard, response_headers=None, encode=None):
+    """
+    Serve the board as a monday GraphQL endpoint on a local port
+
+    :param response_headers:    Extra headers to send with every response
+    :param encode:              Encodes the body of the responses (like `gzip.compress`)
+    :return:                    The URL of the endpoint
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["query"]
+            board.requests.append((dict(self.headers), self.client_address))
+
+            response = json.dumps(board.execute(query)).encode()
+            if encode:
+                response = encode(response)
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            for header, value in (response_headers or {}).items():
+                self.send_header(header, value)
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def endpoint_monday_client(endpoint: str) -> MondayClient:
+    """
+    :return: A `MondayClient` that sends the queries to the endpoint (see `serve_board`)
+    """
+
+    monday_client = MondayClient("token")
+    monday_client.custom.client.endpoint = endpoint
+    return monday_client
+
+
+def declare_item(transport: Optional[Transport], **kwargs):
+    class ItemExample(Item, transport=transport, board_id=1, **kwargs):
+        status_example = StatusField
+        numbers_example = NumberField
+        text_example = TextField
+
+    return ItemExample
+
+
+def declare_async_item(endpoint: str, **kwargs):
+    class AsyncItemExample(AsyncItem, monday_client=AsyncMondayClient("token", endpoint=endpoint), board_id=1, **kwargs):
+        status_example = StatusField
+        numbers_example = NumberField
+        text_example = TextField
+
+    return AsyncItemExample
@@ -0,0 +1,200 @@
+import asyncio
+import json
+
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard, declare_async_item, serve_board
+
+pytest.importorskip("aiohttp")
+
+
+@pytest.fixture
+def fake_board():
+    board = FakeMondayBoard()
+    for _ in range(5):
+        board.add_item(numbers="1", text="text", unused="x")
+
+    with serve_board(board) as endpoint:
+        board.endpoint = endpoint
+        yield board
+
+
+def test_async_item_invalid_declaration(fake_board):
+    with pytest.raises(AttributeError):
+
+        class InvalidItem(AsyncItem, monday_client=AsyncMondayClient("token", endpoint=fake_board.endpoint), board_id=1):
+            numbers_example = TextField
+
+    # The board columns would be loaded with a blocking request inside the event loop
+    with pytest.raises(TypeError):
+        declare_async_item(fake_board.endpoint, lazy_schema=True)
+
+
+def test_async_fetch_items_from_board(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+
+    async def fetch():
+        items = [item async for item in AsyncItemExample.fetch_items_from_board(page_size=2)]
+        await AsyncItemExample._monday_client.close()
+        return items
+
+    items = asyncio.run(fetch())
+
+    assert len(items) == 5
+    assert all(item.numbers_example.value == 1 for item in items)
+    assert len([query for query in fake_board.queries if "items_page" in query]) == 3
+
+
+def test_async_fetch_only_declared_columns(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+
+    async def fetch():
+        items = [item async for item in AsyncItemExample.fetch_items_from_board()]
+        await AsyncItemExample._monday_client.close()
+        return items
+
+    items = asyncio.run(fetch())
+    items_query = next(query for query in fake_board.queries if "items_page" in query)
+
+    assert all(item.text_example.value == "text" for item in items)
+    assert '"unused"' not in items_query
+    assert all(f'"{column_id}"' in items_query for column_id in ("status", "numbers", "text"))
+
+
+def test_async_fetch_items_by_filter(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+
+    async def fetch():
+        items = [
+            item
+            async for item in AsyncItemExample.fetch_items_by_column_value(numbers_example=1, text_example="text")
+        ]
+        await AsyncItemExample._monday_client.close()
+        return items
+
+    asyncio.run(fetch())
+    items_query = next(query for query in fake_board.queries if "items_page" in query)
+
+    assert "items_page_by_column_values" not in items_query
+    assert '{column_id: "numbers", compare_value: [1], operator: any_of}' in items_query
+    assert '{column_id: "text", compare_value: ["text"], operator: any_of}' in items_query
+
+
+def test_async_fetch_items_by_ids(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+    missing_ids = set()
+
+    async def fetch():
+        items = [
+            item
+            async for item in AsyncItemExample.fetch_items_by_ids(
+                [4, 1, 100, 3, 1], chunk_size=2, max_workers=2, missing_ids=missing_ids
+            )
+        ]
+        await AsyncItemExample._monday_client.close()
+        return items
+
+    items = asyncio.run(fetch())
+
+    assert [item.item_id for item in items] == [4, 1, 3]
+    assert missing_ids == {100}
+    assert len([query for query in fake_board.queries if "items (ids" in query]) == 2
+
+
+def test_async_concurrent_create_update_delete(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+
+    async def run():
+        items = [AsyncItemExample(numbers_example=i, text_example="new") for i in range(20)]
+        await asyncio.gather(*(item.create_item("topics") for item in items))
+        assert all(item.item_id for item in items)
+
+        for item in items:
+            item.text_example = "updated"
+
+        await asyncio.gather(*(item.update_item() for item in items))
+        await asyncio.gather(*(item.delete_item() for item in items[:10]))
+        await AsyncItemExample._monday_client.close()
+        return items
+
+    items = asyncio.run(run())
+
+    assert len(fake_board.items) == 5 + 10
+    assert not any(item.has_been_changed for item in items)
+    assert all(json.loads(item["column_values"]["text"]) == "updated" for item in list(fake_board.items.values())[5:])
+
+
+def test_async_bulk_create_update_delete(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+    fake_board.failing_item_ids.add(2)
+
+    async def run():
+        items = [AsyncItemExample(numbers_example=i) for i in range(5)]
+        create_failures = await AsyncItemExample.create_items(items, "topics", batch_size=2)
+
+        existing = [item async for item in AsyncItemExample.fetch_items_by_ids([1, 2])]
+        for item in existing + items:
+            item.text_example = "updated"
+        update_failures = await AsyncItemExample.update_items(existing + items, batch_size=3)
+
+        delete_failures = await AsyncItemExample.delete_items(items[:2])
+        await AsyncItemExample._monday_client.close()
+        return items, existing, create_failures, update_failures, delete_failures
+
+    items, existing, create_failures, update_failures, delete_failures = asyncio.run(run())
+
+    assert not create_failures and not delete_failures
+    assert [item for item, _ in update_failures] == [existing[1]]
+    assert isinstance(update_failures[0][1], MondayClientError)
+    assert existing[1].has_been_changed and not existing[0].has_been_changed
+    assert [item.item_id for item in items[:2]] == [None, None]
+    assert len(fake_board.items) == 5 + 3
+    assert len([query for query in fake_board.queries if query.startswith("mutation")]) == 3 + 3 + 1
+
+
+def test_async_fetch_columns(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+    fake_board.update_item(3, numbers="7")
+
+    async def fetch():
+        columns = await AsyncItemExample.fetch_columns(page_size=2)
+        await AsyncItemExample._monday_client.close()
+        return columns
+
+    columns = asyncio.run(fetch())
+
+    assert columns["item_id"] == [1, 2, 3, 4, 5]
+    assert columns["numbers_example"] == [1, 1, 7, 1, 1]
+    assert columns["text_example"] == ["text"] * 5
+
+
+def test_async_fetch_collection(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+    fake_board.update_item(2, numbers="3")
+    fake_board.update_item(4, numbers="5")
+
+    async def fetch():
+        collection = await AsyncItemExample.fetch_collection(sorted_indexes=["numbers_example"], page_size=2)
+        await AsyncItemExample._monday_client.close()
+        return collection
+
+    collection = asyncio.run(fetch())
+
+    assert len(collection) == 5
+    assert [item.item_id for item in collection.filter(numbers_example__gt=1)] == [2, 4]
+
+
+def test_async_item_sync_items_not_supported(fake_board, tmp_path):
+    AsyncItemExample = declare_async_item(fake_board.endpoint)
+
+    with pytest.raises(TypeError):
+        AsyncItemExample.sync_items(str(tmp_path / "state.json"))
+
+
+def test_async_item_sync_local_not_supported(fake_board):
+    AsyncItemExample = declare_async_item(fake_board.endpoint, local_mirror=LocalMirror())
+
+    with pytest.raises(TypeError):
+        AsyncItemExample.sync_local()
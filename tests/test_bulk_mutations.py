@@ -0,0 +1,58 @@
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import declare_item, endpoint_monday_client, serve_board
+
+
+@pytest.fixture
+def endpoint_board(board):
+    with serve_board(board) as endpoint:
+        board.endpoint = endpoint
+        yield board
+
+
+def mutation_requests(board):
+    return [query for query in board.queries if query.startswith("mutation")]
+
+
+def test_bulk_mutations_partial_failure_with_monday_client(endpoint_board):
+    board = endpoint_board
+    ItemExample = declare_item(None, monday_client=endpoint_monday_client(board.endpoint))
+    board.failing_item_ids.add(2)
+
+    items = list(ItemExample.fetch_items_from_board())
+    for item in items:
+        item.text_example = "updated"
+
+    failures = ItemExample.update_items(items)
+    assert [(item.item_id, error.args[1]) for item, error in failures] == [(2, ["Item 2 not found"])]
+    assert board.column_value(1, "text") == "updated" and board.column_value(3, "text") == "updated"
+
+    # Only the failed item is still changed
+    assert [bool(item.has_been_changed) for item in items] == [False, True, False]
+
+    new_items = [ItemExample(numbers_example=10), ItemExample(numbers_example=20)]
+    assert ItemExample.create_items(new_items, "topics") == []
+    assert [item.item_id for item in new_items] == [4, 5]
+
+    failures = ItemExample.delete_items([items[0], items[1]])
+    assert [item.item_id for item, _ in failures] == [2]
+    assert 1 not in board.items and items[0].item_id is None
+
+
+def test_session_resends_only_failed_items_with_monday_client(endpoint_board):
+    board = endpoint_board
+    ItemExample = declare_item(None, monday_client=endpoint_monday_client(board.endpoint))
+    board.failing_item_ids.add(2)
+
+    session = Session()
+    for item in session.fetch_items_from_board(ItemExample):
+        item.text_example = "updated"
+
+    assert [item.item_id for item, _ in session.flush()] == [2]
+
+    board.failing_item_ids.clear()
+    assert session.flush() == []
+    assert "item_id: 1" not in mutation_requests(board)[-1]
+    assert "item_id: 2" in mutation_requests(board)[-1]
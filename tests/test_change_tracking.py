@@ -0,0 +1,120 @@
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard
+
+
+@pytest.fixture
+def board():
+    board = FakeMondayBoard()
+    board.add_item(
+        numbers="1",
+        text="text",
+        people={"personsAndTeams": [{"id": 1, "kind": "person"}]},
+        tags={"tag_ids": [1]},
+        dropdown={"ids": [1]},
+    )
+    return board
+
+
+@pytest.fixture
+def item_class(board):
+    class TrackedItemExample(Item, transport=board, board_id=1):
+        numbers_example = NumberField
+        text_example = TextField
+        people_example = PeopleField
+        tags_example = TagsField
+        dropdown_example = DropdownField
+
+    return TrackedItemExample
+
+
+def changed_fields(item):
+    return sorted(item._changed_fields)
+
+
+def test_fetched_item_is_unchanged(item_class):
+    item = item_class.get(1)
+
+    # Only mutable values are compared until a field is assigned
+    assert not item.has_been_changed
+    assert [name for name, field in item if field.might_have_changed] == [
+        "people_example",
+        "tags_example",
+        "dropdown_example",
+    ]
+
+
+def test_assigning_the_same_value_is_unchanged(board, item_class):
+    item = item_class.get(1)
+    item.numbers_example = 1
+    item.text_example = "text"
+    item.people_example = [Person(1)]
+
+    assert item.numbers_example._dirty
+    assert changed_fields(item) == []
+
+    # Nothing is sent for an unchanged item
+    item.update_item()
+    assert not [query for query in board.queries if query.startswith("mutation")]
+
+
+@pytest.mark.parametrize(
+    "field_name, value",
+    [("people_example", Team(2)), ("tags_example", 2), ("dropdown_example", 2)],
+)
+def test_in_place_changes_are_detected(item_class, field_name, value):
+    item = item_class.get(1)
+    getattr(item, field_name).value.append(value)
+
+    # The field wasn't assigned, the value is compared to its snapshot
+    assert not getattr(item, field_name)._dirty
+    assert changed_fields(item) == [field_name]
+
+
+def test_fetched_dropdown_is_sent_by_ids(board, item_class):
+    item = item_class.get(1)
+    item.dropdown_example.value.append(2)
+    item.update_item()
+
+    assert board.column_value(1, "dropdown") == {"ids": [1, 2]}
+
+
+def test_save_backup_clears_the_flags(item_class):
+    item = item_class.get(1)
+    item.numbers_example = 2
+    item.tags_example.value.append(2)
+    assert changed_fields(item) == ["numbers_example", "tags_example"]
+
+    item._save_backup()
+    assert not any(field._dirty for _, field in item)
+    assert changed_fields(item) == []
+
+    # The snapshot is a copy, later in-place changes are still detected
+    item.tags_example.value.append(3)
+    assert changed_fields(item) == ["tags_example"]
+
+
+def test_setting_a_field_marks_it_dirty(board, item_class):
+    item = item_class.get(1)
+    field = NumberField(5)
+    field._dirty = False
+
+    item.numbers_example = field
+    assert item.numbers_example is field and field._dirty
+    assert changed_fields(item) == ["numbers_example"]
+
+    item.update_item()
+    assert board.column_value(1, "numbers") == "5"
+    assert changed_fields(item) == []
+
+
+def test_new_item_changes(item_class):
+    assert not item_class().has_been_changed
+    assert changed_fields(item_class(numbers_example=3)) == ["numbers_example"]
+
+    # The default values of the fields aren't shared between items
+    item = item_class()
+    item.tags_example.value.append(1)
+    assert item_class().tags_example.value == []
@@ -0,0 +1,81 @@
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard
+
+
+@pytest.fixture
+def board():
+    board = FakeMondayBoard()
+    board.add_item(status={"index": 1}, numbers="1", people={"personsAndTeams": [{"id": 1, "kind": "person"}]})
+    board.add_item(status={"index": 2}, numbers="5")
+    board.add_item(status={"index": 1}, numbers="10", people={"personsAndTeams": [{"id": 2, "kind": "person"}]})
+    board.add_item(numbers="20", people={"personsAndTeams": [{"id": 1, "kind": "person"}, {"id": 3, "kind": "team"}]})
+    return board
+
+
+def declare_item(transport):
+    class CollectionItemExample(Item, transport=transport, board_id=1):
+        status_example = StatusField
+        numbers_example = NumberField
+        people_example = PeopleField
+
+    return CollectionItemExample
+
+
+def item_ids(items):
+    return [item.item_id for item in items]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_collection_filter(board, indexed):
+    CollectionItemExample = declare_item(board)
+    items = CollectionItemExample.fetch_collection(
+        hash_indexes=["status_example", "people_example"] if indexed else (),
+        sorted_indexes=["numbers_example"] if indexed else (),
+        page_size=2,
+    )
+
+    # Statuses are fetched as label indexes, labels are mapped to their index by the board settings
+    assert item_ids(items.filter(status_example="Done")) == [1, 3]
+    assert item_ids(items.filter(status_example=1)) == [1, 3]
+    assert item_ids(items.filter(status_example__ne="Done")) == [2, 4]
+    assert item_ids(items.filter(status_example__in=["Stuck", "Done"])) == [1, 2, 3]
+
+    assert item_ids(items.filter(people_example=Person(1))) == [1, 4]
+    assert item_ids(items.filter(people_example=[Person(1), Team(3)])) == [4]
+
+    assert item_ids(items.filter(numbers_example=10)) == [3]
+    assert item_ids(items.filter(numbers_example__gt=5)) == [3, 4]
+    assert item_ids(items.filter(numbers_example__gte=5, numbers_example__lt=20)) == [2, 3]
+    assert item_ids(items.filter(numbers_example__between=(2, 10), status_example="Done")) == [3]
+
+    with pytest.raises(TypeError):
+        items.filter(people_example__gt=Person(1))
+
+
+def test_collection_reindexes_changed_items(board):
+    CollectionItemExample = declare_item(board)
+    items = CollectionItemExample.fetch_collection(
+        hash_indexes=["status_example", "people_example"], sorted_indexes=["numbers_example"]
+    )
+    first, second = list(items)[:2]
+
+    # Setting the fields through the items updates the indexes
+    first.numbers_example = 50
+    second.status_example = 1
+    assert item_ids(items.filter(numbers_example__gt=15)) == [1, 4]
+    assert item_ids(items.filter(status_example="Done")) == [1, 2, 3]
+
+    # Changes in place need a reindex
+    second.people_example.value.append(Person(1))
+    assert item_ids(items.filter(people_example=Person(1))) == [1, 4]
+    items.reindex(second)
+    assert item_ids(items.filter(people_example=Person(1))) == [1, 2, 4]
+
+    # Removed items stop updating the collection
+    items.remove(first)
+    first.numbers_example = 1
+    assert item_ids(items.filter(numbers_example__lt=15)) == [2, 3]
+    assert first not in items and len(items) == 3
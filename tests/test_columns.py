@@ -0,0 +1,74 @@
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard
+
+
+def declare_item(transport):
+    class ColumnsItemExample(Item, transport=transport, board_id=1):
+        status_example = StatusField
+        numbers_example = NumberField
+        people_example = PeopleField
+        tags_example = TagsField
+        dropdown_example = DropdownField
+        date_example = DateField
+
+    return ColumnsItemExample
+
+
+def test_decode_columns_matches_items_with_empty_cells():
+    board = FakeMondayBoard()
+    board.add_item(
+        status={"index": 1},
+        numbers="5",
+        people={"personsAndTeams": [{"id": 1, "kind": "person"}, {"id": 2, "kind": "team"}]},
+        tags={"tag_ids": [3]},
+        dropdown={"ids": [4, 5]},
+        date={"date": "2024-01-01", "time": "10:00:00"},
+    )
+    # Every cell is empty, after a row where every cell has a value
+    board.add_item()
+    board.add_item(people={"personsAndTeams": [{"id": 3, "kind": "person"}]}, dropdown=None)
+    board.add_item(numbers="1.5")
+
+    ColumnsItemExample = declare_item(board)
+    items = list(ColumnsItemExample.fetch_items_from_board(page_size=2))
+    columns = ColumnsItemExample.fetch_columns(page_size=2)
+
+    assert columns["item_id"] == [item.item_id for item in items]
+    for field_name in ColumnsItemExample._field_names:
+        assert columns[field_name] == [getattr(item, field_name).value for item in items], field_name
+
+    assert columns["people_example"][1] == []
+    assert columns["dropdown_example"][2] == []
+
+
+def test_decode_columns_doesnt_share_values_between_rows():
+    board = FakeMondayBoard()
+    for _ in range(3):
+        board.add_item(people={"personsAndTeams": [{"id": 1, "kind": "person"}]}, tags={"tag_ids": [1]})
+
+    columns = declare_item(board).fetch_columns()
+    assert columns["tags_example"] == [[1], [1], [1]]
+    assert [[person.id for person in people] for people in columns["people_example"]] == [[1], [1], [1]]
+
+    # The equal values are parsed once, but every row has its own copy
+    columns["tags_example"][0].append(2)
+    columns["people_example"][0][0].id = 2
+    assert columns["tags_example"][1:] == [[1], [1]]
+    assert [people[0].id for people in columns["people_example"]] == [2, 1, 1]
+
+
+def test_decode_columns_of_missing_columns():
+    ColumnsItemExample = declare_item(FakeMondayBoard())
+    group = {"id": "topics", "title": "Topics"}
+    page = [
+        {"id": "1", "name": "First", "group": group, "column_values": [{"id": "numbers", "value": '"5"'}]},
+        {"id": "2", "name": "Second", "group": group, "column_values": []},
+        {"id": "3", "name": "Third", "group": group, "column_values": [{"id": "tags", "value": '{"tag_ids": [1]}'}]},
+    ]
+
+    columns = ColumnsItemExample.decode_columns([page])
+    assert columns["item_name"] == ["First", "Second", "Third"]
+    assert columns["numbers_example"] == [5, None, None]
+    assert columns["tags_example"] == [[], [], [1]]
+    assert columns["tags_example"][0] is not columns["tags_example"][1]
@@ -0,0 +1,124 @@
+import math
+import time
+
+import pytest
+
+from monday_item_parser import *
+from monday_item_parser.queries import items_page_query, items_query
+
+from .helpers import FakeMondayBoard, declare_item, endpoint_monday_client, serve_board
+
+
+class BudgetedBoard(FakeMondayBoard):
+    """
+    A fake board with a complexity budget: every query costs `cost`, and the budget is reset `reset_in` seconds
+    after the first query since the last reset
+    """
+
+    def __init__(self, budget: int, cost: int, reset_in: float):
+        super().__init__()
+        self.budget = budget
+        self.remaining = budget
+        self.cost = cost
+        self.reset_in = reset_in
+        self.reset_at = None
+        self.exhausted = 0
+
+    def execute(self, query):
+        now = time.monotonic()
+        if self.reset_at is None or now >= self.reset_at:
+            self.remaining = self.budget
+            self.reset_at = now + self.reset_in
+
+        if self.cost > self.remaining:
+            self.exhausted += 1
+            seconds = math.ceil(self.reset_at - now)
+            message = f"Complexity budget exhausted, query cost {self.cost} budget remaining {self.remaining} reset in {seconds} seconds"
+            return {"errors": [{"message": message}]}
+
+        response = super().execute(query)
+        before, self.remaining = self.remaining, self.remaining - self.cost
+
+        if "complexity {" in query:
+            response["data"]["complexity"] = {
+                "before": before,
+                "after": self.remaining,
+                "query": self.cost,
+                "reset_in_x_seconds": self.reset_at - now,
+            }
+
+        return response
+
+
+def test_scheduler_shape_keeps_page_sizes():
+    shape = ComplexityScheduler._shape
+
+    assert shape(items_page_query(1, 500, "id")) == shape(items_page_query(2, 500, "id"))
+    assert shape(items_page_query(1, 500, "id")) != shape(items_page_query(1, 10, "id"))
+    assert shape(items_query([1, 2, 3])) == shape(items_query([4, 5, 6]))
+    assert shape(items_query([1, 2])) != shape(items_query([1, 2, 3]))
+
+
+def test_scheduler_waits_for_the_budget():
+    board = BudgetedBoard(budget=10, cost=4, reset_in=0.5)
+    scheduler = ComplexityScheduler()
+    ItemExample = declare_item(board, scheduler=scheduler)
+    board.add_item(numbers="1")
+
+    start = time.monotonic()
+    # The first request of a shape reports its cost, the second one doesn't fit in the rest of the budget
+    for _ in range(3):
+        assert ItemExample.get(1).numbers_example.value == 1
+
+    assert board.exhausted == 0
+    assert time.monotonic() - start >= 0.4
+    assert scheduler.remaining(board.budget_key) == 10 - 2 * 4
+
+
+def test_scheduler_retries_exhausted_budget():
+    board = BudgetedBoard(budget=10, cost=4, reset_in=1)
+    scheduler = ComplexityScheduler()
+    ItemExample = declare_item(board, scheduler=scheduler)
+    board.add_item(numbers="1")
+
+    # Another consumer of the same token used the budget
+    board.remaining = 0
+
+    start = time.monotonic()
+    assert ItemExample.get(1).numbers_example.value == 1
+    assert board.exhausted == 1
+    assert time.monotonic() - start >= 0.5
+
+
+def test_scheduler_retries_exhausted_budget_with_monday_client():
+    board = BudgetedBoard(budget=10, cost=4, reset_in=1)
+    board.add_item(numbers="1")
+    scheduler = ComplexityScheduler()
+
+    with serve_board(board) as endpoint:
+        ItemExample = declare_item(None, monday_client=endpoint_monday_client(endpoint), scheduler=scheduler)
+        board.remaining = 0
+
+        # The exhausted budget error is returned in the response by the default transport, not raised
+        assert ItemExample.get(1).numbers_example.value == 1
+
+    assert board.exhausted == 1
+
+
+def test_scheduler_gives_up_after_max_retries():
+    board = BudgetedBoard(budget=10, cost=20, reset_in=0)
+    ItemExample = declare_item(board, scheduler=ComplexityScheduler(max_retries=2), lazy_schema=True)
+
+    with pytest.raises(MondayClientError):
+        ItemExample.get(1)
+
+    assert board.exhausted == 3
+
+
+def test_async_item_rejects_scheduler():
+    with pytest.raises(TypeError):
+
+        class AsyncItemExample(
+            AsyncItem, monday_client=AsyncMondayClient("token"), board_id=1, scheduler=ComplexityScheduler()
+        ):
+            numbers_example = NumberField
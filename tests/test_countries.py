@@ -0,0 +1,53 @@
+import pytest
+
+from monday_item_parser import *
+from monday_item_parser.fields import helpers
+from monday_item_parser.fields.helpers import get_available_countries, refresh_available_countries
+
+
+@pytest.fixture(autouse=True)
+def bundled_countries(monkeypatch):
+    # Every test starts before the table is loaded, and the table is restored after it
+    monkeypatch.setattr(helpers, "_COUNTRIES", None)
+
+
+def test_available_countries_are_loaded_once(monkeypatch):
+    countries = get_available_countries()
+    assert countries["IL"] == "Israel" and countries["US"] == "United States"
+
+    # The bundled file isn't read again
+    monkeypatch.setattr(helpers, "_COUNTRIES_PATH", "/missing/countries.json")
+    assert get_available_countries() is countries
+
+
+def test_available_countries_are_read_only():
+    with pytest.raises(TypeError):
+        get_available_countries()["XX"] = "Nowhere"
+
+
+def test_refresh_available_countries():
+    loaded = {"IL": "Israel", "XX": "Nowhere"}
+    refresh_available_countries(lambda: loaded)
+
+    # The table is a read-only copy of the loaded one
+    loaded["YY"] = "Somewhere"
+    assert dict(get_available_countries()) == {"IL": "Israel", "XX": "Nowhere"}
+    with pytest.raises(TypeError):
+        get_available_countries()["YY"] = "Somewhere"
+
+    # The fields validate by the refreshed table
+    assert CountryField("XX").value == "XX"
+    with pytest.raises(ValueError):
+        CountryField("US")
+
+
+def test_refresh_available_countries_failure_keeps_the_table():
+    countries = get_available_countries()
+
+    def failing_loader():
+        raise OSError("country.io is down")
+
+    with pytest.raises(OSError):
+        refresh_available_countries(failing_loader)
+
+    assert get_available_countries() is countries
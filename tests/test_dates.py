@@ -0,0 +1,73 @@
+import pytest
+
+from datetime import date, datetime
+from monday_item_parser import *
+from monday_item_parser.fields.helpers import format_date, format_time, parse_date
+
+
+@pytest.mark.parametrize(
+    "date_string, time_string, expected",
+    [
+        ("2023-01-05", None, datetime(2023, 1, 5)),
+        ("2023-01-05", "10:20:30", datetime(2023, 1, 5, 10, 20, 30)),
+        # Not ISO, parsed by strptime
+        ("2023-1-5", None, datetime(2023, 1, 5)),
+        ("2023-1-5", "1:2:3", datetime(2023, 1, 5, 1, 2, 3)),
+        ("2023-01-05", "1:02:03", datetime(2023, 1, 5, 1, 2, 3)),
+    ],
+)
+def test_parse_date(date_string, time_string, expected):
+    assert parse_date(date_string, time_string) == expected
+
+
+@pytest.mark.parametrize(
+    "date_string, time_string",
+    [
+        # Accepted by `fromisoformat` only on newer Python versions
+        ("20230105", None),
+        ("2023-01-05T10:20:30", None),
+        ("2023-01-05", "10:20:30Z"),
+        ("2023-01-05", "10:20:30+02:00"),
+        ("2023-01-05", "10:20:30.5"),
+        # Accepted by `fromisoformat` on every version, but not a monday time
+        ("2023-01-05", "10:20"),
+        ("05/01/2023", None),
+    ],
+)
+def test_parse_date_rejects_other_formats(date_string, time_string):
+    with pytest.raises(ValueError):
+        parse_date(date_string, time_string)
+
+
+def test_format_date_and_time():
+    assert format_date(date(2023, 1, 5)) == "2023-01-05"
+    assert format_date(datetime(999, 12, 31, 23, 59)) == "0999-12-31"
+    assert format_time(datetime(2023, 1, 5, 1, 2, 3)) == "01:02:03"
+
+    # Plain dates are at midnight
+    assert format_time(date(2023, 1, 5)) == "00:00:00"
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"date": "2023-01-05", "time": "10:20:30"}, datetime(2023, 1, 5, 10, 20, 30)),
+        ({"date": "2023-01-05", "time": None}, datetime(2023, 1, 5)),
+        ({"date": "2023-01-05"}, datetime(2023, 1, 5)),
+        # Only the time is set
+        ({"time": "10:20:30"}, datetime(1900, 1, 1, 10, 20, 30)),
+        ({}, None),
+        (None, None),
+    ],
+)
+def test_date_field_from_monday_dict(data, expected):
+    field = DateField()
+    field.from_monday_dict(data)
+    assert field.value == expected
+
+
+def test_date_field_to_monday_dict():
+    assert DateField(datetime(2023, 1, 5, 10, 20, 30)).to_monday_dict() == {"date": "2023-01-05", "time": "10:20:30"}
+    assert DateField(date(2023, 1, 5)).to_monday_dict() == {"date": "2023-01-05", "time": "00:00:00"}
+    assert DateField(date(2023, 1, 5), include_time=False).to_monday_dict() == {"date": "2023-01-05"}
+    assert DateField().to_monday_dict() == {}
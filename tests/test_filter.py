@@ -0,0 +1,69 @@
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard
+
+
+@pytest.fixture
+def board():
+    board = FakeMondayBoard()
+    board.add_item(status={"index": 1}, numbers="1", people={"personsAndTeams": [{"id": 7, "kind": "person"}]})
+    board.add_item(status={"index": 2}, numbers="5", tags={"tag_ids": [3]})
+    board.add_item(
+        status={"index": 1},
+        numbers="10",
+        people={"personsAndTeams": [{"id": 1, "kind": "person"}, {"id": 2, "kind": "team"}]},
+        tags={"tag_ids": [3, 4]},
+    )
+    board.add_item(numbers="20")
+    return board
+
+
+def declare_item(transport):
+    class FilterItemExample(Item, transport=transport, board_id=1):
+        status_example = StatusField
+        numbers_example = NumberField
+        people_example = PeopleField
+        tags_example = TagsField
+
+    return FilterItemExample
+
+
+def item_ids(items):
+    return [item.item_id for item in items]
+
+
+def test_filter_by_status_label(board):
+    FilterItemExample = declare_item(board)
+
+    assert item_ids(FilterItemExample.fetch_items_by_filter(status_example="Done")) == [1, 3]
+    assert '{column_id: "status", compare_value: [1], operator: any_of}' in board.queries[-1]
+
+    assert item_ids(FilterItemExample.fetch_items_by_filter(status_example__in=["Stuck", 1])) == [1, 2, 3]
+    assert item_ids(FilterItemExample.fetch_items_by_filter(status_example=None)) == [4]
+
+    with pytest.raises(ValueError):
+        list(FilterItemExample.fetch_items_by_filter(status_example="No such label"))
+
+
+def test_filter_by_single_and_many_values(board):
+    FilterItemExample = declare_item(board)
+
+    assert item_ids(FilterItemExample.fetch_items_by_filter(people_example=Person(7))) == [1]
+    assert '{column_id: "people", compare_value: ["person-7"], operator: any_of}' in board.queries[-1]
+
+    assert item_ids(FilterItemExample.fetch_items_by_filter(people_example__in=[Person(7), Team(2)])) == [1, 3]
+    assert item_ids(FilterItemExample.fetch_items_by_filter(people_example=[Person(1), Person(7)])) == [1, 3]
+    assert item_ids(FilterItemExample.fetch_items_by_filter(tags_example=4)) == [3]
+    assert item_ids(FilterItemExample.fetch_items_by_filter(tags_example__in=[3])) == [2, 3]
+
+
+def test_filter_by_range(board):
+    FilterItemExample = declare_item(board)
+
+    items = FilterItemExample.fetch_items_by_filter(numbers_example__between=(5, 10), status_example__ne="Stuck")
+    assert item_ids(items) == [3]
+
+    items = FilterItemExample.fetch_items_by_filter(operator="or", numbers_example__gte=20, status_example="Stuck")
+    assert item_ids(items) == [2, 4]
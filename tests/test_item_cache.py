@@ -0,0 +1,116 @@
+import time
+
+import pytest
+
+from monday_item_parser import *
+
+
+class FakeKeyValueStore:
+    """
+    The part of the redis client API that `KeyValueItemCache` uses, the expiration is ignored
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def items_requests(board):
+    return [query for query in board.queries if "items (ids" in query]
+
+
+@pytest.mark.parametrize("cache_class", [LRUItemCache, lambda: KeyValueItemCache(FakeKeyValueStore())])
+def test_item_cache_hits_and_misses(board, cache_class, declare_item):
+    cache = cache_class()
+    ItemExample = declare_item(item_cache=cache)
+
+    assert ItemExample.get(1).numbers_example.value == 0
+    assert ItemExample.get(1).numbers_example.value == 0
+    assert len(items_requests(board)) == 1
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+    # Only the uncached ids are requested
+    missing_ids = set()
+    items = list(ItemExample.fetch_items_by_ids([1, 2, 10], missing_ids=missing_ids))
+    assert [item.item_id for item in items] == [1, 2]
+    assert missing_ids == {10}
+    assert "ids: [2, 10]" in items_requests(board)[-1]
+    assert cache.stats == {"hits": 2, "misses": 3}
+
+    # Missing items aren't cached
+    assert ItemExample.get(10) is None
+    assert len(items_requests(board)) == 3
+
+
+def test_item_cache_ttl_expiry(board, declare_item):
+    cache = LRUItemCache(ttl=0.05)
+    ItemExample = declare_item(item_cache=cache)
+
+    ItemExample.get(1)
+    ItemExample.get(1)
+    assert len(items_requests(board)) == 1
+
+    time.sleep(0.1)
+    ItemExample.get(1)
+    assert len(items_requests(board)) == 2
+    assert cache.stats == {"hits": 1, "misses": 2}
+
+
+def test_item_cache_max_size(board, declare_item):
+    cache = LRUItemCache(max_size=2, ttl=None)
+    ItemExample = declare_item(item_cache=cache)
+
+    list(ItemExample.fetch_items_by_ids([1, 2]))
+    ItemExample.get(1)
+    ItemExample.get(3)
+
+    # The least recently used item is dropped
+    assert len(cache) == 2
+    list(ItemExample.fetch_items_by_ids([1, 2, 3]))
+    assert "ids: [2]" in items_requests(board)[-1]
+
+
+def test_item_cache_invalidation(declare_item):
+    cache = LRUItemCache()
+    ItemExample = declare_item(item_cache=cache)
+
+    item = ItemExample.get(1)
+    item.numbers_example = 10
+    item.update_item()
+    assert ItemExample.get(1).numbers_example.value == 10
+
+    items = list(ItemExample.fetch_items_by_ids([1, 2]))
+    for item in items:
+        item.text_example = "updated"
+    assert ItemExample.update_items(items) == []
+    assert [item.text_example.value for item in ItemExample.fetch_items_by_ids([1, 2])] == ["updated", "updated"]
+
+    ItemExample.get(3).delete_item()
+    assert ItemExample.get(3) is None
+
+    # A stale item cached under the id of a created item is dropped
+    cache.set(ItemExample._item_cache_key(4), cache.get(ItemExample._item_cache_key(1)))
+    ItemExample(numbers_example=40).create_item(group_id="topics")
+    assert ItemExample.get(4).numbers_example.value == 40
+
+
+def test_key_value_item_cache_clear_keeps_other_keys():
+    store = FakeKeyValueStore()
+    store.set("other", "value")
+    cache = KeyValueItemCache(store, prefix="items:")
+
+    cache.set("a", {"id": "1"})
+    assert store.get("items:a") is not None
+    assert cache.get("a") == {"id": "1"}
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert store.values == {"other": "value"}
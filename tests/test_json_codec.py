@@ -0,0 +1,86 @@
+import sys
+
+import pytest
+
+from monday_item_parser import *
+from monday_item_parser import json_codec
+from monday_item_parser.json_codec import OrjsonCodec, get_json_codec
+
+from .helpers import FakeMondayBoard, declare_item
+
+
+class RecordingCodec(JsonCodec):
+    name = "recording"
+
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.dumped += 1
+        return super().dumps(value)
+
+
+@pytest.fixture
+def codec():
+    previous = get_json_codec()
+    codec = RecordingCodec()
+    set_json_codec(codec)
+
+    yield codec
+
+    set_json_codec(previous)
+
+
+def test_default_codec_falls_back_to_the_standard_library(monkeypatch):
+    # A None entry in sys.modules makes the import fail
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert type(json_codec._default_codec()) is JsonCodec
+
+
+def test_json_codec():
+    codec = JsonCodec()
+
+    assert codec.dumps({"a": [1, None]}) == '{"a":[1,null]}'
+    assert codec.loads(b'{"a": [1, null]}') == {"a": [1, None]}
+
+
+def test_orjson_codec():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    value = {"title": "עמודה", "values": [1, 1.5, None, True]}
+
+    assert codec.loads(codec.dumps(value)) == value
+    assert codec.dumps(value) == '{"title":"עמודה","values":[1,1.5,null,true]}'
+    assert isinstance(codec.dumps(value), str)
+
+    # orjson rejects non string keys, the standard library is used for them
+    assert codec.dumps({1: "a"}) == '{"1":"a"}'
+
+
+def test_set_json_codec(codec):
+    board = FakeMondayBoard()
+    board.add_item(numbers="1", status={"index": 1})
+
+    # The status labels and the column values are decoded with the codec
+    ItemExample = declare_item(board)
+    loaded = codec.loaded
+    assert loaded
+    assert ItemExample.get(1).status_example.value == 1
+    assert codec.loaded > loaded
+
+    assert json_codec.dumps([1]) == "[1]" and json_codec.loads("[1]") == [1]
+
+
+def test_schema_cache_uses_the_codec(codec, tmp_path):
+    schema_cache = BoardSchemaCache(str(tmp_path))
+    columns = [{"id": "text", "title": "טקסט", "type": "text", "settings_str": "{}"}]
+
+    schema_cache.set(1, columns)
+    assert codec.dumped == 1
+    assert schema_cache.get(1) == columns
+    assert codec.loaded == 1
@@ -0,0 +1,91 @@
+import pytest
+
+from datetime import datetime
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard
+
+
+def people(*people_and_teams):
+    return {"personsAndTeams": [{"id": x.id, "kind": x.kind} for x in people_and_teams]}
+
+
+@pytest.fixture
+def board():
+    board = FakeMondayBoard()
+    board.add_item(
+        status={"index": 1}, numbers="1", people=people(Person(1), Team(2)), tags={"tag_ids": [1, 2]},
+        date={"date": "2024-01-01"},
+    )
+    board.add_item(status={"index": 2}, numbers="5", people=people(Person(1)), date={"date": "2024-02-01"})
+    board.add_item(status={"index": 1}, numbers="10", people=people(Person(3)), tags={"tag_ids": [2]})
+    board.add_item(numbers="20")
+    return board
+
+
+def declare_item(transport, mirror):
+    class MirrorItemExample(Item, transport=transport, board_id=1, local_mirror=mirror):
+        status_example = StatusField
+        numbers_example = NumberField
+        people_example = PeopleField
+        tags_example = TagsField
+        date_example = DateField
+
+    return MirrorItemExample
+
+
+def item_ids(items):
+    return [item.item_id for item in items]
+
+
+def test_local_mirror_query_by_status(board):
+    MirrorItemExample = declare_item(board, LocalMirror(indexes=["status_example"]))
+    assert MirrorItemExample.sync_local() == (4, 0, 0)
+
+    # Statuses are fetched as label indexes, labels are mapped to their index by the board settings
+    assert item_ids(MirrorItemExample.query_local(status_example="Done")) == [1, 3]
+    assert item_ids(MirrorItemExample.query_local(status_example=1)) == [1, 3]
+    assert item_ids(MirrorItemExample.query_local(status_example__in=["Stuck", "Working on it"])) == [2]
+    assert item_ids(MirrorItemExample.query_local(status_example=None)) == [4]
+
+    with pytest.raises(ValueError):
+        MirrorItemExample.query_local(status_example="No such label")
+
+
+def test_local_mirror_query_by_many_values(board):
+    MirrorItemExample = declare_item(board, LocalMirror())
+    MirrorItemExample.sync_local()
+
+    assert item_ids(MirrorItemExample.query_local(people_example=Person(1))) == [1, 2]
+    assert item_ids(MirrorItemExample.query_local(people_example=[Person(1), Team(2)])) == [1]
+    assert item_ids(MirrorItemExample.query_local(people_example__in=[Team(2), Person(3)])) == [1, 3]
+    assert item_ids(MirrorItemExample.query_local(people_example__ne=Person(1))) == [3, 4]
+    assert item_ids(MirrorItemExample.query_local(people_example=None)) == [4]
+    assert item_ids(MirrorItemExample.query_local(tags_example=2, status_example="Done")) == [1, 3]
+
+    with pytest.raises(TypeError):
+        MirrorItemExample.query_local(people_example__gt=Person(1))
+
+
+def test_local_mirror_query_by_range(board):
+    MirrorItemExample = declare_item(board, LocalMirror(indexes=["numbers_example"]))
+    MirrorItemExample.sync_local()
+
+    assert item_ids(MirrorItemExample.query_local(numbers_example__between=(5, 10))) == [2, 3]
+    assert item_ids(MirrorItemExample.query_local(numbers_example__gt=5, numbers_example__lte=20)) == [3, 4]
+    assert item_ids(MirrorItemExample.query_local(date_example__gte=datetime(2024, 1, 15))) == [2]
+
+
+def test_local_mirror_sync_changes(board):
+    MirrorItemExample = declare_item(board, LocalMirror())
+    MirrorItemExample.sync_local()
+
+    board.tick(hours=1)
+    board.update_item(2, status={"index": 1}, people=people(Team(2)))
+    del board.items[3]
+    board.add_item(status={"index": 1}, numbers="30")
+
+    assert MirrorItemExample.sync_local() == (1, 1, 1)
+    assert item_ids(MirrorItemExample.query_local(status_example="Done")) == [1, 2, 5]
+    assert item_ids(MirrorItemExample.query_local(people_example=Team(2))) == [1, 2]
+    assert MirrorItemExample.sync_local() == (0, 0, 0)
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from monday_item_parser.helpers import prefetch_iterator
+
+from .helpers import FakeMondayBoard, declare_item
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "monday-item-parser-prefetch"]
+
+
+def test_prefetch_iterator_keeps_order():
+    assert list(prefetch_iterator(range(100), 2)) == list(range(100))
+    assert list(prefetch_iterator([], 2)) == []
+
+
+def test_prefetch_iterator_reraises_worker_exception():
+    def values():
+        yield 1
+        yield 2
+        raise ValueError("page failed")
+
+    iterator = prefetch_iterator(values(), 1)
+    assert next(iterator) == 1 and next(iterator) == 2
+
+    with pytest.raises(ValueError, match="page failed"):
+        next(iterator)
+
+
+def test_prefetch_iterator_is_bounded():
+    produced = []
+
+    def values():
+        for value in range(100):
+            produced.append(value)
+            yield value
+
+    iterator = prefetch_iterator(values(), 3)
+    assert next(iterator) == 0
+    time.sleep(0.3)
+
+    # The consumed value, a full buffer, and the value waiting for room in the buffer
+    assert len(produced) <= 1 + 3 + 1
+    iterator.close()
+
+
+def test_prefetch_iterator_close_stops_worker():
+    def values():
+        value = 0
+        while True:
+            yield value
+            value += 1
+
+    threads = set(prefetch_threads())
+    iterator = prefetch_iterator(values(), 2)
+    assert [next(iterator) for _ in range(3)] == [0, 1, 2]
+    (worker,) = set(prefetch_threads()) - threads
+
+    iterator.close()
+    worker.join(timeout=2)
+    assert not worker.is_alive()
+
+
+@pytest.fixture
+def board():
+    board = FakeMondayBoard()
+    for i in range(7):
+        board.add_item(numbers=str(i), text="even" if i % 2 == 0 else "odd")
+
+    return board
+
+
+def numbers(items):
+    return [item.numbers_example.value for item in items]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_fetch_items_from_board_pages(board, prefetch):
+    ItemExample = declare_item(board)
+
+    assert numbers(ItemExample.fetch_items_from_board(page_size=2, prefetch=prefetch)) == list(range(7))
+    assert len([query for query in board.queries if "next_items_page" in query]) == 3
+
+
+@pytest.mark.parametrize("page_size, prefetch", [(2, 0), (2, 2), (None, 1)])
+def test_fetch_items_by_column_value_pages(board, page_size, prefetch):
+    ItemExample = declare_item(board)
+
+    items = ItemExample.fetch_items_by_column_value(text_example="even", page_size=page_size, prefetch=prefetch)
+    assert numbers(items) == [0, 2, 4, 6]
+
+    pages_requests = [query for query in board.queries if "items_page_by_column_values" in query]
+    assert len(pages_requests) == 1 and 'column_values: ["even"]' in pages_requests[0]
+
+    # The default page size fits all of the items in the first page
+    next_pages_requests = [query for query in board.queries if "next_items_page" in query]
+    assert len(next_pages_requests) == (1 if page_size == 2 else 0)
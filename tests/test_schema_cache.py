@@ -0,0 +1,110 @@
+import json
+
+from monday_item_parser import *
+
+from .helpers import FakeMondayBoard, declare_item
+
+
+def columns_requests(board):
+    return [query for query in board.queries if "columns {" in query]
+
+
+def test_schema_cache_keeps_status_labels(tmp_path):
+    board = FakeMondayBoard()
+    board.add_item(status={"index": 1})
+    schema_cache = BoardSchemaCache(str(tmp_path))
+
+    declare_item(board, schema_cache=schema_cache)
+    ItemExample = declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 1
+    assert [item.item_id for item in ItemExample.fetch_items_by_filter(status_example="Done")] == [1]
+
+
+def test_schema_cache_without_status_labels_is_a_miss(tmp_path):
+    board = FakeMondayBoard()
+    board.add_item(status={"index": 1})
+    schema_cache = BoardSchemaCache(str(tmp_path))
+
+    # Schemas cached before the status labels were kept
+    schema_cache.set(1, [{key: column[key] for key in ("id", "title", "type")} for column in board.columns])
+    ItemExample = declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 1
+    assert [item.item_id for item in ItemExample.fetch_items_by_filter(status_example="Done")] == [1]
+
+    with open(tmp_path / "board_1.json") as file:
+        assert all("settings_str" in column for column in json.load(file)["columns"])
+
+
+def test_schema_cache_ttl(tmp_path):
+    board = FakeMondayBoard()
+    schema_cache = BoardSchemaCache(str(tmp_path), ttl=60)
+
+    declare_item(board, schema_cache=schema_cache)
+    declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 1
+
+    # Age the cached schema past the ttl
+    path = tmp_path / "board_1.json"
+    data = json.loads(path.read_text())
+    data["fetched_at"] -= 61
+    path.write_text(json.dumps(data))
+
+    assert schema_cache.get(1) is None
+    declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 2
+
+    # Without a ttl the schema never expires
+    data["fetched_at"] = 0
+    path.write_text(json.dumps(data))
+    assert BoardSchemaCache(str(tmp_path), ttl=None).get(1) == data["columns"]
+
+
+def test_schema_cache_type_mismatch_is_fetched_again(tmp_path):
+    board = FakeMondayBoard()
+    schema_cache = BoardSchemaCache(str(tmp_path))
+
+    # The column type changed since the schema was cached
+    schema_cache.set(1, [dict(column, type="text") if column["id"] == "numbers" else column for column in board.columns])
+    declare_item(board, schema_cache=schema_cache)
+
+    assert len(columns_requests(board)) == 1
+    assert {column["id"]: column["type"] for column in schema_cache.get(1)}["numbers"] == "numeric"
+
+
+def test_schema_cache_invalidate(tmp_path):
+    board = FakeMondayBoard()
+    schema_cache = BoardSchemaCache(str(tmp_path))
+    schema_cache.set(1, board.columns)
+    schema_cache.set(2, board.columns)
+
+    schema_cache.invalidate(1)
+    assert schema_cache.get(1) is None and schema_cache.get(2) is not None
+    declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 1
+
+    schema_cache.invalidate()
+    assert schema_cache.get(1) is None and schema_cache.get(2) is None
+    # Invalidating a missing board (or directory) is a no-op
+    schema_cache.invalidate(1)
+    BoardSchemaCache(str(tmp_path / "missing")).invalidate()
+
+
+def test_refresh_board_schema_updates_the_cache(tmp_path):
+    board = FakeMondayBoard()
+    schema_cache = BoardSchemaCache(str(tmp_path))
+    ItemExample = declare_item(board, schema_cache=schema_cache)
+
+    # A status label added on monday is found after a refresh
+    settings = json.loads(board.columns[0]["settings_str"])
+    settings["labels"]["3"] = "Blocked"
+    board.columns[0] = dict(board.columns[0], settings_str=json.dumps(settings))
+    board.add_item(status={"index": 3})
+
+    ItemExample.refresh_board_schema()
+    assert len(columns_requests(board)) == 2
+    assert [item.item_id for item in ItemExample.fetch_items_by_filter(status_example="Blocked")] == [1]
+
+    # Classes declared later load the refreshed schema from the cache
+    OtherItemExample = declare_item(board, schema_cache=schema_cache)
+    assert len(columns_requests(board)) == 2
+    assert OtherItemExample._status_label_index("status_example", "Blocked") == 3
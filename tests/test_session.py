@@ -0,0 +1,92 @@
+import pytest
+
+from monday_item_parser import *
+
+from .helpers import declare_async_item, serve_board
+
+
+def mutation_requests(board):
+    return [query for query in board.queries if query.startswith("mutation")]
+
+
+def test_session_flushes_changes_in_a_single_request(board, declare_item):
+    ItemExample = declare_item()
+
+    with Session() as session:
+        items = list(session.fetch_items_from_board(ItemExample, page_size=10))
+        items[0].text_example = "updated"
+        session.add(ItemExample(numbers_example=10), group_id="topics")
+        session.delete(items[1])
+
+    assert len(mutation_requests(board)) == 1
+    assert board.column_value(1, "text") == "updated"
+    assert 2 not in board.items
+    assert board.column_value(4, "numbers") == "10"
+    assert not items[0].has_been_changed and items[1].item_id is None
+
+
+def test_session_flush_keeps_failed_items_pending(board, declare_item):
+    ItemExample = declare_item()
+    session = Session()
+    items = list(session.fetch_items_from_board(ItemExample, page_size=10))
+
+    board.failing_item_ids.add(1)
+    items[0].text_example = "updated"
+    items[1].text_example = "updated"
+
+    failures = session.flush()
+    assert [item for item, _ in failures] == [items[0]]
+    assert session.dirty == [items[0]]
+
+    board.failing_item_ids.clear()
+    assert session.flush() == []
+    assert session.dirty == []
+
+
+def test_session_exit_raises_failures(board, declare_item):
+    ItemExample = declare_item()
+    board.failing_item_ids.add(2)
+
+    with pytest.raises(MondayClientError) as exc_info:
+        with Session() as session:
+            for item in session.fetch_items_from_board(ItemExample, page_size=10):
+                item.text_example = "updated"
+
+    message, errors, failures = exc_info.value.args
+    assert errors == ["ItemExample (2): Item 2 not found"]
+    assert [item.item_id for item, _ in failures] == [2]
+    assert board.column_value(1, "text") == "updated" and board.column_value(3, "text") == "updated"
+
+
+def test_session_exit_with_exception_doesnt_flush(board, declare_item):
+    ItemExample = declare_item()
+
+    with pytest.raises(ValueError):
+        with Session() as session:
+            for item in session.fetch_items_from_board(ItemExample, page_size=10):
+                item.text_example = "updated"
+            raise ValueError()
+
+    assert not mutation_requests(board)
+
+
+def test_session_delete_validates_item(board, declare_item):
+    ItemExample = declare_item()
+    session = Session()
+
+    with pytest.raises(AttributeError):
+        session.delete(ItemExample(numbers_example=1))
+
+    # A new item of the session is discarded instead
+    item = session.add(ItemExample(numbers_example=1), group_id="topics")
+    session.delete(item)
+    assert session.flush() == []
+    assert not mutation_requests(board)
+
+
+def test_session_rejects_async_items(board):
+    with serve_board(board) as endpoint:
+        AsyncItemExample = declare_async_item(endpoint)
+
+    with pytest.raises(TypeError):
+        Session().add(AsyncItemExample(numbers_example=1), group_id="topics")
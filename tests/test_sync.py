@@ -0,0 +1,100 @@
+import pytest
+
+from monday_item_parser.queries import updated_since_query_params
+from monday_item_parser.sync import SyncState
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "sync" / "state.json")
+
+
+def item_ids(items):
+    return sorted(item.item_id for item in items)
+
+
+def items_page_requests(board):
+    return [query for query in board.queries if "items_page" in query and "updated_at" in query]
+
+
+def test_first_sync_reports_every_item_as_created(board, state_path, declare_item):
+    ItemExample = declare_item()
+
+    result = ItemExample.sync_items(state_path, page_size=2)
+    assert item_ids(result.created) == [1, 2, 3]
+    assert not result.updated and not result.deleted
+    assert [item.numbers_example.value for item in result.created] == [0, 1, 2]
+
+    # A full sync doesn't filter by the update time
+    assert "__last_updated__" not in items_page_requests(board)[0]
+
+    state = SyncState.load(state_path, 1)
+    assert state.watermark == "2024-01-10T12:00:00+00:00"
+    assert state.watermark_item_ids == {1, 2, 3}
+    assert state.item_ids == {1, 2, 3}
+
+    assert not ItemExample.sync_items(state_path).has_changes
+
+
+def test_sync_skips_items_at_the_watermark(board, state_path, declare_item):
+    ItemExample = declare_item()
+    ItemExample.sync_items(state_path)
+
+    # Created at the same second as the watermark, only the new item is reported
+    board.add_item(numbers="3")
+    result = ItemExample.sync_items(state_path)
+    assert item_ids(result.created) == [4]
+    assert not result.updated
+
+    assert SyncState.load(state_path, 1).watermark_item_ids == {1, 2, 3, 4}
+    assert not ItemExample.sync_items(state_path).has_changes
+
+
+def test_sync_backs_off_a_day_from_the_watermark(board, state_path, declare_item):
+    ItemExample = declare_item()
+    ItemExample.sync_items(state_path)
+
+    board.tick(days=3)
+    board.update_item(2, numbers="10")
+    result = ItemExample.sync_items(state_path)
+
+    # monday filters by the day, the items of the day before the watermark are fetched and skipped
+    assert updated_since_query_params("2024-01-09") in items_page_requests(board)[-1]
+    assert item_ids(result.updated) == [2]
+    assert result.updated[0].numbers_example.value == 10
+    assert not result.created
+
+    state = SyncState.load(state_path, 1)
+    assert state.watermark == "2024-01-13T12:00:00+00:00"
+    assert state.watermark_item_ids == {2}
+
+    # The next sync filters from the day before the new watermark
+    assert not ItemExample.sync_items(state_path).has_changes
+    assert updated_since_query_params("2024-01-12") in items_page_requests(board)[-1]
+
+
+def test_sync_detects_deleted_items(board, state_path, declare_item):
+    ItemExample = declare_item()
+    ItemExample.sync_items(state_path)
+
+    del board.items[2]
+    board.tick(minutes=1)
+    board.add_item(numbers="3")
+
+    result = ItemExample.sync_items(state_path)
+    assert result.deleted == {2}
+    assert item_ids(result.created) == [4]
+    assert SyncState.load(state_path, 1).item_ids == {1, 3, 4}
+
+    assert not ItemExample.sync_items(state_path).has_changes
+
+
+def test_sync_state_of_another_board_is_a_full_sync(state_path, declare_item):
+    ItemExample = declare_item()
+    ItemExample.sync_items(state_path)
+
+    assert SyncState.load(state_path, 2) == SyncState(2)
+    with open(state_path, "w") as file:
+        file.write("not json")
+
+    assert item_ids(ItemExample.sync_items(state_path).created) == [1, 2, 3]
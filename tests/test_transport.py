@@ -0,0 +1,127 @@
+import gzip
+import time
+
+import pytest
+
+from monday_item_parser import *
+from monday_item_parser.json_codec import OrjsonCodec, get_json_codec
+
+from .helpers import FakeMondayBoard, declare_item, endpoint_monday_client, serve_board
+
+
+def fake_board(items_count: int) -> FakeMondayBoard:
+    board = FakeMondayBoard()
+    for item_id in range(1, items_count + 1):
+        board.add_item(numbers=str(item_id), text="text")
+
+    return board
+
+
+@pytest.fixture
+def fixture_path(tmp_path):
+    board = fake_board(items_count=3)
+    path = str(tmp_path / "fixtures" / "board.json")
+
+    with RecordingTransport(board, path) as transport:
+        ItemExample = declare_item(transport)
+        items = list(ItemExample.fetch_items_from_board(page_size=10))
+        items[0].text_example = "updated"
+        items[0].update_item()
+        list(ItemExample.fetch_items_from_board(page_size=10))
+
+    return path
+
+
+def test_replay_recorded_session(fixture_path):
+    transport = ReplayTransport(fixture_path)
+    ItemExample = declare_item(transport)
+
+    items = list(ItemExample.fetch_items_from_board(page_size=10))
+    assert [item.numbers_example.value for item in items] == [1, 2, 3]
+    assert items[0].text_example.value == "text"
+
+    items[0].text_example = "updated"
+    items[0].update_item()
+    assert not items[0].has_been_changed
+
+    # The same query is answered with the responses in the order they were recorded
+    items = list(ItemExample.fetch_items_from_board(page_size=10))
+    assert items[0].text_example.value == "updated"
+
+
+def test_replay_unknown_query(fixture_path):
+    ItemExample = declare_item(ReplayTransport(fixture_path))
+
+    with pytest.raises(MondayClientError):
+        list(ItemExample.fetch_items_from_board(page_size=5))
+
+
+def test_replay_latency(fixture_path):
+    ItemExample = declare_item(ReplayTransport(fixture_path, latency=0.05))
+
+    start = time.perf_counter()
+    list(ItemExample.fetch_items_from_board(page_size=10))
+
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_recorded_fixture_is_utf8(tmp_path):
+    pytest.importorskip("orjson")
+    board = FakeMondayBoard()
+    board.add_item(numbers="1", text="טקסט")
+    path = tmp_path / "board.json"
+
+    previous = get_json_codec()
+    # orjson doesn't escape non-ASCII characters
+    set_json_codec(OrjsonCodec())
+    try:
+        with RecordingTransport(board, str(path)) as transport:
+            list(declare_item(transport).fetch_items_from_board())
+    finally:
+        set_json_codec(previous)
+
+    assert "טקסט".encode("utf-8") in path.read_bytes()
+    (item,) = declare_item(ReplayTransport(str(path))).fetch_items_from_board()
+    assert item.text_example.value == "טקסט"
+
+
+def test_http_transport_pooled_compressed_requests():
+    board = fake_board(items_count=2)
+
+    with serve_board(board, response_headers={"Content-Encoding": "gzip"}, encode=gzip.compress) as endpoint:
+        with HTTPTransport("token", endpoint=endpoint) as transport:
+            ItemExample = declare_item(transport)
+            for _ in range(3):
+                items = list(ItemExample.fetch_items_from_board(page_size=10))
+
+    assert [item.numbers_example.value for item in items] == [1, 2]
+    assert all(headers["Authorization"] == "token" for headers, _ in board.requests)
+    assert all("gzip" in headers["Accept-Encoding"] for headers, _ in board.requests)
+    # The schema request and the fetches share a single keep-alive connection
+    assert len(board.requests) == 4 and len({address for _, address in board.requests}) == 1
+
+
+def test_async_item_rejects_transport():
+    with pytest.raises(TypeError):
+
+        class AsyncItemExample(
+            AsyncItem, monday_client=AsyncMondayClient("token"), board_id=1, transport=fake_board(items_count=1)
+        ):
+            numbers_example = NumberField
+
+
+def test_monday_client_transport_returns_errors():
+    board = fake_board(items_count=2)
+
+    with serve_board(board) as endpoint:
+        ItemExample = declare_item(None, monday_client=endpoint_monday_client(endpoint))
+        assert [item.numbers_example.value for item in ItemExample.fetch_items_from_board()] == [1, 2]
+
+        # monday errors are returned in the response, and raised as `MondayClientError` by the item class
+        transport = ItemExample._transport
+        assert transport.execute("query { unknown }") == {"errors": [{"message": "Unknown query"}]}
+        with pytest.raises(MondayClientError) as exc_info:
+            ItemExample._execute_query("query { unknown }")
+
+    assert exc_info.value.args[1] == ["Unknown query"]
+    assert all(headers["Authorization"] == "token" for headers, _ in board.requests)